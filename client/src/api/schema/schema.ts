@@ -9567,7 +9567,7 @@ export interface components {
          * @description Available types of model stores for export.
          * @enum {string}
          */
-        ModelStoreFormat: "tgz" | "tar" | "tar.gz" | "bag.zip" | "bag.tar" | "bag.tgz" | "rocrate.zip" | "bco.json";
+        ModelStoreFormat: "tgz" | "tar" | "tar.gz" | "zip" | "bag.zip" | "bag.tar" | "bag.tgz" | "rocrate.zip" | "bco.json";
         /** NestedElement */
         NestedElement: {
             /** Md5 */
@@ -59,6 +59,7 @@ from galaxy.managers.file_source_instances import (
 from galaxy.managers.folders import FolderManager
 from galaxy.managers.hdas import HDAManager
 from galaxy.managers.histories import HistoryManager
+from galaxy.managers.history_changes import HistoryChangeFeed
 from galaxy.managers.interactivetool import InteractiveToolManager
 from galaxy.managers.jobs import JobSearch
 from galaxy.managers.libraries import LibraryManager
@@ -93,7 +94,11 @@ from galaxy.model.database_utils import (
 )
 from galaxy.model.mapping import GalaxyModelMapping
 from galaxy.model.migrations import verify_databases
-from galaxy.model.orm.engine_factory import build_engine
+from galaxy.model.orm.engine_factory import (
+    build_engine,
+    QueryFingerprintStats,
+)
+from galaxy.model.read_replica import ReadReplica
 from galaxy.model.scoped_session import (
     galaxy_scoped_session,
     install_model_scoped_session,
@@ -461,6 +466,7 @@ class MinimalGalaxyApplication(BasicSharedApp, HaltableContainer, SentryClientMi
             self.config.slow_query_log_threshold,
             self.config.thread_local_log,
             self.config.database_log_query_counts,
+            self.config.repeated_query_log_threshold > 0,
         )
         install_engine = None
         if not combined_install_database:
@@ -491,6 +497,10 @@ class MinimalGalaxyApplication(BasicSharedApp, HaltableContainer, SentryClientMi
             combined_install_database,
             self.config.thread_local_log,
         )
+        if replica_db_url := self.config.database_replica_connection:
+            replica_engine = build_engine(replica_db_url, self.config.database_engine_options)
+            self.model.configure_read_replica(ReadReplica(replica_engine, self.config.database_replica_max_lag))
+            log.info("Routing read-only queries to the database replica")
 
         if combined_install_database:
             log.info("Install database targeting Galaxy's database configuration.")  # TODO this message is ambiguous
@@ -552,6 +562,13 @@ class GalaxyManagerApplication(MinimalManagerApp, MinimalGalaxyApplication, Inst
         self.execution_timer_factory = self._register_singleton(
             ExecutionTimerFactory, ExecutionTimerFactory(self.config)
         )
+        self.query_fingerprint_stats = self._register_singleton(
+            QueryFingerprintStats,
+            QueryFingerprintStats(
+                self.config.repeated_query_log_threshold, self.execution_timer_factory.galaxy_statsd_client
+            ),
+        )
+        self.model.query_fingerprint_stats = self.query_fingerprint_stats
         self.configure_fluent_log()
         self.application_stack = self._register_singleton(ApplicationStack, application_stack_instance(app=self))
         if configure_logging:
@@ -585,6 +602,9 @@ class GalaxyManagerApplication(MinimalManagerApp, MinimalGalaxyApplication, Inst
         self._register_singleton(GalaxySessionManager)
         self.hda_manager = self._register_singleton(HDAManager)
         self.history_manager = self._register_singleton(HistoryManager)
+        self.history_change_feed = self._register_singleton(
+            HistoryChangeFeed, HistoryChangeFeed(self.model.engine, self.config.history_change_feed_poll_interval)
+        )
         self.job_search = self._register_singleton(JobSearch)
         self.dataset_collection_manager = self._register_singleton(DatasetCollectionManager)
         self.workflow_manager = self._register_singleton(WorkflowsManager)
@@ -697,6 +717,7 @@ class UniverseApplication(StructuredApp, GalaxyManagerApplication):
             ("file watcher", self._shutdown_watcher),
             ("database heartbeat", self._shutdown_database_heartbeat),
             ("workflow scheduler", self._shutdown_scheduling_manager),
+            ("history change feed", self._shutdown_history_change_feed),
             ("object store", self._shutdown_object_store),
             ("job manager", self._shutdown_job_manager),
             ("application heartbeat", self._shutdown_heartbeat),
@@ -871,6 +892,9 @@ class UniverseApplication(StructuredApp, GalaxyManagerApplication):
     def _shutdown_scheduling_manager(self):
         self.workflow_scheduling_manager.shutdown()
 
+    def _shutdown_history_change_feed(self):
+        self.history_change_feed.shutdown()
+
     def _shutdown_job_manager(self):
         self.job_manager.shutdown()
 
@@ -892,6 +916,8 @@ class StatsdStructuredExecutionTimer(StructuredExecutionTimer):
 
     def to_str(self, **kwd):
         self.galaxy_statsd_client.timing(self.timer_id, self.elapsed * 1000.0, kwd)
+        for phase, elapsed in self.phases.items():
+            self.galaxy_statsd_client.timing(f"{self.timer_id}.{phase}", elapsed * 1000.0, kwd)
         return super().to_str(**kwd)
 
 
@@ -915,3 +941,11 @@ class ExecutionTimerFactory:
             return StatsdStructuredExecutionTimer(self.galaxy_statsd_client, *args, **kwd)
         else:
             return StructuredExecutionTimer(*args, **kwd)
+
+    def gauge(self, path, value, **tags):
+        if self.galaxy_statsd_client:
+            self.galaxy_statsd_client.gauge(path, value, tags)
+
+    def incr(self, path, n=1, **tags):
+        if self.galaxy_statsd_client:
+            self.galaxy_statsd_client.incr(path, n, tags)
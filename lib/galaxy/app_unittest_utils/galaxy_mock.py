@@ -39,6 +39,7 @@ from galaxy.model.base import (
     transaction,
 )
 from galaxy.model.mapping import GalaxyModelMapping
+from galaxy.model.orm.engine_factory import QueryFingerprintStats
 from galaxy.model.scoped_session import galaxy_scoped_session
 from galaxy.model.unittest_utils import (
     GalaxyDataTestApp,
@@ -152,7 +153,10 @@ class MockApp(di.Container, GalaxyDataTestApp):
         self.application_stack = ApplicationStack()
         self.auth_manager = AuthManager(self.config)
         self.user_manager = UserManager(cast(BasicSharedApp, self))
-        self.execution_timer_factory = Bunch(get_timer=StructuredExecutionTimer)
+        self.execution_timer_factory = Bunch(
+            get_timer=StructuredExecutionTimer, gauge=lambda *args, **kwd: None, incr=lambda *args, **kwd: None
+        )
+        self.query_fingerprint_stats = QueryFingerprintStats()
         self.interactivetool_manager = Bunch(create_interactivetool=lambda *args, **kwargs: None)
         self.is_job_handler = False
         self.biotools_metadata_source = None
@@ -240,6 +244,8 @@ class MockAppConfig(GalaxyDataTestConfig, CommonConfigurationMixin):
 
         self.umask = 0o77
         self.flush_per_n_datasets = 0
+        self.bulk_job_creation_threshold = 0
+        self.job_cache_fingerprints = False
 
         # Compliance related config
         self.redact_email_in_job_name = False
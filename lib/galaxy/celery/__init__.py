@@ -190,7 +190,7 @@ def galaxy_task(*args, action=None, **celery_task_kwd):
                 raise
             finally:
                 # Close and remove any open session this task has created
-                app.model.unset_request_id(scoped_id)
+                app.model.unset_request_id(scoped_id, f"tasks.{func.__name__}")
 
         return wrapper
 
@@ -88,7 +88,10 @@ def recalculate_user_disk_usage(
     if task_user_id:
         user = session.get(User, task_user_id)
         if user:
-            user.calculate_and_set_disk_usage(object_store)
+            if drift := user.reconcile_disk_usage(object_store):
+                log.info(
+                    "Corrected disk usage drift (recorded minus calculated bytes) of user %s: %s", task_user_id, drift
+                )
         else:
             log.error(f"Recalculate user disk usage task failed, user {task_user_id} not found")
     else:
@@ -154,7 +157,7 @@ def change_datatype(
         return
     if datatype == "auto":
         path = dataset_instance.dataset.get_file_name()
-        datatype = sniff.guess_ext(path, datatypes_registry.sniff_order)
+        datatype = sniff.guess_ext(path, datatypes_registry.sniffer_index)
     datatypes_registry.change_datatype(dataset_instance, datatype)
     with transaction(sa_session):
         sa_session.commit()
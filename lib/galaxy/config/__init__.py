@@ -275,7 +275,7 @@ class BaseAppConfiguration(HasDynamicProperties):
         old_dialect, new_dialect = "postgres", "postgresql"
         old_prefixes = (f"{old_dialect}:", f"{old_dialect}+")  # check for postgres://foo and postgres+driver//foo
         offset = len(old_dialect)
-        keys = ("database_connection", "install_database_connection")
+        keys = ("database_connection", "install_database_connection", "database_replica_connection")
         for key in keys:
             if key in kwargs:
                 value = kwargs[key]
@@ -1235,6 +1235,8 @@ class GalaxyAppConfiguration(BaseAppConfiguration, CommonConfigurationMixin):
 
         try_parsing(self.database_connection, "database_connection")
         try_parsing(self.install_database_connection, "install_database_connection")
+        if self.database_replica_connection:
+            try_parsing(self.database_replica_connection, "database_replica_connection")
         try_parsing(self.amqp_internal_connection, "amqp_internal_connection")
 
     def _configure_dataset_storage(self):
@@ -20,6 +20,7 @@ log = logging.getLogger(__name__)
 class SnapHmm(Text):
     file_ext = "snaphmm"
     edam_data = "data_1364"
+    sniff_magic = (b"zoeHMM",)
 
     def set_peek(self, dataset: DatasetProtocol, **kwd) -> None:
         if not dataset.dataset.purged:
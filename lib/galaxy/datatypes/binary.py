@@ -348,13 +348,10 @@ class Bref3(Binary):
     """Bref3 format is a binary format for storing phased, non-missing genotypes for a list of samples."""
 
     file_ext = "bref3"
-
-    def __init__(self, **kwd):
-        super().__init__(**kwd)
-        self._magic = binascii.unhexlify("7a8874f400156272")
+    sniff_magic = (binascii.unhexlify("7a8874f400156272"),)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
-        return file_prefix.startswith_bytes(self._magic)
+        return file_prefix.startswith_bytes(self.sniff_magic)
 
     def set_peek(self, dataset: DatasetProtocol, **kwd) -> None:
         if not dataset.dataset.purged:
@@ -2269,11 +2266,12 @@ class Sff(Binary):
     edam_format = "format_3284"
     edam_data = "data_0924"
     file_ext = "sff"
+    # The first 4 bytes of any sff file is '.sff', and the file is binary. For details
+    # about the format, see http://www.ncbi.nlm.nih.gov/Traces/trace.cgi?cmd=show&f=formats&m=doc&s=format
+    sniff_magic = (b".sff",)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
-        # The first 4 bytes of any sff file is '.sff', and the file is binary. For details
-        # about the format, see http://www.ncbi.nlm.nih.gov/Traces/trace.cgi?cmd=show&f=formats&m=doc&s=format
-        return file_prefix.startswith_bytes(b".sff")
+        return file_prefix.startswith_bytes(self.sniff_magic)
 
     def set_peek(self, dataset: DatasetProtocol, **kwd) -> None:
         if not dataset.dataset.purged:
@@ -3165,6 +3163,7 @@ class RData(CompressedArchive):
 
     VERSION_2_PREFIX = b"RDX2\nX\n"
     VERSION_3_PREFIX = b"RDX3\nX\n"
+    sniff_magic = (VERSION_2_PREFIX, VERSION_3_PREFIX)
     file_ext = "rdata"
 
     MetadataElement(
@@ -3188,7 +3187,7 @@ class RData(CompressedArchive):
             fh.close()
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
-        return file_prefix.startswith_bytes((self.VERSION_2_PREFIX, self.VERSION_3_PREFIX))
+        return file_prefix.startswith_bytes(self.sniff_magic)
 
     def _parse_rdata_header(self, fh: "FileObjType") -> str:
         header = fh.read(7)
@@ -3827,6 +3826,7 @@ class NetCDF(Binary):
     file_ext = "netcdf"
     edam_format = "format_3650"
     edam_data = "data_0943"
+    sniff_magic = (b"CDF",)
 
     def set_peek(self, dataset: DatasetProtocol, **kwd) -> None:
         if not dataset.dataset.purged:
@@ -3843,7 +3843,7 @@ class NetCDF(Binary):
             return f"Binary netCDF file ({nice_size(dataset.get_size())})"
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
-        return file_prefix.startswith_bytes(b"CDF")
+        return file_prefix.startswith_bytes(self.sniff_magic)
 
 
 class Dcd(Binary):
@@ -3966,14 +3966,11 @@ class DAA(Binary):
     """
 
     file_ext = "daa"
-
-    def __init__(self, **kwd):
-        super().__init__(**kwd)
-        self._magic = binascii.unhexlify("6be33e6d47530e3c")
+    # The first 8 bytes of any daa file are 0x3c0e53476d3ee36b
+    sniff_magic = (binascii.unhexlify("6be33e6d47530e3c"),)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
-        # The first 8 bytes of any daa file are 0x3c0e53476d3ee36b
-        return file_prefix.startswith_bytes(self._magic)
+        return file_prefix.startswith_bytes(self.sniff_magic)
 
 
 @build_sniff_from_prefix
@@ -3991,13 +3988,10 @@ class RMA6(Binary):
     """
 
     file_ext = "rma6"
-
-    def __init__(self, **kwd):
-        super().__init__(**kwd)
-        self._magic = binascii.unhexlify("000003f600000006")
+    sniff_magic = (binascii.unhexlify("000003f600000006"),)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
-        return file_prefix.startswith_bytes(self._magic)
+        return file_prefix.startswith_bytes(self.sniff_magic)
 
 
 @build_sniff_from_prefix
@@ -4015,14 +4009,11 @@ class DMND(Binary):
     """
 
     file_ext = "dmnd"
-
-    def __init__(self, **kwd):
-        super().__init__(**kwd)
-        self._magic = binascii.unhexlify("6d18ee15a4f84a02")
+    # The first 8 bytes of any dmnd file are 0x24af8a415ee186d
+    sniff_magic = (binascii.unhexlify("6d18ee15a4f84a02"),)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
-        # The first 8 bytes of any dmnd file are 0x24af8a415ee186d
-        return file_prefix.startswith_bytes(self._magic)
+        return file_prefix.startswith_bytes(self.sniff_magic)
 
 
 class ICM(Binary):
@@ -4070,13 +4061,10 @@ class Parquet(Binary):
     """
 
     file_ext = "parquet"
-
-    def __init__(self, **kwd):
-        super().__init__(**kwd)
-        self._magic = b"PAR1"  # Defined at https://parquet.apache.org/documentation/latest/
+    sniff_magic = (b"PAR1",)  # Defined at https://parquet.apache.org/documentation/latest/
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
-        return file_prefix.startswith_bytes(self._magic)
+        return file_prefix.startswith_bytes(self.sniff_magic)
 
 
 class BafTar(CompressedArchive):
@@ -4240,11 +4228,12 @@ class Pretext(Binary):
     """
 
     file_ext = "pretext"
+    # The first 4 bytes of any pretext file is 'pstm', and the rest of the
+    # file contains binary data.
+    sniff_magic = (b"pstm",)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
-        # The first 4 bytes of any pretext file is 'pstm', and the rest of the
-        # file contains binary data.
-        return file_prefix.startswith_bytes(b"pstm")
+        return file_prefix.startswith_bytes(self.sniff_magic)
 
     def set_peek(self, dataset: DatasetProtocol, **kwd) -> None:
         if not dataset.dataset.purged:
@@ -4584,6 +4573,9 @@ class Numpy(Binary):
     """
 
     file_ext = "npy"
+    # The first 6 bytes of any numpy file is '\x93NUMPY', with following bytes for version
+    # number of file formats, and info about header data. The rest of the file contains binary data.
+    sniff_magic = (b"\x93NUMPY",)
 
     MetadataElement(
         name="version_str",
@@ -4608,9 +4600,7 @@ class Numpy(Binary):
             log.warning("%s, set_meta Exception: %s", self, e)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
-        # The first 6 bytes of any numpy file is '\x93NUMPY', with following bytes for version
-        # number of file formats, and info about header data. The rest of the file contains binary data.
-        return file_prefix.startswith_bytes(b"\x93NUMPY")
+        return file_prefix.startswith_bytes(self.sniff_magic)
 
     def set_peek(self, dataset: DatasetProtocol, **kwd) -> None:
         if not dataset.dataset.purged:
@@ -228,6 +228,9 @@ class Data(metaclass=DataMeta):
     # The dataset contains binary data --> do not space_to_tab or convert newlines, etc.
     # Allow binary file uploads of this type when True.
     is_binary: Union[bool, Literal["maybe"]] = True
+    # Byte strings of which the file must start with one for sniff_prefix() to succeed. Lets the
+    # sniffer index skip this datatype cheaply; only honored if declared on the class defining sniff_prefix().
+    sniff_magic: Optional[Tuple[bytes, ...]] = None
     # Composite datatypes
     composite_type: Optional[str] = None
     composite_files: Dict[str, Any] = {}
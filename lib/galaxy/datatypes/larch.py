@@ -22,6 +22,7 @@ class AthenaProject(Text):
     file_ext = "prj"
     compressed = True
     compressed_format = "gzip"
+    sniff_magic = (b"# Athena project file",)
 
     MetadataElement(
         name="atsym",
@@ -14,6 +14,7 @@ class mStats(Tabular):
     """Class describing the table of cluster statistics output from MetaCyto"""
 
     file_ext = "metacyto_stats.txt"
+    sniff_magic = (b"fcs_files\tcluster_id\tlabel\tfcs_names",)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
         """Quick test on file headings"""
@@ -30,6 +31,7 @@ class mSummary(Tabular):
     """Class describing the summary table output by MetaCyto after FCS preprocessing"""
 
     file_ext = "metacyto_summary.txt"
+    sniff_magic = (b"study_id\tantibodies\tfilenames",)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
         return file_prefix.startswith("study_id\tantibodies\tfilenames")
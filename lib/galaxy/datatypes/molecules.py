@@ -1258,6 +1258,7 @@ class grdtgz(Binary):
 @build_sniff_from_prefix
 class InChI(Tabular):
     file_ext = "inchi"
+    sniff_magic = (b"InChI=",)
     column_names = ["InChI"]
     MetadataElement(name="columns", default=2, desc="Number of columns", readonly=True, visible=False)
     MetadataElement(
@@ -1563,6 +1564,7 @@ class Magres(AtomicStructFile):
 
     file_ext = "magres"
     ase_format = "magres"
+    sniff_magic = (b"#$magres-abinitio-v",)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
         """Determines whether the file is a MAGRES log
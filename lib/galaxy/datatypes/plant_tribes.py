@@ -21,6 +21,7 @@ log = logging.getLogger(__name__)
 @build_sniff_from_prefix
 class Smat(Text):
     file_ext = "smat"
+    sniff_magic = (b"FORMAT",)
 
     def display_peek(self, dataset: DatasetProtocol) -> str:
         try:
@@ -338,6 +338,7 @@ class PEFF(Sequence):
     """
 
     file_ext = "peff"
+    sniff_magic = (b"# PEFF ",)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
         """
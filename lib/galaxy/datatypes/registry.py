@@ -40,6 +40,7 @@ from . import (
     xml,
 )
 from .display_applications.application import DisplayApplication
+from .sniff import SnifferIndex
 
 if TYPE_CHECKING:
     from galaxy.datatypes.data import Data
@@ -76,6 +77,7 @@ class Registry:
         self.available_tracks = []
         self.set_external_metadata_tool = None
         self.sniff_order = []
+        self._sniffer_index: Optional[SnifferIndex] = None
         self.upload_file_formats = []
         # Datatype elements defined in local datatypes_conf.xml that contain display applications.
         self.display_app_containers = []
@@ -919,6 +921,18 @@ class Registry:
             rval["auto"] = rval["txt"]
         return rval
 
+    @property
+    def sniffer_index(self) -> SnifferIndex:
+        """Index of ``sniff_order`` used to narrow down the sniffers to run, rebuilt if ``sniff_order`` changes."""
+        sniffer_index = self._sniffer_index
+        if (
+            sniffer_index is None
+            or len(sniffer_index.sniff_order) != len(self.sniff_order)
+            or any(a is not b for a, b in zip(sniffer_index.sniff_order, self.sniff_order))
+        ):
+            sniffer_index = self._sniffer_index = SnifferIndex(self.sniff_order)
+        return sniffer_index
+
     @property
     def edam_formats(self):
         """ """
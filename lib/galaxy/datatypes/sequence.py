@@ -696,6 +696,7 @@ class BaseFastq(Sequence):
 
     edam_format = "format_1930"
     file_ext = "fastq"
+    sniff_magic = (b"@",)
     bases_regexp = re.compile(r"^[NGTAC 0123\.]*$", re.IGNORECASE)
 
     def set_meta(self, dataset: DatasetProtocol, overwrite: bool = True, **kwd) -> None:
@@ -1411,6 +1412,7 @@ class Genbank(data.Text):
     edam_format = "format_1936"
     edam_data = "data_0849"
     file_ext = "genbank"
+    sniff_magic = (b"LOCUS ",)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
         """
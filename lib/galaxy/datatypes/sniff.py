@@ -17,8 +17,11 @@ from typing import (
     Callable,
     Dict,
     IO,
+    Iterable,
+    List,
     NamedTuple,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -44,6 +47,8 @@ import magic  # isort:skip
 log = logging.getLogger(__name__)
 
 SNIFF_PREFIX_BYTES = int(os.environ.get("GALAXY_SNIFF_PREFIX_BYTES", None) or 2**20)
+# Bytes initially read by FilePrefix, more of the prefix is only read if a sniffer needs it.
+SNIFF_INITIAL_BYTES = min(2**16, SNIFF_PREFIX_BYTES)
 BINARY_MIMETYPES = {"application/pdf", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"}
 
 
@@ -540,6 +545,14 @@ def guess_ext(fname_or_file_prefix: Union[str, "FilePrefix"], sniff_order, is_bi
     'tabular'
     """
     file_prefix = _get_file_prefix(fname_or_file_prefix, auto_decompress=auto_decompress)
+    try:
+        return _guess_ext_from_prefix(file_prefix, sniff_order)
+    finally:
+        if file_prefix is not fname_or_file_prefix:
+            file_prefix.close()
+
+
+def _guess_ext_from_prefix(file_prefix: "FilePrefix", sniff_order) -> str:
     file_ext = run_sniffers_raw(file_prefix, sniff_order)
 
     # Ugly hack for tsv vs tabular sniffing, we want to prefer tabular
@@ -570,52 +583,159 @@ def guess_ext_from_file_name(fname, registry, requested_ext="auto"):
 
 
 class FilePrefix:
-    def __init__(self, filename, auto_decompress=True):
-        non_utf8_error = None
-        compressed_format = None
-        contents_header_bytes = None
-        contents_header = None  # First MAX_BYTES of the file.
-        truncated = False
-        # A future direction to optimize sniffing even more for sniffers at the top of the list
-        # is to lazy load contents_header based on what interface is requested. For instance instead
-        # of returning a StringIO directly in string_io() return an object that reads the contents and
-        # populates contents_header while providing a StringIO-like interface until the file is read
-        # but then would fallback to native string_io()
-        try:
-            compressed_format, f = compression_utils.get_fileobj_raw(filename, "rb")
-            try:
-                contents_header_bytes = f.read(SNIFF_PREFIX_BYTES)
-                truncated = len(contents_header_bytes) == SNIFF_PREFIX_BYTES
-                contents_header = contents_header_bytes.decode("utf-8")
-            finally:
-                f.close()
-        except UnicodeDecodeError as e:
-            non_utf8_error = e
+    """The first ``SNIFF_PREFIX_BYTES`` of a (decompressed) file, as seen by sniffers.
 
-        self.auto_decompress = auto_decompress
-        self.truncated = truncated
+    The prefix is read lazily and only as far as needed: checking a few magic bytes or
+    detecting binary content usually only reads the first ``SNIFF_INITIAL_BYTES``. The
+    file is kept open until the whole prefix has been read, so extending the prefix only
+    reads the additional bytes. The decoded text, binary detection and libmagic results
+    are computed on first use.
+    """
+
+    def __init__(self, filename, auto_decompress=True):
         self.filename = filename
-        self.non_utf8_error = non_utf8_error
-        file_magic = magic.detect_from_content(contents_header_bytes)
-        self.encoding = file_magic.encoding
-        self.mime_type = file_magic.mime_type
-        self.compressed_mime_type = None
-        self.compressed_encoding = None
-        if compressed_format:
-            compressed_magic = magic.detect_from_filename(filename)
-            self.compressed_mime_type = compressed_magic.mime_type
-            self.compressed_encoding = compressed_magic.encoding
-        self.compressed_format = compressed_format
-        self.contents_header = contents_header
-        self.contents_header_bytes = contents_header_bytes
+        self.auto_decompress = auto_decompress
+        self._header_bytes = b""
+        # True once SNIFF_PREFIX_BYTES or the whole file have been read.
+        self._header_complete = False
+        self._header_decoded = False
+        self._contents_header: Optional[str] = None
+        self._non_utf8_error: Optional[UnicodeDecodeError] = None
+        self._file_magic = None
+        self._compressed_magic = None
         self._is_binary = None
         self._file_size = None
+        # Open the file and read its start right away, this detects the compression format
+        # and fails early on unreadable files.
+        self._fileobj: Optional[compression_utils.FileObjTypeBytes]
+        self.compressed_format, self._fileobj = compression_utils.get_fileobj_raw(self.filename, "rb")
+        try:
+            self._read_prefix(SNIFF_INITIAL_BYTES)
+        except Exception:
+            self._close()
+            raise
+
+    def _close(self):
+        if self._fileobj is not None:
+            self._fileobj.close()
+            self._fileobj = None
+
+    def close(self) -> None:
+        """Close the file. Sniffers that need more of the prefix afterwards reopen it."""
+        self._close()
+
+    def __enter__(self) -> "FilePrefix":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _reopen(self) -> compression_utils.FileObjTypeBytes:
+        _, fileobj = compression_utils.get_fileobj_raw(self.filename, "rb")
+        skip = len(self._header_bytes)
+        while skip:
+            chunk = fileobj.read(skip)
+            if not chunk:
+                break
+            skip -= len(chunk)
+        return fileobj
+
+    def _read_prefix(self, size: int) -> bytes:
+        """Return the first ``size`` bytes of the file (fewer if the file is shorter)."""
+        size = min(size, SNIFF_PREFIX_BYTES)
+        if len(self._header_bytes) < size and not self._header_complete:
+            if self._fileobj is None:
+                # closed before the whole prefix was read
+                self._fileobj = self._reopen()
+            # Read ahead generously, so asking for slightly more bytes doesn't need another read.
+            size = min(max(size, 4 * len(self._header_bytes)), SNIFF_PREFIX_BYTES)
+            chunks = [self._header_bytes]
+            read = len(self._header_bytes)
+            while read < size:
+                chunk = self._fileobj.read(size - read)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                read += len(chunk)
+            self._header_bytes = b"".join(chunks)
+            self._header_complete = read < size or size == SNIFF_PREFIX_BYTES
+            if self._header_complete:
+                self._close()
+        return self._header_bytes[:size]
+
+    @property
+    def contents_header_bytes(self) -> bytes:
+        return self._read_prefix(SNIFF_PREFIX_BYTES)
+
+    @property
+    def truncated(self) -> bool:
+        return len(self.contents_header_bytes) == SNIFF_PREFIX_BYTES
+
+    def _decode_header(self):
+        if not self._header_decoded:
+            try:
+                self._contents_header = self.contents_header_bytes.decode("utf-8")
+            except UnicodeDecodeError as e:
+                self._non_utf8_error = e
+            self._header_decoded = True
+
+    @property
+    def contents_header(self) -> Optional[str]:
+        """The prefix decoded as UTF-8, ``None`` if it could not be decoded."""
+        self._decode_header()
+        return self._contents_header
+
+    @property
+    def non_utf8_error(self) -> Optional[UnicodeDecodeError]:
+        self._decode_header()
+        return self._non_utf8_error
+
+    @property
+    def _magic(self):
+        if self._file_magic is None:
+            self._file_magic = magic.detect_from_content(self.contents_header_bytes)
+        return self._file_magic
+
+    @property
+    def encoding(self):
+        return self._magic.encoding
+
+    @property
+    def mime_type(self):
+        return self._magic.mime_type
+
+    @property
+    def _compressed_file_magic(self):
+        if self._compressed_magic is None and self.compressed_format:
+            self._compressed_magic = magic.detect_from_filename(self.filename)
+        return self._compressed_magic
+
+    @property
+    def compressed_mime_type(self):
+        compressed_magic = self._compressed_file_magic
+        return compressed_magic and compressed_magic.mime_type
+
+    @property
+    def compressed_encoding(self):
+        compressed_magic = self._compressed_file_magic
+        return compressed_magic and compressed_magic.encoding
+
+    def _has_binary_chars(self) -> bool:
+        # Same as is_binary(self.contents_header_bytes), but reads the prefix in steps so that
+        # binary files usually don't need to be read in full.
+        size = SNIFF_INITIAL_BYTES
+        while True:
+            if is_binary(self._read_prefix(size)):
+                return True
+            if self._header_complete and size >= len(self._header_bytes):
+                return False
+            size *= 4
 
     @property
     def binary(self):
         if self._is_binary is None:
-            self._is_binary = bool({self.mime_type, self.compressed_mime_type} & BINARY_MIMETYPES) or is_binary(
-                self.contents_header_bytes
+            self._is_binary = self._has_binary_chars() or bool(
+                {self.mime_type, self.compressed_mime_type} & BINARY_MIMETYPES
             )
             if (
                 not self._is_binary
@@ -670,13 +790,17 @@ class FilePrefix:
         Unpack header and get first element
         """
         size = struct.calcsize(pattern)
-        header_bytes = self.contents_header_bytes[:size]
+        header_bytes = self._read_prefix(size)
         if len(header_bytes) < size:
             return None
         return struct.unpack(pattern, header_bytes)[0]
 
     def startswith_bytes(self, test_bytes):
-        return self.contents_header_bytes.startswith(test_bytes)
+        if isinstance(test_bytes, tuple):
+            size = max(len(b) for b in test_bytes)
+        else:
+            size = len(test_bytes)
+        return self._read_prefix(size).startswith(test_bytes)
 
 
 def _get_file_prefix(filename_or_file_prefix: Union[str, FilePrefix], auto_decompress: bool = True) -> FilePrefix:
@@ -685,11 +809,90 @@ def _get_file_prefix(filename_or_file_prefix: Union[str, FilePrefix], auto_decom
     return filename_or_file_prefix
 
 
+def _sniffer_applies(datatype, compressed_format: Optional[str], binary: bool) -> bool:
+    """Check the cheap properties of a file against what the datatype's sniffer expects."""
+    datatype_compressed = getattr(datatype, "compressed", False)
+    if datatype_compressed and not compressed_format and not datatype.file_ext.endswith(".tar"):
+        # we don't auto-detect tar as compressed
+        return False
+    if not datatype_compressed and compressed_format:
+        return False
+    if binary != datatype.is_binary and not datatype.is_binary == "maybe":
+        # Binary detection doesn't match datatype ...
+        compressed_data_for_compressed_text_datatype = (
+            binary and compressed_format and datatype_compressed and not datatype.is_binary
+        )
+        if not compressed_data_for_compressed_text_datatype:
+            # ... and mismatch is not due to compressed text data for a compressed text datatype
+            return False
+    if hasattr(datatype, "sniff_prefix") and compressed_format and getattr(datatype, "compressed_format", None):
+        # Compare the compressed format detected to the expected.
+        if compressed_format != datatype.compressed_format:
+            return False
+    return True
+
+
+def _declared_sniff_magic(datatype) -> Optional[Tuple[bytes, ...]]:
+    # Only trust sniff_magic if it was declared alongside the sniff_prefix it describes,
+    # a subclass overriding sniff_prefix may well accept other files.
+    for klass in type(datatype).__mro__:
+        if "sniff_prefix" in vars(klass):
+            return vars(klass).get("sniff_magic")
+    return None
+
+
+class SnifferIndex:
+    """Index of the datatypes in a sniff order by the cheap file properties their sniffers require.
+
+    Passing a ``SnifferIndex`` instead of a plain sniff order to :func:`guess_ext` or
+    :func:`run_sniffers_raw` only runs the sniffers of datatypes that could possibly match
+    (compressed format, binary vs. text, first byte and declared ``sniff_magic``) and yields
+    exactly the same result, sniffers are still tried in sniff order.
+    """
+
+    def __init__(self, sniff_order: Iterable):
+        self.sniff_order = list(sniff_order)
+        self._sniff_magic = [_declared_sniff_magic(datatype) for datatype in self.sniff_order]
+        self._candidates: Dict[Tuple[Optional[str], bool, bytes], List[Tuple[object, Optional[Tuple[bytes, ...]]]]] = {}
+
+    def __iter__(self):
+        return iter(self.sniff_order)
+
+    def __len__(self):
+        return len(self.sniff_order)
+
+    def candidates(self, file_prefix: "FilePrefix") -> list:
+        key = (file_prefix.compressed_format, file_prefix.binary, file_prefix._read_prefix(1))
+        candidates = self._candidates.get(key)
+        if candidates is None:
+            compressed_format, binary, first_byte = key
+            candidates = [
+                (datatype, sniff_magic)
+                for datatype, sniff_magic in zip(self.sniff_order, self._sniff_magic)
+                if _sniffer_applies(datatype, compressed_format, binary)
+                and (sniff_magic is None or any(magic[:1] == first_byte for magic in sniff_magic))
+            ]
+            self._candidates[key] = candidates
+        return [
+            datatype
+            for datatype, sniff_magic in candidates
+            if sniff_magic is None or file_prefix.startswith_bytes(sniff_magic)
+        ]
+
+
 def run_sniffers_raw(file_prefix: FilePrefix, sniff_order):
     """Run through sniffers specified by sniff_order, return None of None match."""
     fname = file_prefix.filename
     file_ext = None
-    for datatype in sniff_order:
+    if isinstance(sniff_order, SnifferIndex):
+        datatypes = sniff_order.candidates(file_prefix)
+    else:
+        datatypes = [
+            datatype
+            for datatype in sniff_order
+            if _sniffer_applies(datatype, file_prefix.compressed_format, file_prefix.binary)
+        ]
+    for datatype in datatypes:
         """
         Some classes may not have a sniff function, which is ok.  In fact,
         Binary, Data, Tabular and Text are examples of classes that should never
@@ -698,27 +901,8 @@ def run_sniffers_raw(file_prefix: FilePrefix, sniff_order):
         from this function after all other datatypes in sniff_order have not been
         successfully discovered.
         """
-        datatype_compressed = getattr(datatype, "compressed", False)
-        if datatype_compressed and not file_prefix.compressed_format and not datatype.file_ext.endswith(".tar"):
-            # we don't auto-detect tar as compressed
-            continue
-        if not datatype_compressed and file_prefix.compressed_format:
-            continue
-        if file_prefix.binary != datatype.is_binary and not datatype.is_binary == "maybe":
-            # Binary detection doesn't match datatype ...
-            compressed_data_for_compressed_text_datatype = (
-                file_prefix.binary and file_prefix.compressed_format and datatype_compressed and not datatype.is_binary
-            )
-            if not compressed_data_for_compressed_text_datatype:
-                # ... and mismatch is not due to compressed text data for a compressed text datatype
-                continue
         try:
             if hasattr(datatype, "sniff_prefix"):
-                if file_prefix.compressed_format and getattr(datatype, "compressed_format", None):
-                    # Compare the compressed format detected
-                    # to the expected.
-                    if file_prefix.compressed_format != datatype.compressed_format:
-                        continue
                 if datatype.sniff_prefix(file_prefix):
                     file_ext = datatype.file_ext
                     break
@@ -743,20 +927,20 @@ def build_sniff_from_prefix(klass):
     # Build and attach a sniff function to this class (klass) from the sniff_prefix function
     # expected to be defined for the class.
     def auto_sniff(self, filename):
-        file_prefix = FilePrefix(filename)
-        datatype_compressed = getattr(self, "compressed", False)
-        if file_prefix.compressed_format and not datatype_compressed:
-            return False
-        if datatype_compressed:
-            if not file_prefix.compressed_format:
-                # This not a compressed file we are looking but the type expects it to be
-                # must return False.
+        with FilePrefix(filename) as file_prefix:
+            datatype_compressed = getattr(self, "compressed", False)
+            if file_prefix.compressed_format and not datatype_compressed:
                 return False
+            if datatype_compressed:
+                if not file_prefix.compressed_format:
+                    # This not a compressed file we are looking but the type expects it to be
+                    # must return False.
+                    return False
 
-        if hasattr(self, "compressed_format"):
-            if self.compressed_format != file_prefix.compressed_format:
-                return False
-        return self.sniff_prefix(file_prefix)
+            if hasattr(self, "compressed_format"):
+                if self.compressed_format != file_prefix.compressed_format:
+                    return False
+            return self.sniff_prefix(file_prefix)
 
     klass.sniff = auto_sniff
     return klass
@@ -823,6 +1007,8 @@ def handle_compressed_file(
         else:
             datatype = datatypes_registry.get_datatype_by_extension(ext)
             keep_compressed = getattr(datatype, "compressed", False)
+    # done sniffing the compressed file, don't keep it open while decompressing
+    file_prefix.close()
     # don't waste time decompressing if we sniff invalid contents
     if is_compressed and is_valid and file_prefix.auto_decompress and not keep_compressed:
         assert compressed_type  # Tell type checker is_compressed will only be true if compressed_type is also set.
@@ -853,8 +1039,8 @@ def handle_compressed_file(
 
 def handle_uploaded_dataset_file(filename, *args, **kwds) -> str:
     """Legacy wrapper about handle_uploaded_dataset_file_internal for tools using it."""
-    file_prefix = FilePrefix(filename)
-    return handle_uploaded_dataset_file_internal(file_prefix, *args, **kwds)[0]
+    with FilePrefix(filename) as file_prefix:
+        return handle_uploaded_dataset_file_internal(file_prefix, *args, **kwds)[0]
 
 
 class HandleUploadedDatasetFileInternalResponse(NamedTuple):
@@ -912,7 +1098,7 @@ def handle_uploaded_dataset_file_internal(
             # TODO: skip this if we haven't actually converted the dataset
             guessed_ext = guess_ext(
                 converted_path,
-                sniff_order=datatypes_registry.sniff_order,
+                sniff_order=datatypes_registry.sniffer_index,
                 auto_decompress=file_prefix.auto_decompress,
             )
 
@@ -928,7 +1114,7 @@ def handle_uploaded_dataset_file_internal(
                 assert _converted_path
                 converted_path = _converted_path
             if ext in AUTO_DETECT_EXTENSIONS:
-                ext = guess_ext(converted_path, sniff_order=datatypes_registry.sniff_order)
+                ext = guess_ext(converted_path, sniff_order=datatypes_registry.sniffer_index)
         else:
             ext = guessed_ext
 
@@ -11,10 +11,13 @@ import re
 import shutil
 import subprocess
 import tempfile
+from itertools import zip_longest
 from json import dumps
 from typing import (
     cast,
     Dict,
+    IO,
+    Iterator,
     List,
     Optional,
     Union,
@@ -79,6 +82,26 @@ from . import dataproviders
 log = logging.getLogger(__name__)
 
 MAX_DATA_LINES = 100000
+SET_META_READ_SIZE = 2**20
+
+
+def _iter_line_batches(fh: IO[str], read_size: int = SET_META_READ_SIZE) -> Iterator[List[str]]:
+    """
+    Read a text file handle in large chunks and yield its lines in batches,
+    without line terminators. This is equivalent to, but much faster than,
+    calling ``readline()`` on the handle until it is exhausted.
+    """
+    remainder = ""
+    while True:
+        chunk = fh.read(read_size)
+        if not chunk:
+            if remainder:
+                yield [remainder]
+            return
+        lines = (remainder + chunk).split("\n")
+        remainder = lines.pop()
+        if lines:
+            yield lines
 
 
 @dataproviders.decorators.has_dataproviders
@@ -505,6 +528,29 @@ class Tabular(TabularData):
                     return column_type
             return None
 
+        def guess_column_types(rows):
+            # Merge the column types of a batch of rows into column_types. Only the highest ranked
+            # type of a column matters, so every distinct value of a column is classified once and
+            # columns that are already 'str' are not looked at anymore.
+            width = max(len(fields) for fields in rows)
+            if width > len(column_types):
+                # found previously unknown columns, we append None
+                column_types.extend([None] * (width - len(column_types)))
+            for field_count, values in enumerate(zip_longest(*rows)):
+                column_type = column_types[field_count]
+                if column_type == default_column_type:
+                    continue
+                for value in set(values):
+                    if value is None:
+                        # shorter row
+                        continue
+                    new_column_type = guess_column_type(value)
+                    if type_overrules_type(new_column_type, column_type):
+                        column_type = new_column_type
+                        if column_type == default_column_type:
+                            break
+                column_types[field_count] = column_type
+
         data_lines = 0
         comment_lines = 0
         column_names = None
@@ -514,49 +560,72 @@ class Tabular(TabularData):
             # NOTE: if skip > num_check_lines, we won't detect any metadata, and will use default
             with compression_utils.get_fileobj(dataset.get_file_name()) as dataset_fh:
                 i = 0
-                for line in iter(dataset_fh.readline, ""):
-                    line = line.rstrip("\r\n")
-                    if i == 0:
-                        column_names = self.get_column_names(first_line=line)
-                    if i < skip or not line or line.startswith("#"):
-                        # We'll call blank lines comments
-                        comment_lines += 1
-                    else:
-                        data_lines += 1
-                        if max_guess_type_data_lines is None or data_lines <= max_guess_type_data_lines:
-                            fields = line.split("\t")
-                            for field_count, field in enumerate(fields):
-                                if field_count >= len(
-                                    column_types
-                                ):  # found a previously unknown column, we append None
-                                    column_types.append(None)
-                                column_type = guess_column_type(field)
-                                if type_overrules_type(column_type, column_types[field_count]):
-                                    column_types[field_count] = column_type
-                        if i == 0 and requested_skip is None:
-                            # This is our first line, people seem to like to upload files that have a header line, but do not
-                            # start with '#' (i.e. all column types would then most likely be detected as str).  We will assume
-                            # that the first line is always a header (this was previous behavior - it was always skipped).  When
-                            # the requested skip is None, we only use the data from the first line if we have no other data for
-                            # a column.  This is far from perfect, as
-                            # 1,2,3	1.1	2.2	qwerty
-                            # 0	0		1,2,3
-                            # will be detected as
-                            # "column_types": ["int", "int", "float", "list"]
-                            # instead of
-                            # "column_types": ["list", "float", "float", "str"]  *** would seem to be the 'Truth' by manual
-                            # observation that the first line should be included as data.  The old method would have detected as
-                            # "column_types": ["int", "int", "str", "list"]
-                            first_line_column_types = column_types
-                            column_types = [None for col in first_line_column_types]
-                    if max_data_lines is not None and data_lines >= max_data_lines:
-                        if dataset_fh.tell() != dataset.get_size():
+                done = False
+                batches = _iter_line_batches(dataset_fh, SET_META_READ_SIZE)
+                for lines in batches:
+                    j = 0
+                    # The first line and skipped lines are handled one by one
+                    while j < len(lines) and (i == 0 or i < skip):
+                        line = lines[j]
+                        if i == 0:
+                            column_names = self.get_column_names(first_line=line)
+                        if i < skip or not line or line.startswith("#"):
+                            # We'll call blank lines comments
+                            comment_lines += 1
+                        else:
+                            data_lines += 1
+                            if max_guess_type_data_lines is None or data_lines <= max_guess_type_data_lines:
+                                guess_column_types([line.split("\t")])
+                            if i == 0 and requested_skip is None:
+                                # This is our first line, people seem to like to upload files that have a header line, but do not
+                                # start with '#' (i.e. all column types would then most likely be detected as str).  We will assume
+                                # that the first line is always a header (this was previous behavior - it was always skipped).  When
+                                # the requested skip is None, we only use the data from the first line if we have no other data for
+                                # a column.  This is far from perfect, as
+                                # 1,2,3	1.1	2.2	qwerty
+                                # 0	0		1,2,3
+                                # will be detected as
+                                # "column_types": ["int", "int", "float", "list"]
+                                # instead of
+                                # "column_types": ["list", "float", "float", "str"]  *** would seem to be the 'Truth' by manual
+                                # observation that the first line should be included as data.  The old method would have detected as
+                                # "column_types": ["int", "int", "str", "list"]
+                                first_line_column_types = column_types
+                                column_types = [None for col in first_line_column_types]
+                        i += 1
+                        j += 1
+                        if max_data_lines is not None and data_lines >= max_data_lines:
+                            done = True
+                            break
+                    if not done and j < len(lines):
+                        # The remaining lines of the batch are processed at once
+                        batch = lines[j:] if j else lines
+                        data_line_indexes = [k for k, line in enumerate(batch) if line and line[0] != "#"]
+                        if max_data_lines is not None and data_lines + len(data_line_indexes) >= max_data_lines:
+                            # stop right after the last data line we are allowed to process
+                            stop = data_line_indexes[max_data_lines - data_lines - 1] + 1
+                            data_line_indexes = data_line_indexes[: max_data_lines - data_lines]
+                            j += stop
+                            done = True
+                        else:
+                            stop = len(batch)
+                            j = len(lines)
+                        guess_count = len(data_line_indexes)
+                        if max_guess_type_data_lines is not None:
+                            guess_count = min(guess_count, max(max_guess_type_data_lines - data_lines, 0))
+                        if guess_count:
+                            guess_column_types([batch[k].split("\t") for k in data_line_indexes[:guess_count]])
+                        comment_lines += stop - len(data_line_indexes)
+                        data_lines += len(data_line_indexes)
+                        i += stop
+                    if done:
+                        # Anything left to read? If so, the line counts are incomplete.
+                        if j < len(lines) or next(batches, None) is not None or dataset_fh.tell() != dataset.get_size():
                             # Clear optional data_lines metadata value
                             data_lines = None  # type: ignore [assignment]
                             # Clear optional comment_lines metadata value; additional comment lines could appear below this point
                             comment_lines = None  # type: ignore [assignment]
                         break
-                    i += 1
 
         # we error on the larger number of columns
         # first we pad our column_types by using data from first line
@@ -1093,6 +1162,7 @@ class BaseVcf(Tabular):
 
 class Vcf(BaseVcf):
     file_ext = "vcf"
+    sniff_magic = (b"##fileformat=VCF",)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
         return self._sniff(file_prefix)
@@ -1662,6 +1732,7 @@ class MatrixMarket(TabularData):
     """
 
     file_ext = "mtx"
+    sniff_magic = (b"%%MatrixMarket matrix coordinate",)
 
     def __init__(self, **kwd):
         super().__init__(**kwd)
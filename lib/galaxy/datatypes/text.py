@@ -45,6 +45,10 @@ from galaxy.util import (
 
 log = logging.getLogger(__name__)
 
+# JSON documents are arrays or objects, optionally preceded by JSON whitespace.
+JSON_WHITESPACE = " \t\n\r"
+JSON_SNIFF_MAGIC = (b"[", b"{") + tuple(c.encode() for c in JSON_WHITESPACE)
+
 
 @build_sniff_from_prefix
 class Html(Text):
@@ -88,6 +92,7 @@ class Html(Text):
 class Json(Text):
     edam_format = "format_3464"
     file_ext = "json"
+    sniff_magic = JSON_SNIFF_MAGIC
 
     def set_peek(self, dataset: DatasetProtocol, **kwd) -> None:
         if not dataset.dataset.purged:
@@ -119,7 +124,7 @@ class Json(Text):
             except Exception:
                 return False
         else:
-            start = file_prefix.string_io().read(100).strip()
+            start = file_prefix.string_io().read(100).lstrip(JSON_WHITESPACE)
             if start:
                 # simple types are valid JSON as well,
                 # but if necessary format has to be set explicitly
@@ -180,6 +185,7 @@ class ExpressionJson(Json):
 @build_sniff_from_prefix
 class Ipynb(Json):
     file_ext = "ipynb"
+    sniff_magic = JSON_SNIFF_MAGIC
 
     def set_peek(self, dataset: DatasetProtocol, **kwd) -> None:
         if not dataset.dataset.purged:
@@ -273,6 +279,7 @@ class Biom1(Json):
     """
 
     file_ext = "biom1"
+    sniff_magic = JSON_SNIFF_MAGIC
     edam_format = "format_3746"
 
     MetadataElement(
@@ -491,6 +498,7 @@ class ImgtJson(Json):
     """
 
     file_ext = "imgt.json"
+    sniff_magic = JSON_SNIFF_MAGIC
 
     MetadataElement(name="taxon_names", default=[], desc="taxonID: names", readonly=True, visible=True, no_value=[])
 
@@ -559,6 +567,7 @@ class GeoJson(Json):
     """
 
     file_ext = "geojson"
+    sniff_magic = JSON_SNIFF_MAGIC
 
     def set_peek(self, dataset: DatasetProtocol, **kwd) -> None:
         super().set_peek(dataset)
@@ -620,6 +629,7 @@ class Obo(Text):
     edam_data = "data_0582"
     edam_format = "format_2549"
     file_ext = "obo"
+    sniff_magic = (b"format-version:",)
 
     def set_peek(self, dataset: DatasetProtocol, **kwd) -> None:
         if not dataset.dataset.purged:
@@ -929,6 +939,7 @@ class IQTree(Text):
     """IQ-TREE format"""
 
     file_ext = "iqtree"
+    sniff_magic = (b"IQ-TREE",)
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
         """
@@ -1147,6 +1158,7 @@ class BCSLts(Json):
     """BioChemical Space Language transition system file"""
 
     file_ext = "bcsl.ts"
+    sniff_magic = JSON_SNIFF_MAGIC
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
         """
@@ -1290,6 +1302,7 @@ class PithyaResult(Json):
     """Pithya result format"""
 
     file_ext = "pithya.result"
+    sniff_magic = JSON_SNIFF_MAGIC
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
         """
@@ -1379,15 +1392,15 @@ class Param(Yaml):
             "ELECTRONICSPECTROSCOPY",
         ]
 
-        # check it looks like YAML
-        if not super().sniff_prefix(file_prefix):
-            return False
-
         # check the TASK keyword is present
         # and that it is set to a valid CASTEP task
         pattern = re.compile(r"^TASK ?: ?([A-Z\+]*)$", flags=re.IGNORECASE | re.MULTILINE)
         task = file_prefix.search(pattern)
-        return task and task.group(1).upper() in valid_tasks
+        if not (task and task.group(1).upper() in valid_tasks):
+            return False
+
+        # check it looks like YAML, parsing it is much more expensive than the search above
+        return super().sniff_prefix(file_prefix)
 
 
 @build_sniff_from_prefix
@@ -165,6 +165,7 @@ class Jsonld(text.Json, Triples):
     # format not defined in edam so we use the json format number
     edam_format = "format_3464"
     file_ext = "jsonld"
+    sniff_magic = text.JSON_SNIFF_MAGIC
 
     def sniff_prefix(self, file_prefix: FilePrefix) -> bool:
         if self._looks_like_json(file_prefix):
@@ -217,8 +218,8 @@ class Sbol(data.Text, Triples):
     file_ext = "sbol"
 
     def set_meta(self, dataset: DatasetProtocol, overwrite: bool = True, **kwd) -> None:
-        file_prefix = FilePrefix(filename=dataset.get_file_name())
-        match = file_prefix.search(SBOL_PATTERN)
+        with FilePrefix(filename=dataset.get_file_name()) as file_prefix:
+            match = file_prefix.search(SBOL_PATTERN)
         if match and match.group(1):
             dataset.metadata.version = match.group(1)
 
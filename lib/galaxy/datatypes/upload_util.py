@@ -44,41 +44,42 @@ def handle_upload(
     multi_file_zip = False
 
     # Does the first 1MB look like binary content?
-    file_prefix = sniff.FilePrefix(path, auto_decompress=auto_decompress)
-    is_binary = file_prefix.binary
+    with sniff.FilePrefix(path, auto_decompress=auto_decompress) as file_prefix:
+        is_binary = file_prefix.binary
 
-    converted_newlines, converted_spaces = False, False
+        converted_newlines, converted_spaces = False, False
 
-    # Decompress if needed/desired and determine/validate filetype. If a keep-compressed datatype is explicitly selected
-    # or if autodetection is selected and the file sniffs as a keep-compressed datatype, it will not be decompressed.
-    if not link_data_only:
-        if auto_decompress and file_prefix.compressed_format == "zip" and not is_single_file_zip(path):
-            multi_file_zip = True
-        try:
-            (
-                ext,
-                converted_path,
-                compression_type,
-                converted_newlines,
-                converted_spaces,
-            ) = sniff.handle_uploaded_dataset_file_internal(
-                file_prefix,
-                registry,
-                ext=requested_ext,
-                tmp_prefix=tmp_prefix,
-                tmp_dir=tmp_dir,
-                in_place=in_place,
-                check_content=check_content,
-                uploaded_file_ext=os.path.splitext(name)[1].lower().lstrip("."),
-                convert_to_posix_lines=convert_to_posix_lines,
-                convert_spaces_to_tabs=convert_spaces_to_tabs,
-            )
-        except sniff.InappropriateDatasetContentError as exc:
-            raise UploadProblemException(exc)
-    elif requested_ext == "auto":
-        ext = sniff.guess_ext(file_prefix, registry.sniff_order)
-    else:
-        ext = requested_ext
+        # Decompress if needed/desired and determine/validate filetype. If a keep-compressed datatype is explicitly
+        # selected or if autodetection is selected and the file sniffs as a keep-compressed datatype, it will not be
+        # decompressed.
+        if not link_data_only:
+            if auto_decompress and file_prefix.compressed_format == "zip" and not is_single_file_zip(path):
+                multi_file_zip = True
+            try:
+                (
+                    ext,
+                    converted_path,
+                    compression_type,
+                    converted_newlines,
+                    converted_spaces,
+                ) = sniff.handle_uploaded_dataset_file_internal(
+                    file_prefix,
+                    registry,
+                    ext=requested_ext,
+                    tmp_prefix=tmp_prefix,
+                    tmp_dir=tmp_dir,
+                    in_place=in_place,
+                    check_content=check_content,
+                    uploaded_file_ext=os.path.splitext(name)[1].lower().lstrip("."),
+                    convert_to_posix_lines=convert_to_posix_lines,
+                    convert_spaces_to_tabs=convert_spaces_to_tabs,
+                )
+            except sniff.InappropriateDatasetContentError as exc:
+                raise UploadProblemException(exc)
+        elif requested_ext == "auto":
+            ext = sniff.guess_ext(file_prefix, registry.sniffer_index)
+        else:
+            ext = requested_ext
 
     # The converted path will be the same as the input path if no conversion was done (or in-place conversion is used)
     converted_path = None if converted_path == path else converted_path
@@ -93,6 +93,7 @@ from galaxy.util import (
 from galaxy.util.bunch import Bunch
 from galaxy.util.expressions import ExpressionContext
 from galaxy.util.path import external_chown
+from galaxy.util.template import compile_template
 from galaxy.util.xml_macros import load
 from galaxy.web_stack.handlers import ConfiguresHandlers
 from galaxy.work.context import WorkRequestContext
@@ -1230,12 +1231,17 @@ class MinimalJobWrapper(HasResourceParameters):
         Prepare the job to run by creating the working directory and the
         config files.
         """
-        prepare_timer = util.ExecutionTimer()
+        prepare_timer = self.app.execution_timer_factory.get_timer(
+            # The job id is part of the message only, to statsd it would be a tag with a distinct value per job.
+            "internals.galaxy.jobs.job_wrapper_prepare",
+            f"Job wrapper for Job [{self.job_id}] prepared",
+        )
 
         if not os.path.exists(self.working_directory):
             os.mkdir(self.working_directory)
 
         job = self._load_job()
+        prepare_timer.mark("load_job")
 
         def get_special():
             stmt = select(model.JobExportHistoryArchive).filter_by(job=job).limit(1)
@@ -1259,6 +1265,8 @@ class MinimalJobWrapper(HasResourceParameters):
             self.interactivetools,
         ) = tool_evaluator.build()
         job.command_line = self.command_line
+        prepare_timer.mark("build_command")
+        self._report_compiled_template_cache()
 
         # Ensure galaxy_lib_dir is set in case there are any later chdirs
         self.galaxy_lib_dir  # noqa: B018
@@ -1271,11 +1279,22 @@ class MinimalJobWrapper(HasResourceParameters):
             self.app.tool_data_tables.to_json(
                 path=os.path.join(self.working_directory, "metadata", "outputs_new", "tool_data_tables.json")
             )
+        prepare_timer.mark("write_files")
         job.dependencies = self.tool.dependencies
         self.sa_session.add(job)
         with transaction(self.sa_session):
             self.sa_session.commit()
-        log.debug(f"Job wrapper for Job [{job.id}] prepared {prepare_timer}")
+        prepare_timer.mark("commit")
+        log.debug(prepare_timer.to_str(tool_id=job.tool_id, destination_id=job.destination_id or util.UNKNOWN))
+
+    def _report_compiled_template_cache(self):
+        cache_info = compile_template.cache_info()
+        self.app.execution_timer_factory.gauge(
+            "internals.galaxy.util.template.compiled_template_cache.hits", cache_info.hits
+        )
+        self.app.execution_timer_factory.gauge(
+            "internals.galaxy.util.template.compiled_template_cache.misses", cache_info.misses
+        )
 
     def _setup_working_directory(self, job=None):
         if job is None:
@@ -1466,6 +1485,7 @@ class MinimalJobWrapper(HasResourceParameters):
             self.sa_session.add(job)
             with transaction(self.sa_session):
                 self.sa_session.commit()
+            self._announce_outputs_ready(job)
         else:
             for dataset_assoc in job.output_datasets:
                 dataset = dataset_assoc.dataset
@@ -1491,6 +1511,15 @@ class MinimalJobWrapper(HasResourceParameters):
         delete_files = cleanup_job == "always" or (cleanup_job == "onsuccess" and job.state == job.states.DELETED)
         self.cleanup(delete_files=delete_files)
 
+    def _announce_outputs_ready(self, job):
+        """Wake up job handlers and workflow invocations waiting on this (now terminal) job and its outputs."""
+        dataset_ids = [
+            dataset_assoc.dataset.dataset.id
+            for dataset_assoc in job.output_datasets + job.output_library_datasets
+            if dataset_assoc.dataset
+        ]
+        self.app.job_manager.announce_inputs_ready(dataset_ids, job_ids=[job.id])
+
     def pause(self, job=None, message=None):
         if job is None:
             job = self.get_job()
@@ -1823,7 +1852,8 @@ class MinimalJobWrapper(HasResourceParameters):
         the contents of the output files.
         """
         finish_timer = self.app.execution_timer_factory.get_timer(
-            "internals.galaxy.jobs.job_wrapper_finish", "job_wrapper.finish for job ${job_id} executed"
+            "internals.galaxy.jobs.job_wrapper_finish",
+            f"job_wrapper.finish for job {self.job_id} executed",
         )
 
         # default post job setup
@@ -1884,6 +1914,7 @@ class MinimalJobWrapper(HasResourceParameters):
             final_job_state = job.states.OK
         else:
             final_job_state = job.states.ERROR
+        finish_timer.mark("check_output")
 
         if not extended_metadata and self.outputs_to_working_directory and not self.__link_file_check():
             # output will be moved by job if metadata_strategy is extended_metadata, so skip moving here
@@ -1905,6 +1936,7 @@ class MinimalJobWrapper(HasResourceParameters):
                         # Prior to fail we need to set job.state
                         job.set_state(final_job_state)
                         return fail(f"Job {job.id}'s output dataset(s) could not be read")
+            finish_timer.mark("move_outputs")
 
         job_context = ExpressionContext(dict(stdout=tool_stdout, stderr=tool_stderr))
         if extended_metadata:
@@ -1927,6 +1959,7 @@ class MinimalJobWrapper(HasResourceParameters):
             except Exception:
                 log.exception(f"problem importing job outputs. stdout [{job.stdout}] stderr [{job.stderr}]")
                 raise
+            finish_timer.mark("import_model_store")
         else:
             if self.tool.version_string_cmd:
                 version_filename = self.get_version_string_path()
@@ -1948,6 +1981,7 @@ class MinimalJobWrapper(HasResourceParameters):
                         "error_level": StdioErrorLevel.FATAL,
                     }
                 ]
+            finish_timer.mark("discover_outputs")
 
             for dataset_assoc in output_dataset_associations:
                 is_discovered_dataset = getattr(dataset_assoc.dataset, "discovered", False)
@@ -1976,6 +2010,7 @@ class MinimalJobWrapper(HasResourceParameters):
                 ):
                     # We don't set datsets in error state to OK because discover_outputs may have already set the state to error
                     dataset_assoc.dataset.dataset.state = model.Dataset.states.OK
+            finish_timer.mark("finish_datasets")
 
         if job.states.ERROR == final_job_state:
             for dataset_assoc in output_dataset_associations:
@@ -1992,6 +2027,7 @@ class MinimalJobWrapper(HasResourceParameters):
         for pja in job.post_job_actions:
             if pja.post_job_action.action_type not in ActionBox.immediate_actions:
                 ActionBox.execute(self.app, self.sa_session, pja.post_job_action, job, final_job_state=final_job_state)
+        finish_timer.mark("post_job_actions")
 
         # The exit code will be null if there is no exit code to be set.
         # This is so that we don't assign an exit code, such as 0, that
@@ -2012,6 +2048,7 @@ class MinimalJobWrapper(HasResourceParameters):
         user = job.user
         if user and collected_bytes > 0 and quota_source_info is not None and quota_source_info.use:
             user.adjust_total_disk_usage(collected_bytes, quota_source_info.label)
+        finish_timer.mark("collect_sizes")
 
         # Certain tools require tasks to be completed after job execution
         # ( this used to be performed in the "exec_after_process" hook, but hooks are deprecated ).
@@ -2037,6 +2074,7 @@ class MinimalJobWrapper(HasResourceParameters):
         )
 
         self._fix_output_permissions()
+        finish_timer.mark("exec_after_process")
 
         # Empirically, we need to update job.user and
         # job.workflow_invocation_step.workflow_invocation in separate
@@ -2052,17 +2090,31 @@ class MinimalJobWrapper(HasResourceParameters):
         # Finally set the job state.  This should only happen *after* all
         # dataset creation, and will allow us to eliminate force_history_refresh.
         job.set_final_state(final_job_state, supports_skip_locked=self.app.application_stack.supports_skip_locked())
+        finish_timer.mark("set_final_state")
         if not job.tasks:
             # If job was composed of tasks, don't attempt to recollect statistics
             self._collect_metrics(job, job_metrics_directory)
         with transaction(self.sa_session):
             self.sa_session.commit()
+        finish_timer.mark("collect_metrics")
+        self._announce_outputs_ready(job)
         if job.state == job.states.ERROR:
             self._report_error()
         cleanup_job = self.cleanup_job
         delete_files = cleanup_job == "always" or (job.state == job.states.OK and cleanup_job == "onsuccess")
         self.cleanup(delete_files=delete_files)
-        log.debug(finish_timer.to_str(job_id=self.job_id, tool_id=job.tool_id))
+        finish_timer.mark("cleanup")
+        log.debug(
+            finish_timer.to_str(
+                tool_id=job.tool_id,
+                destination_id=job.destination_id or util.UNKNOWN,
+            )
+        )
+        # Counted rather than used as tags, so they don't create a statsd series per distinct value.
+        self.app.execution_timer_factory.incr(
+            "internals.galaxy.jobs.job_wrapper_finish.outputs", len(output_dataset_associations)
+        )
+        self.app.execution_timer_factory.incr("internals.galaxy.jobs.job_wrapper_finish.bytes", collected_bytes)
 
     def discover_outputs(self, job, inp_data, out_data, out_collections, final_job_state):
         # Try to just recover input_ext and dbkey from job parameters (used and set in
@@ -2321,6 +2373,8 @@ class MinimalJobWrapper(HasResourceParameters):
             job=job,
             max_metadata_value_size=self.app.config.max_metadata_value_size,
             max_discovered_files=self.app.config.max_discovered_files,
+            metadata_threads=self.app.config.metadata_threads,
+            metadata_cache_dir=self.app.config.metadata_cache_dir,
             validate_outputs=self.validate_outputs,
             link_data_only=self.__link_file_check(),
             **kwds,
@@ -2794,6 +2848,9 @@ class NoopQueue:
     def put_stop(self, *args):
         return
 
+    def notify_inputs_ready(self, *args):
+        return
+
     def shutdown(self):
         return
 
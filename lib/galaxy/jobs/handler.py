@@ -6,13 +6,17 @@ import datetime
 import os
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from queue import (
     Empty,
     Queue,
 )
 from typing import (
     Dict,
+    Iterable,
     List,
+    Optional,
+    Set,
     Tuple,
     Type,
     Union,
@@ -72,6 +76,8 @@ log = get_logger(__name__)
     "user_over_quota",
     "user_over_total_walltime",
 )
+# Look back this far when picking up new jobs, to allow for clock differences between Galaxy processes
+READINESS_INGEST_OVERLAP = datetime.timedelta(seconds=60)
 DEFAULT_JOB_RUNNER_FAILURE_MESSAGE = "Unable to run job due to a misconfiguration of the Galaxy job running system.  Please contact a site administrator."
 
 
@@ -222,6 +228,66 @@ class StopSignalException(Exception):
     """Exception raised when queue returns a stop signal."""
 
 
+class JobReadinessTracker:
+    """
+    Keeps track of the input datasets each new job is still waiting on, so that the job
+    handler only needs to look at jobs whose last blocking input has become ready.
+    """
+
+    def __init__(self):
+        # job id -> ids of the datasets the job is waiting on
+        self.blocked_on: Dict[int, Set[int]] = {}
+        # dataset id -> ids of the jobs waiting on the dataset
+        self.waiting_jobs: Dict[int, Set[int]] = {}
+        # ids of jobs that have no pending inputs but have not been dispatched yet
+        self.ready: Set[int] = set()
+
+    def __contains__(self, job_id):
+        return job_id in self.ready or job_id in self.blocked_on
+
+    def __len__(self):
+        return len(self.ready) + len(self.blocked_on)
+
+    @property
+    def blocking_dataset_ids(self) -> Set[int]:
+        return set(self.waiting_jobs)
+
+    def track(self, job_id: int, dataset_ids: Optional[Iterable[int]] = None):
+        pending = set(dataset_ids or ())
+        if not pending:
+            self.ready.add(job_id)
+            return
+        self.blocked_on[job_id] = pending
+        for dataset_id in pending:
+            self.waiting_jobs.setdefault(dataset_id, set()).add(job_id)
+
+    def inputs_ready(self, dataset_ids: Iterable[int]) -> List[int]:
+        """Mark datasets as ready and return the ids of jobs that are no longer waiting on any input."""
+        now_ready = []
+        for dataset_id in dataset_ids:
+            for job_id in self.waiting_jobs.pop(dataset_id, ()):
+                pending = self.blocked_on[job_id]
+                pending.discard(dataset_id)
+                if not pending:
+                    del self.blocked_on[job_id]
+                    self.ready.add(job_id)
+                    now_ready.append(job_id)
+        return sorted(now_ready)
+
+    def discard(self, job_id: int):
+        self.ready.discard(job_id)
+        for dataset_id in self.blocked_on.pop(job_id, ()):
+            waiting_jobs = self.waiting_jobs[dataset_id]
+            waiting_jobs.discard(job_id)
+            if not waiting_jobs:
+                del self.waiting_jobs[dataset_id]
+
+    def clear(self):
+        self.blocked_on.clear()
+        self.waiting_jobs.clear()
+        self.ready.clear()
+
+
 class BaseJobHandlerQueue(Monitors):
     STOP_SIGNAL = object()
 
@@ -255,6 +321,16 @@ class JobHandlerQueue(BaseJobHandlerQueue):
         self.waiting_jobs: List[int] = []
         # Contains wrappers of jobs that are limited or ready (so they aren't created unnecessarily/multiple times)
         self.job_wrappers: Dict[int, JobWrapper] = {}
+        # Keeps track of the inputs new jobs are waiting on, if incremental readiness checks are enabled
+        self.readiness_tracker: Optional[JobReadinessTracker] = None
+        if self.track_jobs_in_database and app.config.job_handler_incremental_readiness:
+            self.readiness_tracker = JobReadinessTracker()
+            # Lists of dataset ids that became ready, fed by ``notify_inputs_ready``
+            self._ready_dataset_events: Queue[List[int]] = Queue()
+            self._readiness_ingest_since: Optional[datetime.datetime] = None
+            self._last_readiness_reconcile = 0.0
+        # Pulls the inputs of dispatched jobs into the object store cache, if enabled
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
         name = "JobHandlerQueue.monitor_thread"
         self._init_monitor_thread(name, target=self.__monitor, config=app.config)
         self.job_grabber = None
@@ -373,7 +449,8 @@ class JobHandlerQueue(BaseJobHandlerQueue):
                 # If jobs are locked, there's nothing to monitor and we skip
                 # to the sleep.
                 if not self.app.job_manager.job_lock:
-                    self.__monitor_step()
+                    with self.app.query_fingerprint_stats.scope("jobs.handlers.monitor_step"):
+                        self.__monitor_step()
             except Exception:
                 log.exception("Exception in monitor_step")
                 # With sqlite backends we can run into locked databases occasionally
@@ -412,68 +489,10 @@ class JobHandlerQueue(BaseJobHandlerQueue):
         if self.track_jobs_in_database:
             # Clear the session so we get fresh states for job and all datasets
             self.sa_session.expunge_all()
-            # Fetch all new jobs
-            hda_not_ready = (
-                self.sa_session.query(model.Job.id)
-                .enable_eagerloads(False)
-                .join(model.JobToInputDatasetAssociation)
-                .join(model.HistoryDatasetAssociation)
-                .join(model.Dataset)
-                .filter(
-                    and_(
-                        model.Job.state == model.Job.states.NEW, model.Dataset.state.in_(model.Dataset.non_ready_states)
-                    )
-                )
-                .subquery()
-            )
-            ldda_not_ready = (
-                self.sa_session.query(model.Job.id)
-                .enable_eagerloads(False)
-                .join(model.JobToInputLibraryDatasetAssociation)
-                .join(model.LibraryDatasetDatasetAssociation)
-                .join(model.Dataset)
-                .filter(
-                    and_(
-                        model.Job.state == model.Job.states.NEW, model.Dataset.state.in_(model.Dataset.non_ready_states)
-                    )
-                )
-                .subquery()
-            )
-            coalesce_exp = func.coalesce(
-                model.Job.table.c.user_id, model.Job.table.c.session_id
-            )  # accommodate jobs by anonymous users
-            rank = func.rank().over(partition_by=coalesce_exp, order_by=model.Job.table.c.id).label("rank")
-            job_filter_conditions = (
-                (model.Job.state == model.Job.states.NEW),
-                (model.Job.handler == self.app.config.server_name),
-                ~model.Job.table.c.id.in_(select(hda_not_ready)),
-                ~model.Job.table.c.id.in_(select(ldda_not_ready)),
-            )
-            if self.app.config.user_activation_on:
-                job_filter_conditions = job_filter_conditions + (
-                    or_((model.Job.user_id == null()), (model.User.active == true())),
-                )
-            if self.sa_session.bind.name == "sqlite":
-                query_objects = (model.Job,)
-            else:
-                query_objects = (model.Job, rank)
-            ready_query = (
-                self.sa_session.query(*query_objects)
-                .enable_eagerloads(False)
-                .outerjoin(model.User)
-                .filter(and_(*job_filter_conditions))
-                .order_by(model.Job.id)
-            )
-            if self.sa_session.bind.name == "sqlite":
-                jobs_to_check = ready_query.all()
+            if self.readiness_tracker is not None:
+                jobs_to_check = self.__get_ready_jobs_incremental(self.readiness_tracker)
             else:
-                ranked = ready_query.subquery()
-                jobs_to_check = (
-                    self.sa_session.query(model.Job)
-                    .join(ranked, model.Job.id == ranked.c.id)
-                    .filter(ranked.c.rank <= self.app.job_config.handler_ready_window_size)
-                    .all()
-                )
+                jobs_to_check = self.__get_ready_jobs()
             # Filter jobs with invalid input states
             jobs_to_check = self.__filter_jobs_with_invalid_input_states(jobs_to_check)
             # Fetch all "resubmit" jobs
@@ -549,6 +568,8 @@ class JobHandlerQueue(BaseJobHandlerQueue):
                 elif job_state == JOB_READY:
                     self.dispatcher.put(self.job_wrappers.pop(job.id))
                     log.info("(%d) Job dispatched" % job.id)
+                    if self.app.config.object_store_cache_prefetch_inputs:
+                        self.__prefetch_inputs(job)
                 elif job_state == JOB_DELETED:
                     log.info("(%d) Job deleted by user while still queued" % job.id)
                 elif job_state == JOB_ADMIN_DELETED:
@@ -578,6 +599,9 @@ class JobHandlerQueue(BaseJobHandlerQueue):
         # Update the waiting list
         if not self.track_jobs_in_database:
             self.waiting_jobs = new_waiting_jobs
+        elif self.readiness_tracker is not None:
+            for job_id in {job.id for job in jobs_to_check} - set(new_waiting_jobs):
+                self.readiness_tracker.discard(job_id)
         # Remove cached wrappers for any jobs that are no longer being tracked
         for id in set(self.job_wrappers.keys()) - set(new_waiting_jobs):
             del self.job_wrappers[id]
@@ -585,6 +609,216 @@ class JobHandlerQueue(BaseJobHandlerQueue):
         with transaction(self.sa_session):
             self.sa_session.commit()
 
+    def __prefetch_inputs(self, job):
+        """
+        Start pulling the job's inputs into the object store cache while it waits to be run.
+        Finding the object store holding an input may require remote calls, so this is done
+        on a separate thread, using detached copies of the input datasets.
+        """
+        datasets = []
+        for dataset_assoc in job.input_datasets + job.input_library_datasets:
+            if dataset_assoc.dataset:
+                dataset = dataset_assoc.dataset.dataset
+                detached_dataset = model.Dataset(
+                    id=dataset.id, uuid=dataset.uuid, external_filename=dataset.external_filename
+                )
+                detached_dataset.object_store_id = dataset.object_store_id
+                datasets.append(detached_dataset)
+        if datasets:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="JobHandlerQueue.prefetch_thread"
+                )
+            self._prefetch_executor.submit(self.__prefetch_datasets, job.id, datasets)
+
+    def __prefetch_datasets(self, job_id, datasets):
+        for dataset in datasets:
+            try:
+                self.app.object_store.prefetch(dataset)
+            except Exception:
+                log.exception("(%d) Failed to prefetch job input", job_id)
+
+    def __get_ready_jobs(self):
+        """
+        Fetch all new jobs assigned to this handler whose inputs are ready, limited to
+        ``handler_ready_window_size`` jobs per user.
+        """
+        hda_not_ready = (
+            self.sa_session.query(model.Job.id)
+            .enable_eagerloads(False)
+            .join(model.JobToInputDatasetAssociation)
+            .join(model.HistoryDatasetAssociation)
+            .join(model.Dataset)
+            .filter(
+                and_(model.Job.state == model.Job.states.NEW, model.Dataset.state.in_(model.Dataset.non_ready_states))
+            )
+            .subquery()
+        )
+        ldda_not_ready = (
+            self.sa_session.query(model.Job.id)
+            .enable_eagerloads(False)
+            .join(model.JobToInputLibraryDatasetAssociation)
+            .join(model.LibraryDatasetDatasetAssociation)
+            .join(model.Dataset)
+            .filter(
+                and_(model.Job.state == model.Job.states.NEW, model.Dataset.state.in_(model.Dataset.non_ready_states))
+            )
+            .subquery()
+        )
+        coalesce_exp = func.coalesce(
+            model.Job.table.c.user_id, model.Job.table.c.session_id
+        )  # accommodate jobs by anonymous users
+        rank = func.rank().over(partition_by=coalesce_exp, order_by=model.Job.table.c.id).label("rank")
+        job_filter_conditions = (
+            (model.Job.state == model.Job.states.NEW),
+            (model.Job.handler == self.app.config.server_name),
+            ~model.Job.table.c.id.in_(select(hda_not_ready)),
+            ~model.Job.table.c.id.in_(select(ldda_not_ready)),
+        )
+        if self.app.config.user_activation_on:
+            job_filter_conditions = job_filter_conditions + (
+                or_((model.Job.user_id == null()), (model.User.active == true())),
+            )
+        if self.sa_session.bind.name == "sqlite":
+            query_objects = (model.Job,)
+        else:
+            query_objects = (model.Job, rank)
+        ready_query = (
+            self.sa_session.query(*query_objects)
+            .enable_eagerloads(False)
+            .outerjoin(model.User)
+            .filter(and_(*job_filter_conditions))
+            .order_by(model.Job.id)
+        )
+        if self.sa_session.bind.name == "sqlite":
+            return ready_query.all()
+        else:
+            ranked = ready_query.subquery()
+            return (
+                self.sa_session.query(model.Job)
+                .join(ranked, model.Job.id == ranked.c.id)
+                .filter(ranked.c.rank <= self.app.job_config.handler_ready_window_size)
+                .all()
+            )
+
+    def __get_ready_jobs_incremental(self, tracker: JobReadinessTracker):
+        """
+        Fetch new jobs assigned to this handler whose inputs are ready using the in-memory
+        readiness tracker. Only newly assigned (or re-queued) jobs and datasets for which an
+        "inputs ready" notification has been received are looked up in the database, the
+        tracker is rebuilt from scratch every ``job_handler_readiness_reconcile_interval``
+        seconds to catch dataset state changes that were not announced.
+        """
+        now = time.time()
+        if now - self._last_readiness_reconcile > self.app.config.job_handler_readiness_reconcile_interval:
+            log.debug("Reconciling job readiness tracker (%d jobs tracked)", len(tracker))
+            tracker.clear()
+            self._readiness_ingest_since = None
+            self._last_readiness_reconcile = now
+        self.__ingest_new_jobs(tracker)
+        ready_dataset_ids: Set[int] = set()
+        try:
+            while True:
+                ready_dataset_ids.update(self._ready_dataset_events.get_nowait())
+        except Empty:
+            pass
+        ready_dataset_ids &= tracker.blocking_dataset_ids
+        if ready_dataset_ids:
+            ready_dataset_ids = set(
+                self.sa_session.scalars(
+                    select(model.Dataset.id).where(
+                        and_(
+                            model.Dataset.id.in_(ready_dataset_ids),
+                            model.Dataset.state.not_in(model.Dataset.non_ready_states),
+                        )
+                    )
+                )
+            )
+            tracker.inputs_ready(ready_dataset_ids)
+        if not tracker.ready:
+            return []
+        job_filter_conditions = (
+            model.Job.id.in_(tracker.ready),
+            (model.Job.state == model.Job.states.NEW),
+            (model.Job.handler == self.app.config.server_name),
+        )
+        if self.app.config.user_activation_on:
+            job_filter_conditions = job_filter_conditions + (
+                or_((model.Job.user_id == null()), (model.User.active == true())),
+            )
+        jobs = (
+            self.sa_session.query(model.Job)
+            .enable_eagerloads(False)
+            .outerjoin(model.User)
+            .filter(and_(*job_filter_conditions))
+            .order_by(model.Job.id)
+            .all()
+        )
+        # Jobs that are no longer new (dispatched, deleted, paused, ...) or were reassigned are not tracked anymore
+        for job_id in tracker.ready - {job.id for job in jobs}:
+            tracker.discard(job_id)
+        # Apply the same per-user window as the full scan, accommodating jobs by anonymous users
+        jobs_per_owner: Dict[int, int] = defaultdict(int)
+        jobs_to_check = []
+        for job in jobs:
+            owner = job.user_id if job.user_id is not None else job.session_id
+            jobs_per_owner[owner] += 1
+            if jobs_per_owner[owner] <= self.app.job_config.handler_ready_window_size:
+                jobs_to_check.append(job)
+        return jobs_to_check
+
+    def __ingest_new_jobs(self, tracker: JobReadinessTracker):
+        """
+        Start tracking new jobs assigned to this handler along with the not yet ready datasets
+        each of them is waiting on. Only jobs updated since the previous ingestion are
+        considered, unless the tracker has just been reset.
+        """
+        ingest_started = model.now()
+        job_conditions = [
+            model.Job.state == model.Job.states.NEW,
+            model.Job.handler == self.app.config.server_name,
+        ]
+        if self._readiness_ingest_since is not None:
+            job_conditions.append(model.Job.update_time >= self._readiness_ingest_since)
+        job_ids = [
+            job_id
+            for job_id in self.sa_session.scalars(select(model.Job.id).where(and_(*job_conditions)))
+            if job_id not in tracker
+        ]
+        if job_ids:
+            blocking_inputs: Dict[int, Set[int]] = defaultdict(set)
+            for job_to_input, input_association in [
+                (model.JobToInputDatasetAssociation, model.HistoryDatasetAssociation),
+                (model.JobToInputLibraryDatasetAssociation, model.LibraryDatasetDatasetAssociation),
+            ]:
+                stmt = (
+                    select(model.Job.id, model.Dataset.id)
+                    .join(job_to_input, job_to_input.job_id == model.Job.id)
+                    .join(input_association)
+                    .join(model.Dataset)
+                    .where(and_(*job_conditions, model.Dataset.state.in_(model.Dataset.non_ready_states)))
+                )
+                for job_id, dataset_id in self.sa_session.execute(stmt):
+                    blocking_inputs[job_id].add(dataset_id)
+            for job_id in job_ids:
+                tracker.track(job_id, blocking_inputs.get(job_id))
+            log.trace(
+                "Tracking %d new job(s), %d job(s) waiting on %d dataset(s)",
+                len(job_ids),
+                len(tracker) - len(tracker.ready),
+                len(tracker.blocking_dataset_ids),
+            )
+        # Allow for clock differences between the processes updating jobs
+        self._readiness_ingest_since = ingest_started - READINESS_INGEST_OVERLAP
+
+    def notify_inputs_ready(self, dataset_ids):
+        """
+        Called when the given datasets reached a ready state (ok, error, deleted, ...), may
+        be called from any thread.
+        """
+        if self.readiness_tracker is not None:
+            self._ready_dataset_events.put(list(dataset_ids))
+
     def __filter_jobs_with_invalid_input_states(self, jobs):
         """
         Takes  list of jobs and filters out jobs whose input datasets are in invalid state and
@@ -1051,6 +1285,8 @@ class JobHandlerQueue(BaseJobHandlerQueue):
             # A message could still be received while shutting down, should be ok since they will be picked up on next startup.
             self.sleeper.wake()
             self.shutdown_monitor()
+            if self._prefetch_executor is not None:
+                self._prefetch_executor.shutdown(wait=False)
             log.info("job handler queue stopped")
             self.dispatcher.shutdown()
 
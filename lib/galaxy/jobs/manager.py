@@ -97,6 +97,26 @@ class JobManager:
         """
         self.job_handler.job_stop_queue.put(job.id, error_msg=message)
 
+    def announce_inputs_ready(self, dataset_ids, job_ids=None):
+        """Let all job handlers and workflow schedulers know that the given datasets reached a state in which
+        they are no longer blocking jobs that use them as inputs, and that the given jobs reached a terminal state.
+
+        This is only used by handlers that track job readiness incrementally and by workflow schedulers that
+        wake up invocations when their dependencies finish, see the ``job_handler_incremental_readiness``
+        and ``workflow_scheduling_dependency_wakeups`` options.
+        """
+        config = self.app.config
+        if not (config.job_handler_incremental_readiness or config.workflow_scheduling_dependency_wakeups):
+            return
+        if not dataset_ids and not job_ids:
+            return
+        from galaxy.queue_worker import send_control_task
+
+        kwargs = {"dataset_ids": list(dataset_ids)}
+        if job_ids:
+            kwargs["job_ids"] = list(job_ids)
+        send_control_task(self.app, "job_inputs_ready", kwargs=kwargs)
+
     def shutdown(self):
         self.job_handler.shutdown()
 
@@ -115,6 +135,9 @@ class NoopManager:
     def stop(self, *args, **kwargs):
         pass
 
+    def announce_inputs_ready(self, *args, **kwargs):
+        pass
+
 
 class NoopHandler(handler.JobHandlerI):
     """
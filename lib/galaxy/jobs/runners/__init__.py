@@ -158,6 +158,11 @@ class BaseJobRunner:
                         job_id = arg.get_id_tag()
                 except Exception:
                     job_id = UNKNOWN
+                try:
+                    job_wrapper = arg.job_wrapper if isinstance(arg, JobState) else arg
+                    destination_id = job_wrapper.job_destination.id or UNKNOWN
+                except Exception:
+                    destination_id = UNKNOWN
                 try:
                     name = method.__name__
                 except Exception:
@@ -172,7 +177,7 @@ class BaseJobRunner:
                         f"internals.{action_str}", f"job runner action {action_str} for job ${{job_id}} executed"
                     )
                     method(arg)
-                    log.trace(action_timer.to_str(job_id=job_id))
+                    log.trace(action_timer.to_str(job_id=job_id, destination_id=destination_id))
                 except Exception:
                     log.exception(f"({job_id}) Unhandled exception calling {name}")
                     if not isinstance(arg, JobState):
@@ -811,6 +816,8 @@ class AsynchronousJobRunner(BaseJobRunner, Monitors):
         # to 'watched' and then manage the watched jobs.
         self.watched = []
         self.monitor_queue = Queue()
+        # Galaxy job states of the watched jobs, fetched in bulk at the start of each monitor cycle
+        self.watched_galaxy_job_states: typing.Dict[int, str] = {}
 
     def _init_monitor_thread(self):
         name = f"{self.runner_name}.monitor_thread"
@@ -842,14 +849,24 @@ class AsynchronousJobRunner(BaseJobRunner, Monitors):
             # the session and discard it after each check_watched_item loop
             scoped_id = str(uuid.uuid4())
             self.app.model.set_request_id(scoped_id)
+            monitor_cycle_timer = self.app.execution_timer_factory.get_timer(
+                f"internal.galaxy.jobs.runners.{self.runner_name}.monitor_cycle",
+                f"{self.runner_name} monitor cycle complete.",
+            )
+            self.app.execution_timer_factory.gauge(
+                f"internal.galaxy.jobs.runners.{self.runner_name}.watched_jobs", len(self.watched)
+            )
             # Iterate over the list of watched jobs and check state
             try:
                 check_database_connection(self.sa_session)
+                self.watched_galaxy_job_states = self.get_galaxy_job_states(self.watched)
                 self.check_watched_items()
             except Exception:
                 log.exception("Unhandled exception checking active jobs")
             finally:
-                self.app.model.unset_request_id(scoped_id)
+                self.watched_galaxy_job_states = {}
+                self.app.model.unset_request_id(scoped_id, f"jobs.runners.{self.runner_name}.monitor_cycle")
+            log.trace(monitor_cycle_timer.to_str())
             # Sleep a bit before the next state check
             time.sleep(self.app.config.job_runner_monitor_sleep)
 
@@ -883,6 +900,54 @@ class AsynchronousJobRunner(BaseJobRunner, Monitors):
     def check_watched_item(self, job_state):
         raise NotImplementedError()
 
+    def get_galaxy_job_states(self, job_states) -> typing.Dict[int, str]:
+        """
+        Fetch the Galaxy state of all given watched jobs with a single query,
+        returns a dictionary mapping Galaxy job ids to job states.
+        """
+        job_ids = {job_state.job_wrapper.job_id for job_state in job_states if not job_state.job_wrapper.is_task}
+        if not job_ids:
+            return {}
+        stmt = select(model.Job.id, model.Job.state).where(model.Job.id.in_(job_ids))
+        return dict(self.sa_session.execute(stmt).all())
+
+    def get_galaxy_job_state(self, job_state: AsynchronousJobState) -> str:
+        """
+        Return the Galaxy state of a watched job. The state fetched at the
+        beginning of the current monitor cycle is used if available, so
+        subclasses should prefer this to ``job_wrapper.get_state()`` when
+        checking watched jobs.
+        """
+        job_wrapper = job_state.job_wrapper
+        if not job_wrapper.is_task and job_wrapper.job_id in self.watched_galaxy_job_states:
+            return self.watched_galaxy_job_states[job_wrapper.job_id]
+        return job_wrapper.get_state()
+
+    def get_external_job_states(self, job_destination: "JobDestination", external_job_ids) -> typing.Dict[str, str]:
+        """
+        Return the states of the given jobs (all running at ``job_destination``)
+        as known by the external resource manager, as a dictionary mapping
+        external job ids to Galaxy job states. Runners that can query many jobs
+        at once (``squeue``, ``qstat``, ...) should implement this, jobs missing
+        from the result have to be checked individually.
+        """
+        return {}
+
+    def get_watched_external_job_states(self) -> typing.Dict[str, str]:
+        """
+        Query the external states of all watched jobs with one call to
+        ``get_external_job_states`` per destination.
+        """
+        job_destinations: typing.Dict[str, typing.Tuple["JobDestination", typing.List[str]]] = {}
+        for job_state in self.watched:
+            if job_state.job_destination.id not in job_destinations:
+                job_destinations[job_state.job_destination.id] = (job_state.job_destination, [])
+            job_destinations[job_state.job_destination.id][1].append(job_state.job_id)
+        external_job_states = {}
+        for job_destination, external_job_ids in job_destinations.values():
+            external_job_states.update(self.get_external_job_states(job_destination, external_job_ids))
+        return external_job_states
+
     def finish_job(self, job_state: AsynchronousJobState):
         """
         Get the output/error for a finished job, pass to `job_wrapper.finish`
@@ -159,7 +159,7 @@ class ShellJobRunner(AsynchronousJobRunner):
         """
         new_watched = []
 
-        job_states = self.__get_job_states()
+        job_states = self.get_watched_external_job_states()
 
         for ajs in self.watched:
             external_job_id = ajs.job_id
@@ -167,7 +167,7 @@ class ShellJobRunner(AsynchronousJobRunner):
             old_state = ajs.old_state
             state = job_states.get(external_job_id, None)
             if state is None:
-                if ajs.job_wrapper.get_state() == model.Job.states.DELETED:
+                if self.get_galaxy_job_state(ajs) == model.Job.states.DELETED:
                     continue
 
                 log.debug(f"({id_tag}/{external_job_id}) job not found in batch state check")
@@ -179,7 +179,7 @@ class ShellJobRunner(AsynchronousJobRunner):
                     log.warning(
                         f"({id_tag}/{external_job_id}) job not found in batch state check, but found in individual state check"
                     )
-            job_state = ajs.job_wrapper.get_state()
+            job_state = self.get_galaxy_job_state(ajs)
             if state != old_state:
                 log.debug(f"({id_tag}/{external_job_id}) state change: from {old_state} to {state}")
                 if state == model.Job.states.ERROR and job_state != model.Job.states.STOPPED:
@@ -223,27 +223,12 @@ class ShellJobRunner(AsynchronousJobRunner):
                 ajs.runner_state = JobState.runner_states.MEMORY_LIMIT_REACHED
                 ajs.fail_message = "Tool failed due to insufficient memory. Try with more memory."
 
-    def __get_job_states(self):
-        job_destinations = {}
-        job_states = {}
-        # unique the list of destinations
-        for ajs in self.watched:
-            if ajs.job_destination.id not in job_destinations:
-                job_destinations[ajs.job_destination.id] = dict(
-                    job_destination=ajs.job_destination, job_ids=[ajs.job_id]
-                )
-            else:
-                job_destinations[ajs.job_destination.id]["job_ids"].append(ajs.job_id)
-        # check each destination for the listed job ids
-        for v in job_destinations.values():
-            job_destination = v["job_destination"]
-            job_ids = v["job_ids"]
-            shell_params, job_params = self.parse_destination_params(job_destination.params)
-            shell, job_interface = self.get_cli_plugins(shell_params, job_params)
-            cmd_out = shell.execute(job_interface.get_status(job_ids))
-            assert cmd_out.returncode == 0, cmd_out.stderr
-            job_states.update(job_interface.parse_status(cmd_out.stdout, job_ids))
-        return job_states
+    def get_external_job_states(self, job_destination, external_job_ids):
+        shell_params, job_params = self.parse_destination_params(job_destination.params)
+        shell, job_interface = self.get_cli_plugins(shell_params, job_params)
+        cmd_out = shell.execute(job_interface.get_status(external_job_ids))
+        assert cmd_out.returncode == 0, cmd_out.stderr
+        return job_interface.parse_status(cmd_out.stdout, external_job_ids)
 
     def stop_job(self, job_wrapper):
         """Attempts to delete a dispatched job"""
@@ -197,7 +197,7 @@ class CondorJobRunner(AsynchronousJobRunner):
                 log.debug(f"({galaxy_id_tag}/{job_id}) job has stopped running")
                 # Will switching from RUNNING to QUEUED confuse Galaxy?
                 # cjs.job_wrapper.change_state( model.Job.states.QUEUED )
-            job_state = cjs.job_wrapper.get_state()
+            job_state = self.get_galaxy_job_state(cjs)
             if job_complete or job_state == model.Job.states.STOPPED:
                 if job_state != model.Job.states.DELETED:
                     external_metadata = not asbool(
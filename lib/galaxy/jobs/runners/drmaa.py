@@ -244,7 +244,7 @@ class DRMAAJobRunner(AsynchronousJobRunner):
         does not determine if a job was terminal, but the implementation
         in the subclasses is supposed to do this.)
         """
-        job_state = ajs.job_wrapper.get_state()
+        job_state = self.get_galaxy_job_state(ajs)
         if drmaa_state == drmaa.JobState.FAILED and job_state != model.Job.states.STOPPED:
             if job_state != model.Job.states.DELETED:
                 ajs.stop_job = False
@@ -368,7 +368,7 @@ class PBSJobRunner(AsynchronousJobRunner):
             try:
                 status = statuses[job_id]
             except KeyError:
-                if pbs_job_state.job_wrapper.get_state() == model.Job.states.DELETED:
+                if self.get_galaxy_job_state(pbs_job_state) == model.Job.states.DELETED:
                     continue
                 try:
                     # Recheck to make sure it wasn't a communication problem
@@ -407,7 +407,7 @@ class PBSJobRunner(AsynchronousJobRunner):
                 try:
                     assert (
                         int(status.exit_status) == 0
-                        or pbs_job_state.job_wrapper.get_state() == model.Job.states.STOPPED
+                        or self.get_galaxy_job_state(pbs_job_state) == model.Job.states.STOPPED
                     )
                     log.debug(f"({galaxy_job_id}/{job_id}) PBS job has completed successfully")
                 except AssertionError:
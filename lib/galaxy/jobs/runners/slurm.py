@@ -154,7 +154,7 @@ class SlurmJobRunner(DRMAAJobRunner):
                     ajs.fail_message = OUT_OF_MEMORY_MSG
                     ajs.runner_state = ajs.runner_states.MEMORY_LIMIT_REACHED
                 elif slurm_state == "CANCELLED":
-                    if ajs.job_wrapper.get_state() == model.Job.states.STOPPED:
+                    if self.get_galaxy_job_state(ajs) == model.Job.states.STOPPED:
                         # User requested to stop job, this isn't an error, just finish as normal
                         return super()._complete_terminal_job(ajs, drmaa_state=drmaa_state)
                     # Check to see if the job was killed for exceeding memory consumption
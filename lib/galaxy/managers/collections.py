@@ -370,6 +370,7 @@ class DatasetCollectionManager:
         copy_elements=False,
         history=None,
     ):
+        self.__prefetch_hdas(trans, element_identifiers)
         if collection_type_description.has_subcollections():
             # Nested collection - recursively create collections and update identifiers.
             self.__recursively_create_collections_for_identifiers(
@@ -592,6 +593,31 @@ class DatasetCollectionManager:
             new_elements[key] = collection
         elements.update(new_elements)
 
+    def __prefetch_hdas(self, trans: ProvidesHistoryContext, element_identifiers) -> None:
+        """Load and check access to all HDAs referenced by ``element_identifiers`` at once.
+
+        The loaded HDAs are stashed in the identifiers (as ``__hda__``) for ``__load_element``,
+        so collections with many elements don't need a query and permission check per element.
+        """
+        identifiers_by_id: Dict[int, List[Dict[str, Any]]] = {}
+        stack = list(element_identifiers)
+        while stack:
+            element_identifier = stack.pop()
+            if not isinstance(element_identifier, dict) or "__object__" in element_identifier:
+                continue
+            src_type = element_identifier.get("src", "hda")
+            if src_type == "new_collection":
+                stack.extend(element_identifier.get("element_identifiers") or [])
+            elif src_type == "hda" and isinstance(element_identifier.get("id"), int):
+                if "__hda__" not in element_identifier:
+                    identifiers_by_id.setdefault(element_identifier["id"], []).append(element_identifier)
+        if not identifiers_by_id:
+            return
+        hdas = self.hda_manager.get_accessible_by_ids(list(identifiers_by_id), trans.user)
+        for hda_id, identifiers in identifiers_by_id.items():
+            for element_identifier in identifiers:
+                element_identifier["__hda__"] = hdas[hda_id]
+
     def __load_elements(self, trans, element_identifiers, hide_source_items=False, copy_elements=False, history=None):
         elements = {}
         for element_identifier in element_identifiers:
@@ -635,15 +661,15 @@ class DatasetCollectionManager:
         if tags := element_identifier.pop("tags", None):
             tag_str = ",".join(str(_) for _ in tags)
         if src_type == "hda":
-            hda = self.hda_manager.get_accessible(element_id, trans.user)
+            hda = element_identifier.get("__hda__") or self.hda_manager.get_accessible(element_id, trans.user)
             if copy_elements:
                 element: model.HistoryDatasetAssociation = self.hda_manager.copy(
                     hda, history=history or trans.history, hide_copy=True, flush=False
                 )
             else:
                 element = hda
-            if hide_source_items and self.hda_manager.get_owned(
-                hda.id, user=trans.user, current_history=history or trans.history
+            if hide_source_items and self.hda_manager.error_unless_owner(
+                hda, user=trans.user, current_history=history or trans.history
             ):
                 hda.visible = False
             trans.tag_handler.apply_item_tags(user=trans.user, item=element, tags_str=tag_str, flush=False)
@@ -91,6 +91,9 @@ class ConfigurationManager:
     def reload_toolbox(self):
         self._app.queue_worker.send_control_task("reload_toolbox")
 
+    def query_fingerprints(self, limit: int) -> List[Dict[str, Any]]:
+        return self._app.query_fingerprint_stats.summary(limit)
+
 
 # TODO: this is a bit of an odd duck. It uses the serializer structure from managers
 #   but doesn't have a model like them. It might be better in config.py or a
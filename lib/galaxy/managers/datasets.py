@@ -530,7 +530,7 @@ class DatasetAssociationManager(
         self.ensure_can_change_datatype(data)
         self.ensure_can_set_metadata(data)
         path = data.dataset.get_file_name()
-        datatype = sniff.guess_ext(path, trans.app.datatypes_registry.sniff_order)
+        datatype = sniff.guess_ext(path, trans.app.datatypes_registry.sniffer_index)
         trans.app.datatypes_registry.change_datatype(data, datatype)
         with transaction(trans.sa_session):
             trans.sa_session.commit()
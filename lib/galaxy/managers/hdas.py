@@ -28,6 +28,11 @@ from sqlalchemy import (
     select,
     true,
 )
+from sqlalchemy.orm import (
+    joinedload,
+    selectinload,
+    undefer,
+)
 from sqlalchemy.orm.session import object_session
 
 from galaxy import (
@@ -68,6 +73,7 @@ from galaxy.structured_app import (
     MinimalManagerApp,
     StructuredApp,
 )
+from galaxy.util import chunk_iterable
 from galaxy.util.compression_utils import get_fileobj
 
 log = logging.getLogger(__name__)
@@ -126,6 +132,41 @@ class HDAManager(
         #     return True
         return super().is_accessible(item, user, **kwargs)
 
+    def get_accessible_by_ids(
+        self, ids: List[int], user: Optional[model.User], **kwargs: Any
+    ) -> Dict[int, model.HistoryDatasetAssociation]:
+        """
+        Return the HDAs with the given ids keyed by id, loading them (and the dataset
+        permissions, histories and tags the access checks and copies need) with a few
+        IN queries instead of one query per HDA.
+
+        :raises exceptions.ObjectNotFound: if any of the HDAs doesn't exist
+        :raises exceptions.ItemAccessibilityException: if any of the HDAs is not accessible to user
+        """
+        HDA = model.HistoryDatasetAssociation
+        hdas: Dict[int, model.HistoryDatasetAssociation] = {}
+        for chunk in chunk_iterable(set(ids)):
+            stmt = (
+                select(HDA)
+                .where(HDA.id.in_(chunk))
+                .options(
+                    joinedload(HDA.dataset).selectinload(model.Dataset.actions),
+                    joinedload(HDA.history),
+                    selectinload(HDA.tags),  # type:ignore[attr-defined]
+                    undefer(HDA._metadata),
+                )
+            )
+            for hda in self.session().scalars(stmt):
+                hdas[hda.id] = hda
+        if missing := set(ids) - set(hdas):
+            raise exceptions.ObjectNotFound(f"{self.model_class.__name__} with id(s) {sorted(missing)} not found")
+        if not self.user_manager.is_admin(user, trans=kwargs.get("trans")):
+            roles = user.all_roles_exploiting_cache() if user else []
+            action_tuples = [(action.action, action.role_id) for hda in hdas.values() for action in hda.dataset.actions]
+            if not self.app.security_agent.can_access_datasets(roles, action_tuples):
+                raise exceptions.ItemAccessibilityException(f"{self.model_class.__name__} is not accessible by user")
+        return hdas
+
     def is_owner(self, item, user: Optional[model.User], current_history=None, **kwargs: Any) -> bool:
         """
         Use history to see if current user owns HDA.
@@ -453,6 +494,14 @@ class HDAStorageCleanerManager(base.StorageCleanerManager):
             self.dataset_manager.purge_datasets(request)
 
 
+def _genome_build(metadata: Optional[Dict[str, Any]]) -> str:
+    """Return ``hda.dbkey`` given the HDA's raw metadata."""
+    dbkey = (metadata or {}).get("dbkey", "?")
+    if isinstance(dbkey, list):
+        dbkey = dbkey[0] if dbkey else None
+    return str(dbkey) if dbkey is not None else "?"
+
+
 class HDASerializer(  # datasets._UnflattenedMetadataDatasetAssociationSerializer,
     datasets.DatasetAssociationSerializer[HDAManager],
     taggable.TaggableSerializerMixin,
@@ -619,6 +668,110 @@ class HDASerializer(  # datasets._UnflattenedMetadataDatasetAssociationSerialize
             keys = self._view_to_keys("inaccessible")
         return super().serialize(hda, keys, user=user, **context)
 
+    def serialize_summaries(self, hda_ids: List[int], user=None, trans=None) -> Dict[int, Dict[str, Any]]:
+        """
+        Serialize the HDAs with ids ``hda_ids`` to the summary view (with unencoded ids) without
+        loading them as models.
+
+        The summary columns, the state and whether ``user`` can access the dataset are selected in
+        a single query and the tags in a second one. Returns the serialized HDAs keyed by id.
+        """
+        if not hda_ids:
+            return {}
+        hda = model.HistoryDatasetAssociation.table.c
+        stmt = (
+            select(
+                hda.id,
+                hda.history_id,
+                hda.hid,
+                hda.name,
+                hda.dataset_id,
+                hda.extension,
+                hda.deleted,
+                hda.purged,
+                hda.visible,
+                hda.create_time,
+                hda.update_time,
+                hda._metadata,
+                func.coalesce(func.nullif(hda._state, ""), model.Dataset.state).label("state"),
+                model.Dataset.object_store_id,
+                self._accessible_expression(user, trans=trans).label("accessible"),
+            )
+            .join(model.Dataset, model.Dataset.id == hda.dataset_id)
+            .where(hda.id.in_(hda_ids))
+        )
+        tag_association = model.HistoryDatasetAssociationTagAssociation
+        tag_stmt = select(
+            tag_association.history_dataset_association_id,
+            tag_association.user_tname,
+            tag_association.value,
+            tag_association.user_value,
+        ).where(tag_association.history_dataset_association_id.in_(hda_ids))
+        session = self.manager.session()
+        tags: Dict[int, List[Any]] = {}
+        for tag in session.execute(tag_stmt):
+            tags.setdefault(tag.history_dataset_association_id, []).append(tag)
+
+        context = {"trans": trans}
+        encode_id = self.app.security.encode_id
+        quota_source_map = self.app.object_store.get_quota_source_map()
+        summaries = {}
+        for row in session.execute(stmt):
+            summary = {
+                "id": row.id,
+                "name": row.name,
+                "history_id": row.history_id,
+                "hid": row.hid if row.hid is not None else -1,
+                "history_content_type": "dataset",
+                "state": row.state,
+                "deleted": row.deleted,
+                "visible": row.visible,
+            }
+            if not row.accessible:
+                summary["accessible"] = False
+            else:
+                summary.update(
+                    {
+                        "type_id": f"dataset-{encode_id(row.id)}",
+                        "dataset_id": row.dataset_id,
+                        "genome_build": _genome_build(row._metadata),
+                        "extension": row.extension,
+                        "purged": row.purged,
+                        "tags": taggable.tags_to_strings(tags.get(row.id, [])),
+                        "type": "file",
+                        "url": self.url_for(
+                            "history_content",
+                            history_id=encode_id(row.history_id),
+                            id=encode_id(row.id),
+                            context=context,
+                        ),
+                        "create_time": row.create_time.isoformat() if row.create_time is not None else None,
+                        "update_time": row.update_time.isoformat() if row.update_time is not None else None,
+                        "object_store_id": row.object_store_id,
+                        "quota_source_label": quota_source_map.get_quota_source_info(row.object_store_id).label,
+                    }
+                )
+            summaries[row.id] = summary
+        return summaries
+
+    def _accessible_expression(self, user, trans=None):
+        """SQL expression for ``is_accessible`` of the HDA's dataset, to be used in queries joining Dataset."""
+        if self.manager.user_manager.is_admin(user, trans=trans):
+            return true()
+        # For DATASET_ACCESS the user must have all roles of the dataset's access permissions
+        restrictions = (
+            select(model.DatasetPermissions.id)
+            .where(
+                model.DatasetPermissions.dataset_id == model.Dataset.id,
+                model.DatasetPermissions.action == self.app.security_agent.permitted_actions.DATASET_ACCESS.action,
+            )
+            .correlate(model.Dataset)
+        )
+        role_ids = [role.id for role in user.all_roles_exploiting_cache()] if user else []
+        if role_ids:
+            restrictions = restrictions.where(model.DatasetPermissions.role_id.not_in(role_ids))
+        return ~restrictions.exists()
+
     def serialize_display_apps(self, item, key, trans=None, **context):
         """
         Return dictionary containing new-style display app urls.
@@ -0,0 +1,113 @@
+"""Wait for histories to change instead of polling their contents.
+
+Clients waiting for a history to change register with the process wide
+:class:`HistoryChangeFeed`. A single thread looks up the ``update_time`` of all histories
+with waiting clients in one query per poll interval and wakes up the clients of histories
+that changed. Waiting clients don't hold on to a database connection or a worker thread,
+so an idle history costs a primary key lookup shared by all clients waiting on it.
+"""
+
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+
+from galaxy.model import History
+
+log = logging.getLogger(__name__)
+
+
+class _Waiter:
+    def __init__(self, since: datetime, loop: asyncio.AbstractEventLoop):
+        self.since = since
+        self.loop = loop
+        self.future: "asyncio.Future[datetime]" = loop.create_future()
+
+    def wake(self, update_time: datetime) -> None:
+        self.loop.call_soon_threadsafe(self._set_result, update_time)
+
+    def _set_result(self, update_time: datetime) -> None:
+        if not self.future.done():
+            self.future.set_result(update_time)
+
+
+class HistoryChangeFeed:
+    def __init__(self, engine: Engine, poll_interval: float = 1.0):
+        self.engine = engine
+        self.poll_interval = poll_interval
+        self._waiters: Dict[int, List[_Waiter]] = {}
+        self._lock = threading.Lock()
+        self._exit = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    async def wait_for_change(self, history_id: int, since: datetime, timeout: float) -> Optional[datetime]:
+        """Return the ``update_time`` of the history once it is later than ``since``.
+
+        Returns ``None`` if the history didn't change within ``timeout`` seconds.
+        """
+        waiter = _Waiter(since, asyncio.get_running_loop())
+        with self._lock:
+            self._waiters.setdefault(history_id, []).append(waiter)
+            self._start_if_needed()
+        try:
+            return await asyncio.wait_for(waiter.future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._remove(history_id, waiter)
+
+    def notify(self, history_id: int, update_time: datetime) -> None:
+        """Wake up the clients waiting for changes to the history made before ``update_time``."""
+        with self._lock:
+            waiters = [waiter for waiter in self._waiters.get(history_id, ()) if waiter.since < update_time]
+        for waiter in waiters:
+            waiter.wake(update_time)
+
+    def shutdown(self) -> None:
+        self._exit.set()
+        thread = self._thread
+        if thread:
+            thread.join()
+
+    def _remove(self, history_id: int, waiter: _Waiter) -> None:
+        with self._lock:
+            waiters = self._waiters.get(history_id, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                self._waiters.pop(history_id, None)
+
+    def _start_if_needed(self) -> None:
+        # called with self._lock held
+        if self._thread is None and not self._exit.is_set():
+            self._thread = threading.Thread(name="HistoryChangeFeed.poll_thread", target=self._poll, daemon=True)
+            self._thread.start()
+
+    def _poll(self) -> None:
+        while not self._exit.is_set():
+            with self._lock:
+                if not self._waiters:
+                    # Nothing to watch, the next waiting client starts a new thread.
+                    self._thread = None
+                    return
+                history_ids = list(self._waiters)
+            try:
+                self.check(history_ids)
+            except Exception:
+                log.exception("Failed to check histories for changes")
+            self._exit.wait(self.poll_interval)
+
+    def check(self, history_ids: List[int]) -> None:
+        stmt = select(History.id, History.update_time).where(History.id.in_(history_ids))
+        with self.engine.connect() as conn:
+            rows = conn.execute(stmt).all()
+        for history_id, update_time in rows:
+            self.notify(history_id, update_time)
@@ -116,9 +116,9 @@ class HistoryContentsManager(base.SortableManager):
         """
         Returns a count of both/all types of contents, based on the given filters.
         """
-        return self.contents_query(
-            container, filters=filters, limit=limit, offset=offset, order_by=order_by, **kwargs
-        ).count()
+        query = self.contents_query(container, filters=filters, limit=limit, offset=offset, order_by=order_by, **kwargs)
+        with self.app.model.read_session(history_id=container.id if container else None) as session:
+            return query.with_session(session).count()
 
     def contents_query(self, container, filters=None, limit=None, offset=None, order_by=None, **kwargs):
         """
@@ -226,12 +226,18 @@ class HistoryContentsManager(base.SortableManager):
     def _session(self):
         return self.app.model.context
 
-    def _union_of_contents(self, container, expand_models=True, **kwargs):
+    def _union_of_contents(self, container, expand_models=True, expand_contained=True, **kwargs):
         """
         Returns a limited and offset list of both types of contents, filtered
         and in some order.
+
+        If `expand_contained` is False, the rows of the union query are returned
+        in place of the contained models (only subcontainers are loaded).
         """
-        contents_results = self._union_of_contents_query(container, **kwargs).all()
+        # the union query returns rows, it can be read from the replica
+        contents_query = self._union_of_contents_query(container, **kwargs)
+        with self.app.model.read_session(history_id=container.id if container else None) as session:
+            contents_results = contents_query.with_session(session).all()
         if not expand_models:
             return contents_results
 
@@ -247,7 +253,14 @@ class HistoryContentsManager(base.SortableManager):
 
         # query 2 & 3: use the ids to query each component_class, returning an id->full component model map
         contained_ids = id_map[self.contained_class_type_name]
-        id_map[self.contained_class_type_name] = self._contained_id_map(contained_ids)
+        if expand_contained:
+            id_map[self.contained_class_type_name] = self._contained_id_map(contained_ids)
+        else:
+            id_map[self.contained_class_type_name] = {
+                self._get_union_id(result): result
+                for result in contents_results
+                if self._get_union_type(result) == self.contained_class_type_name
+            }
         subcontainer_ids = id_map[self.subcontainer_class_type_name]
         serialization_params = kwargs.get("serialization_params", None)
         id_map[self.subcontainer_class_type_name] = self._subcontainer_id_map(
@@ -6,8 +6,12 @@ from datetime import (
     datetime,
 )
 from typing import (
+    Any,
     cast,
+    Dict,
     List,
+    Optional,
+    Set,
 )
 
 import sqlalchemy
@@ -24,7 +28,10 @@ from sqlalchemy import (
     or_,
     true,
 )
-from sqlalchemy.orm import aliased
+from sqlalchemy.orm import (
+    aliased,
+    Session,
+)
 from sqlalchemy.sql import select
 
 from galaxy import model
@@ -69,6 +76,7 @@ from galaxy.util import (
     ExecutionTimer,
     listify,
 )
+from galaxy.util.hash_util import sha256
 from galaxy.util.search import (
     FilteredTerm,
     parse_filters_structured,
@@ -77,6 +85,36 @@ from galaxy.util.search import (
 
 log = logging.getLogger(__name__)
 
+FINGERPRINT_INPUT_SOURCES = ("hda", "ldda", "hdca", "dce")
+
+
+def fingerprint_input_identities(param) -> Dict[str, Dict[Any, List]]:
+    """Map the HDAs, LDDAs, HDCAs and DCEs in the (nested) expanded tool parameters ``param`` to what
+    identifies their content, like ``JobSearch._input_identities`` does for their ids."""
+    identities: Dict[str, Dict[Any, List]] = defaultdict(dict)
+
+    def visit(value):
+        if isinstance(value, dict):
+            for v in value.values():
+                visit(v)
+        elif isinstance(value, list):
+            for v in value:
+                visit(v)
+        elif getattr(value, "id", None) is None:
+            return
+        elif isinstance(value, model.HistoryDatasetAssociation):
+            identities["hda"][value.id] = ["dataset", value.dataset_id]
+        elif isinstance(value, model.LibraryDatasetDatasetAssociation):
+            identities["ldda"][value.id] = ["dataset", value.dataset_id]
+        elif isinstance(value, model.HistoryDatasetCollectionAssociation):
+            identities["hdca"][value.id] = ["collection", value.collection_id]
+        elif isinstance(value, model.DatasetCollectionElement):
+            dataset_id = value.hda.dataset_id if value.hda_id is not None else None
+            identities["dce"][value.id] = ["element", value.element_identifier, dataset_id, value.child_collection_id]
+
+    visit(param)
+    return identities
+
 
 class JobLock(BaseModel):
     active: bool = Field(title="Job lock status", description="If active, jobs will not dispatch")
@@ -106,11 +144,16 @@ class JobManager:
         self.app = app
         self.dataset_manager = DatasetManager(app)
 
-    def index_query(self, trans, payload: JobIndexQueryPayload) -> sqlalchemy.engine.Result:
+    def index_query(
+        self, trans, payload: JobIndexQueryPayload, session: Optional[Session] = None
+    ) -> sqlalchemy.engine.Result:
         """The caller is responsible for security checks on the resulting job if
         history_id, invocation_id, or implicit_collection_jobs_id is set.
         Otherwise this will only return the user's jobs or all jobs if the requesting
         user is acting as an admin.
+
+        The query is executed on ``session`` if given (e.g. a read replica session), else
+        on ``trans.sa_session``.
         """
         is_admin = trans.user_is_admin
         user_details = payload.user_details
@@ -243,7 +286,7 @@ class JobManager:
 
         stmt = stmt.offset(payload.offset)
         stmt = stmt.limit(payload.limit)
-        return trans.sa_session.scalars(stmt)
+        return (session or trans.sa_session).scalars(stmt)
 
     def job_lock(self) -> JobLock:
         return JobLock(active=self.app.job_manager.job_lock)
@@ -302,6 +345,89 @@ class JobSearch:
         self.ldda_manager = ldda_manager
         self.decode_id = id_encoding_helper.decode_id
 
+    def fingerprint(self, tool_id, tool_version, param_dump, param=None) -> Optional[str]:
+        """Return the fingerprint of a job running ``tool_id`` with the (nested) ``param_dump``.
+
+        Inputs are identified by the underlying dataset or collection, so jobs that ran with the
+        same parameters on copies of the same inputs have the same fingerprint. Returns ``None`` if
+        an input can't be found. Inputs found in ``param``, the expanded parameters ``param_dump``
+        was created from, are identified without querying the database.
+        """
+        referenced_ids: Dict[str, Set[int]] = defaultdict(set)
+
+        def collect_references(path, key, value):
+            if isinstance(value, dict) and value.get("src") in FINGERPRINT_INPUT_SOURCES and "id" in value:
+                referenced_ids[value["src"]].add(value["id"])
+            return True
+
+        # Parameters the job search doesn't compare strictly are left out, the search verifies them.
+        params = {
+            k: v
+            for k, v in param_dump.items()
+            if not k.startswith("__") and not k.endswith("|__identifier__") and k not in {"chromInfo", "dbkey"}
+        }
+        remap(params, visit=collect_references)
+        identities = fingerprint_input_identities(param)
+        self._input_identities({src: ids - identities[src].keys() for src, ids in referenced_ids.items()}, identities)
+
+        def normalize(value):
+            if isinstance(value, dict):
+                if value == {"__class__": "RuntimeValue"}:
+                    return None
+                src = value.get("src")
+                if src in FINGERPRINT_INPUT_SOURCES and "id" in value:
+                    return {**value, "id": identities[src][value["id"]]}
+                return {k: normalize(v) for k, v in value.items()}
+            elif isinstance(value, list):
+                return [normalize(v) for v in value]
+            return value
+
+        try:
+            normalized = json.dumps([tool_id, str(tool_version), normalize(params)], sort_keys=True)
+        except (KeyError, TypeError):
+            return None
+        return sha256(normalized.encode("utf-8")).hexdigest()
+
+    def _input_identities(self, referenced_ids: Dict[str, Set[int]], identities: Dict[str, Dict[Any, List]]) -> None:
+        """Add what identifies the content of the referenced HDA, LDDA, HDCA and DCE ids to ``identities``."""
+        if referenced_ids.get("hda"):
+            hda = model.HistoryDatasetAssociation
+            stmt = select(hda.id, hda.dataset_id).where(hda.id.in_(referenced_ids["hda"]))
+            for hda_id, dataset_id in self.sa_session.execute(stmt):
+                identities["hda"][hda_id] = ["dataset", dataset_id]
+        if referenced_ids.get("ldda"):
+            ldda = model.LibraryDatasetDatasetAssociation
+            stmt = select(ldda.id, ldda.dataset_id).where(ldda.id.in_(referenced_ids["ldda"]))
+            for ldda_id, dataset_id in self.sa_session.execute(stmt):
+                identities["ldda"][ldda_id] = ["dataset", dataset_id]
+        if referenced_ids.get("hdca"):
+            hdca = model.HistoryDatasetCollectionAssociation
+            stmt = select(hdca.id, hdca.collection_id).where(hdca.id.in_(referenced_ids["hdca"]))
+            for hdca_id, collection_id in self.sa_session.execute(stmt):
+                identities["hdca"][hdca_id] = ["collection", collection_id]
+        if referenced_ids.get("dce"):
+            dce = model.DatasetCollectionElement
+            hda = model.HistoryDatasetAssociation
+            stmt = (
+                select(dce.id, dce.element_identifier, hda.dataset_id, dce.child_collection_id)
+                .outerjoin(hda, hda.id == dce.hda_id)
+                .where(dce.id.in_(referenced_ids["dce"]))
+            )
+            for dce_id, element_identifier, dataset_id, child_collection_id in self.sa_session.execute(stmt):
+                identities["dce"][dce_id] = ["element", element_identifier, dataset_id, child_collection_id]
+
+    def _fingerprinted_job_ids(self, fingerprint: str, user_id) -> List[int]:
+        stmt = (
+            select(Job.id)
+            .where(
+                Job.fingerprint == fingerprint,
+                Job.user_id == user_id,
+                Job.copied_from_job_id.is_(None),
+            )
+            .order_by(Job.id.desc())
+        )
+        return list(self.sa_session.scalars(stmt))
+
     def by_tool_input(self, trans, tool_id, tool_version, param=None, param_dump=None, job_state="ok"):
         """Search for jobs producing same results using the 'inputs' part of a tool POST."""
         user = trans.user
@@ -332,6 +458,16 @@ class JobSearch:
                 return key, "__id_wildcard__"
             return key, value
 
+        job_ids = None
+        if trans.app.config.job_cache_fingerprints:
+            fingerprint = self.fingerprint(tool_id, tool_version, param_dump, param)
+            if fingerprint is not None:
+                # Only verify the few jobs that can be equivalent instead of searching all jobs of the tool.
+                job_ids = self._fingerprinted_job_ids(fingerprint, user.id)
+                if not job_ids:
+                    log.info("No jobs with fingerprint %s found", fingerprint)
+                    return None
+
         wildcard_param_dump = remap(param_dump, visit=populate_input_data_input_id)
         return self.__search(
             tool_id=tool_id,
@@ -341,10 +477,19 @@ class JobSearch:
             job_state=job_state,
             param_dump=param_dump,
             wildcard_param_dump=wildcard_param_dump,
+            job_ids=job_ids,
         )
 
     def __search(
-        self, tool_id, tool_version, user, input_data, job_state=None, param_dump=None, wildcard_param_dump=None
+        self,
+        tool_id,
+        tool_version,
+        user,
+        input_data,
+        job_state=None,
+        param_dump=None,
+        wildcard_param_dump=None,
+        job_ids=None,
     ):
         search_timer = ExecutionTimer()
 
@@ -359,7 +504,7 @@ class JobSearch:
                 return key, value
             return key, value
 
-        stmt_sq = self._build_job_subquery(tool_id, user.id, tool_version, job_state, wildcard_param_dump)
+        stmt_sq = self._build_job_subquery(tool_id, user.id, tool_version, job_state, wildcard_param_dump, job_ids)
 
         stmt = select(Job.id).select_from(Job.table.join(stmt_sq, stmt_sq.c.id == Job.id))
 
@@ -453,7 +598,7 @@ class JobSearch:
         log.info("No equivalent jobs found %s", search_timer)
         return None
 
-    def _build_job_subquery(self, tool_id, user_id, tool_version, job_state, wildcard_param_dump):
+    def _build_job_subquery(self, tool_id, user_id, tool_version, job_state, wildcard_param_dump, job_ids=None):
         """Build subquery that selects a job with correct job parameters."""
         stmt = select(model.Job.id).where(
             and_(
@@ -462,6 +607,8 @@ class JobSearch:
                 model.Job.copied_from_job_id.is_(None),  # Always pick original job
             )
         )
+        if job_ids is not None:
+            stmt = stmt.where(model.Job.id.in_(job_ids))
         if tool_version:
             stmt = stmt.where(Job.tool_version == str(tool_version))
 
@@ -6,7 +6,10 @@ Mixins for Taggable model managers and serializers.
 
 import logging
 import re
-from typing import Optional
+from typing import (
+    List,
+    Optional,
+)
 
 from sqlalchemy import (
     func,
@@ -25,21 +28,29 @@ log = logging.getLogger(__name__)
 
 
 # TODO: work out the relation between serializers and managers and then fold these into the parent of the two
-def _tag_str_gen(item):
+def _tag_str_gen(tags):
     # TODO: which user is this? all?
-    for tag in item.tags:
+    for tag in tags:
         tag_str = tag.user_tname
         if tag.value is not None:
             tag_str += f":{tag.user_value}"
         yield tag_str
 
 
+def tags_to_strings(tags) -> List[str]:
+    """
+    Return tag associations (or rows with their ``user_tname``, ``value`` and
+    ``user_value`` columns) as a sorted list of strings.
+    """
+    tag_list = list(_tag_str_gen(tags))
+    # consider named tags while sorting
+    return sorted(tag_list, key=lambda str: re.sub("^name:", "#", str))
+
+
 def _tags_to_strings(item):
     if not hasattr(item, "tags"):
         return None
-    tag_list = list(_tag_str_gen(item))
-    # consider named tags while sorting
-    return sorted(tag_list, key=lambda str: re.sub("^name:", "#", str))
+    return tags_to_strings(item.tags)
 
 
 class TaggableSerializerMixin:
@@ -72,6 +72,8 @@ class MetadataCollectionStrategy(metaclass=abc.ABCMeta):
         include_command=True,
         max_metadata_value_size=0,
         max_discovered_files=None,
+        metadata_threads=1,
+        metadata_cache_dir=None,
         object_store_conf=None,
         tool=None,
         job=None,
@@ -149,6 +151,8 @@ class PortableDirectoryMetadataGenerator(MetadataCollectionStrategy):
         include_command=True,
         max_metadata_value_size=0,
         max_discovered_files=None,
+        metadata_threads=1,
+        metadata_cache_dir=None,
         validate_outputs=False,
         object_store_conf=None,
         tool=None,
@@ -205,6 +209,8 @@ class PortableDirectoryMetadataGenerator(MetadataCollectionStrategy):
             "datatypes_config": datatypes_config,
             "max_metadata_value_size": max_metadata_value_size,
             "max_discovered_files": max_discovered_files,
+            "metadata_threads": metadata_threads,
+            "metadata_cache_dir": metadata_cache_dir,
             "outputs": outputs,
             "change_datatype_actions": job.get_change_datatype_actions(),
         }
@@ -0,0 +1,146 @@
+"""Reuse metadata computed by ``set_meta`` for datasets with identical content.
+
+Entries are stored in a shared directory, one directory per entry named after a key
+derived from the dataset's content hash, its datatype, the Galaxy (and thus datatype)
+version, the ``set_meta`` keywords and the metadata already set on the dataset before
+``set_meta`` runs. An entry holds the JSON serialized metadata values in
+``metadata.json`` and a copy of each metadata file (e.g. BAM indexes).
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+
+from galaxy.model.custom_types import json_encoder
+from galaxy.model.metadata import (
+    FileParameter,
+    MetadataTempFile,
+)
+from galaxy.util.hash_util import (
+    memory_bound_hexdigest,
+    sha256,
+)
+from galaxy.version import VERSION
+
+log = logging.getLogger(__name__)
+
+METADATA_FILENAME = "metadata.json"
+FILES_DIRECTORY = "files"
+
+
+class MetadataCache:
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def cache_key(self, dataset_instance, set_meta_kwds: Dict[str, Any]) -> Optional[str]:
+        """Return the cache key for ``dataset_instance`` or ``None`` if its metadata can't be cached."""
+        datatype = dataset_instance.datatype
+        if dataset_instance.metadata_deferred or datatype.composite_type:
+            return None
+        try:
+            extra_files_path = dataset_instance.extra_files_path
+            if extra_files_path and os.path.isdir(extra_files_path) and os.listdir(extra_files_path):
+                # set_meta may look at more than the primary file
+                return None
+            content_hash = memory_bound_hexdigest(hash_func=sha256, path=dataset_instance.get_file_name())
+            metadata = {}
+            for name, spec in dataset_instance.metadata.spec.items():
+                if name in dataset_instance._metadata and not isinstance(spec.param, FileParameter):
+                    metadata[name] = spec.param.to_external_value(dataset_instance._metadata[name])
+            key_source = json_encoder.encode(
+                [
+                    content_hash,
+                    f"{datatype.__class__.__module__}.{datatype.__class__.__name__}",
+                    dataset_instance.extension,
+                    VERSION,
+                    {k: v for k, v in set_meta_kwds.items() if k != "metadata_tmp_files_dir"},
+                    metadata,
+                ]
+            )
+        except Exception:
+            log.debug("Not caching metadata of %s", dataset_instance.get_file_name(), exc_info=True)
+            return None
+        return sha256(key_source.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def load(self, dataset_instance, key: str, metadata_tmp_files_dir: Optional[str] = None) -> bool:
+        """Set cached metadata on ``dataset_instance``, return ``False`` if there is no usable entry."""
+        entry_path = self._entry_path(key)
+        try:
+            with open(os.path.join(entry_path, METADATA_FILENAME)) as fh:
+                cached = json.load(fh)
+        except FileNotFoundError:
+            return False
+        except Exception:
+            log.exception("Failed to read metadata cache entry %s", entry_path)
+            return False
+        try:
+            values = {}
+            spec = dataset_instance.metadata.spec
+            for name, value in cached["metadata"].items():
+                if name in spec:
+                    values[name] = spec[name].param.from_external_value(value, dataset_instance)
+            for name in cached["files"]:
+                if name not in spec:
+                    continue
+                metadata_file = spec[name].param.new_file(
+                    dataset=dataset_instance, metadata_tmp_files_dir=metadata_tmp_files_dir
+                )
+                cached_file = os.path.join(entry_path, FILES_DIRECTORY, name)
+                if isinstance(metadata_file, MetadataTempFile):
+                    shutil.copyfile(cached_file, metadata_file.get_file_name())
+                else:
+                    metadata_file.update_from_file(cached_file)
+                values[name] = metadata_file
+        except Exception:
+            log.exception("Failed to load metadata cache entry %s", entry_path)
+            return False
+        for name, value in values.items():
+            setattr(dataset_instance.metadata, name, value)
+        log.debug("Reused cached metadata %s for %s", key, dataset_instance.get_file_name())
+        return True
+
+    def store(self, dataset_instance, key: str) -> None:
+        """Add the metadata set on ``dataset_instance`` to the cache, errors are logged and ignored."""
+        entry_path = self._entry_path(key)
+        if os.path.exists(entry_path):
+            return
+        parent_dir = os.path.dirname(entry_path)
+        try:
+            os.makedirs(parent_dir, exist_ok=True)
+            tmp_entry_path = tempfile.mkdtemp(prefix=f".{key}_", dir=parent_dir)
+        except Exception:
+            log.exception("Failed to create metadata cache entry %s", entry_path)
+            return
+        try:
+            metadata: Dict[str, Any] = {}
+            files = []
+            for name, spec in dataset_instance.metadata.spec.items():
+                if name not in dataset_instance._metadata:
+                    continue
+                if isinstance(spec.param, FileParameter):
+                    metadata_file = getattr(dataset_instance.metadata, name)
+                    if not metadata_file:
+                        continue
+                    os.makedirs(os.path.join(tmp_entry_path, FILES_DIRECTORY), exist_ok=True)
+                    shutil.copyfile(metadata_file.get_file_name(), os.path.join(tmp_entry_path, FILES_DIRECTORY, name))
+                    files.append(name)
+                else:
+                    metadata[name] = spec.param.to_external_value(dataset_instance._metadata[name])
+            with open(os.path.join(tmp_entry_path, METADATA_FILENAME), "w") as fh:
+                fh.write(json_encoder.encode({"metadata": metadata, "files": files}))
+            # Publishing the complete entry is atomic, if another job won the race keep its entry.
+            os.rename(tmp_entry_path, entry_path)
+        except Exception:
+            if not os.path.exists(entry_path):
+                log.exception("Failed to store metadata cache entry %s", entry_path)
+            shutil.rmtree(tmp_entry_path, ignore_errors=True)
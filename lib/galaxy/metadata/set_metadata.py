@@ -17,6 +17,7 @@ import logging
 import os
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from pathlib import Path
 from typing import (
@@ -47,6 +48,7 @@ from galaxy.job_execution.output_collect import (
     SessionlessJobContext,
 )
 from galaxy.job_execution.setup import TOOL_PROVIDED_JOB_METADATA_KEYS
+from galaxy.metadata.cache import MetadataCache
 from galaxy.model import (
     Dataset,
     DatasetInstance,
@@ -117,6 +119,7 @@ def set_meta_with_tool_provided(
     set_meta_kwds,
     datatypes_registry,
     max_metadata_value_size,
+    metadata_cache: Optional[MetadataCache] = None,
 ):
     # This method is somewhat odd, in that we set the metadata attributes from tool,
     # then call set_meta, then set metadata attributes from tool again.
@@ -138,7 +141,15 @@ def set_meta_with_tool_provided(
     for metadata_name, metadata_value in file_dict.get("metadata", {}).items():
         setattr(dataset_instance.metadata, metadata_name, metadata_value)
     if not dataset_instance.metadata_deferred:
-        dataset_instance.datatype.set_meta(dataset_instance, **set_meta_kwds)
+        cache_key = metadata_cache.cache_key(dataset_instance, set_meta_kwds) if metadata_cache else None
+        if not (
+            metadata_cache
+            and cache_key
+            and metadata_cache.load(dataset_instance, cache_key, set_meta_kwds.get("metadata_tmp_files_dir"))
+        ):
+            dataset_instance.datatype.set_meta(dataset_instance, **set_meta_kwds)
+            if metadata_cache and cache_key:
+                metadata_cache.store(dataset_instance, cache_key)
     for metadata_name, metadata_value in file_dict.get("metadata", {}).items():
         setattr(dataset_instance.metadata, metadata_name, metadata_value)
 
@@ -195,11 +206,13 @@ def set_metadata_portable(
     provided_metadata_style = metadata_params.get("provided_metadata_style")
     max_metadata_value_size = metadata_params.get("max_metadata_value_size") or 0
     max_discovered_files = metadata_params.get("max_discovered_files")
+    metadata_cache_dir = metadata_params.get("metadata_cache_dir")
+    metadata_cache = MetadataCache(metadata_cache_dir) if metadata_cache_dir else None
     outputs = metadata_params["outputs"]
 
     tool_provided_metadata = load_job_metadata(job_metadata, provided_metadata_style)
 
-    def set_meta(new_dataset_instance, file_dict):
+    def set_meta(new_dataset_instance, file_dict, set_meta_kwds):
         if not extended_metadata_collection:
             set_meta_kwds["metadata_tmp_files_dir"] = metadata_tmp_files_dir
         set_meta_with_tool_provided(
@@ -208,6 +221,7 @@ def set_metadata_portable(
             set_meta_kwds,
             datatypes_registry,
             max_metadata_value_size,
+            metadata_cache=metadata_cache,
         )
 
     try:
@@ -386,7 +400,8 @@ def set_metadata_portable(
                 if filename and object_id:
                     unnamed_id_to_path[object_id] = os.path.join(job_context.job_working_directory, filename)
 
-    for output_name, output_dict in outputs.items():
+    def set_output_metadata(output_name, output_dict):
+        """Set metadata of a single output, returns its ``set_meta`` keywords and the dataset to export."""
         dataset_instance_id = output_dict["id"]
         klass = getattr(galaxy.model, output_dict.get("model_class", "HistoryDatasetAssociation"))
         dataset = import_model_store.sa_session.query(klass).find(dataset_instance_id)
@@ -402,6 +417,7 @@ def set_metadata_portable(
             json.load(open(filename_kwds))
         )  # load kwds; need to ensure our keywords are not unicode
         object_store_update_actions = []
+        export_dataset = None
         try:
             is_deferred = bool(unnamed_is_deferred.get(dataset_instance_id))
             dataset.metadata_deferred = is_deferred
@@ -476,7 +492,8 @@ def set_metadata_portable(
                     )
                     object_store_update_actions.append(partial(reset_external_filename, dataset))
                 object_store_update_actions.append(partial(dataset.set_total_size))
-                object_store_update_actions.append(partial(export_store.add_dataset, dataset))
+                # Datasets are added to the export store in output order once all outputs are done
+                export_dataset = dataset
                 if dataset_instance_id not in unnamed_id_to_path:
                     object_store_update_actions.append(partial(collect_extra_files, object_store, dataset, "."))
                     dataset_state = "deferred" if (is_deferred and final_job_state == "ok") else final_job_state
@@ -485,7 +502,7 @@ def set_metadata_portable(
                         dataset.state = dataset.dataset.state = dataset_state
                     # We're going to run through set_metadata in collect_dynamic_outputs with more contextual metadata,
                     # so only run set_meta for fixed outputs
-                    set_meta(dataset, file_dict)
+                    set_meta(dataset, file_dict, set_meta_kwds)
                 # TODO: merge expression_context into tool_provided_metadata so we don't have to special case this (here and in _finish_dataset)
                 meta = tool_provided_metadata.get_dataset_meta(output_name, dataset.dataset.id, dataset.dataset.uuid)
                 if meta:
@@ -515,7 +532,7 @@ def set_metadata_portable(
                 if dataset_instance_id not in unnamed_id_to_path:
                     # We're going to run through set_metadata in collect_dynamic_outputs with more contextual metadata,
                     # so only run set_meta for fixed outputs
-                    set_meta(dataset, file_dict)
+                    set_meta(dataset, file_dict, set_meta_kwds)
                 dataset.metadata.to_JSON_dict(filename_out)  # write out results of set_meta
 
             with open(filename_results_code, "w+") as tf:
@@ -526,11 +543,31 @@ def set_metadata_portable(
         finally:
             for action in object_store_update_actions:
                 action()
-
+        return set_meta_kwds, export_dataset
+
+    metadata_threads = min(metadata_params.get("metadata_threads") or 1, len(outputs))
+    if metadata_threads > 1:
+        # Outputs are independent of each other, results are collected in output order
+        # and the first failure (in output order) is raised, like in the serial case.
+        with ThreadPoolExecutor(max_workers=metadata_threads, thread_name_prefix="set_metadata") as executor:
+            futures = [
+                executor.submit(set_output_metadata, output_name, output_dict)
+                for output_name, output_dict in outputs.items()
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [set_output_metadata(output_name, output_dict) for output_name, output_dict in outputs.items()]
+    for _, export_dataset in results:
+        if export_store and export_dataset is not None:
+            export_store.add_dataset(export_dataset)
     if export_store:
         export_store.push_metadata_files()
         export_store._finalize()
-    write_job_metadata(tool_job_working_directory, job_metadata, set_meta, tool_provided_metadata)
+    # New datasets reuse the set_meta keywords of the last output
+    set_meta_kwds: Dict[str, Any] = results[-1][0] if results else {}
+    write_job_metadata(
+        tool_job_working_directory, job_metadata, partial(set_meta, set_meta_kwds=set_meta_kwds), tool_provided_metadata
+    )
 
 
 def validate_and_load_datatypes_config(datatypes_config):
@@ -743,6 +743,36 @@ def calculate_disk_usage_per_objectstore(sa_session, user_id: int):
     return sa_session.execute(text(statement), params).all()
 
 
+def calculate_disk_usage_per_quota_source(sa_session, user_id: int, quota_source_map) -> Dict[Optional[str], int]:
+    """Calculate the disk usage of a user per quota source label with a single query.
+
+    Yields the same values as the statements of ``calculate_user_disk_usage_statements``,
+    the default quota source is keyed as ``None``.
+    """
+    default_quota_enabled = quota_source_map.default_quota_enabled
+    default_exclude_ids = quota_source_map.default_usage_excluded_ids()
+    ids_per_quota_source = quota_source_map.ids_per_quota_source()
+    label_per_object_store_id = {
+        object_store_id: label
+        for label, object_store_ids in ids_per_quota_source.items()
+        for object_store_id in object_store_ids
+    }
+    usages: Dict[Optional[str], int] = {None: 0}
+    usages.update((label, 0) for label in ids_per_quota_source)
+    for usage, object_store_id in calculate_disk_usage_per_objectstore(sa_session, user_id):
+        usage = int(usage or 0)
+        if object_store_id is None:
+            in_default_source = default_quota_enabled or not default_exclude_ids
+        else:
+            in_default_source = object_store_id not in default_exclude_ids
+        if in_default_source:
+            usages[None] += usage
+        label = label_per_object_store_id.get(object_store_id)
+        if label is not None:
+            usages[label] += usage
+    return usages
+
+
 # move these to galaxy.schema.schema once galaxy-data depends on
 # galaxy-schema.
 class UserQuotaBasicUsage(BaseModel):
@@ -1111,7 +1141,6 @@ ON CONFLICT
         Return byte count total of disk space used by all non-purged, non-library
         HDAs in non-purged histories assigned to default quota source.
         """
-        # only used in set_user_disk_usage.py
         assert object_store is not None
         quota_source_map = object_store.get_quota_source_map()
         default_quota_enabled = quota_source_map.default_quota_enabled
@@ -1140,6 +1169,36 @@ ON CONFLICT
         """
         self._calculate_or_set_disk_usage(object_store=object_store)
 
+    def reconcile_disk_usage(self, object_store, dry_run=False) -> Dict[Optional[str], int]:
+        """
+        Compare the disk usage recorded by the incremental adjustments against the
+        usage calculated from the user's datasets.
+
+        Returns the drift (recorded minus calculated usage) per quota source label
+        (``None`` for the default quota source) that is off. Unless ``dry_run`` is
+        set, the recorded usage is corrected and usage of quota source labels that
+        are no longer configured is removed.
+        """
+        assert object_store is not None
+        sa_session = object_session(self)
+        calculated = calculate_disk_usage_per_quota_source(sa_session, self.id, object_store.get_quota_source_map())
+        statement = text("SELECT quota_source_label, disk_usage FROM user_quota_source_usage WHERE user_id = :user_id")
+        recorded: Dict[Optional[str], int] = {
+            label: int(usage or 0) for label, usage in sa_session.execute(statement, {"user_id": self.id})
+        }
+        sa_session.refresh(self, ["disk_usage"])
+        recorded[None] = int(self.disk_usage or 0)
+        drift = {}
+        for label in set(recorded) | set(calculated):
+            if label not in calculated or recorded.get(label, 0) != calculated[label]:
+                drift[label] = recorded.get(label, 0) - calculated.get(label, 0)
+        if drift and not dry_run:
+            # Usage adjusted by a job finishing since the calculation above would be taken for drift,
+            # so set each quota source from the datasets in a single statement instead of correcting
+            # the recorded usage by the drift.
+            self._calculate_or_set_disk_usage(object_store)
+        return drift
+
     def _calculate_or_set_disk_usage(self, object_store):
         """
         Utility to calculate and return the disk usage.  If dryrun is False,
@@ -1458,6 +1517,7 @@ class Job(Base, JobLike, UsesCreateAndUpdateTime, Dictifiable, Serializable):
     handler: Mapped[Optional[str]] = mapped_column(TrimmedString(255), index=True)
     preferred_object_store_id: Mapped[Optional[str]] = mapped_column(String(255))
     object_store_id_overrides: Mapped[Optional[STR_TO_STR_DICT]] = mapped_column(JSONType)
+    fingerprint: Mapped[Optional[str]] = mapped_column(String(64), index=True)
 
     user: Mapped[Optional["User"]] = relationship()
     galaxy_session: Mapped[Optional["GalaxySession"]] = relationship()
@@ -3258,12 +3318,45 @@ class History(Base, HasTags, Dictifiable, UsesAnnotations, HasName, Serializable
 
     def add_pending_items(self, set_output_hid=True):
         # These are assumed to be either copies of existing datasets or new, empty datasets,
-        # so we don't need to set the quota.
+        # so only copies of another user's datasets add to the quota.
+        if self.user:
+            self._add_copied_items_to_quota(self._pending_additions)
         self.add_datasets(
             object_session(self), self._pending_additions, set_hid=set_output_hid, quota=False, flush=False
         )
         self._pending_additions = []
 
+    def _add_copied_items_to_quota(self, items):
+        copies = [
+            item
+            for item in items
+            if getattr(item, "copied_from_history_dataset_association_id", None) and item.dataset.total_size is not None
+        ]
+        if not copies:
+            return
+        user = self.user
+        sa_session = object_session(self)
+        source_ids = {item.copied_from_history_dataset_association_id for item in copies}
+        stmt = (
+            select(HistoryDatasetAssociation.id)
+            .join(History, HistoryDatasetAssociation.history_id == History.id)
+            .where(HistoryDatasetAssociation.id.in_(source_ids), History.user_id == user.id)
+        )
+        with sa_session.no_autoflush:
+            own_source_ids = set(sa_session.scalars(stmt))
+            counted_dataset_ids = set()
+            for item in copies:
+                if item.copied_from_history_dataset_association_id in own_source_ids:
+                    # copies of the user's own datasets don't add to their usage
+                    continue
+                if item.dataset.id in counted_dataset_ids:
+                    # pending copies have no id yet and don't recognize each other in quota_amount
+                    continue
+                counted_dataset_ids.add(item.dataset.id)
+                quota_source_info = item.dataset.quota_source_info
+                if quota_source_info.use:
+                    user.adjust_total_disk_usage(item.quota_amount(user), quota_source_info.label)
+
     def _next_hid(self, n=1):
         """
         Generate next_hid from the database in a concurrency safe way:
@@ -8718,7 +8811,7 @@ class WorkflowInvocation(Base, UsesCreateAndUpdateTime, Dictifiable, Serializabl
         return list(sa_session.scalars(stmt))
 
     @staticmethod
-    def poll_active_workflow_ids(engine, scheduler=None, handler=None):
+    def _active_workflow_conditions(scheduler=None, handler=None):
         and_conditions = [
             or_(
                 WorkflowInvocation.state == WorkflowInvocation.states.NEW,
@@ -8730,13 +8823,30 @@ class WorkflowInvocation(Base, UsesCreateAndUpdateTime, Dictifiable, Serializabl
             and_conditions.append(WorkflowInvocation.scheduler == scheduler)
         if handler is not None:
             and_conditions.append(WorkflowInvocation.handler == handler)
+        return and_conditions
 
+    @staticmethod
+    def poll_active_workflow_ids(engine, scheduler=None, handler=None):
+        and_conditions = WorkflowInvocation._active_workflow_conditions(scheduler=scheduler, handler=handler)
         stmt = select(WorkflowInvocation.id).filter(and_(*and_conditions)).order_by(WorkflowInvocation.id.asc())
         # Immediately just load all ids into memory so time slicing logic
         # is relatively intutitive.
         with engine.connect() as conn:
             return conn.scalars(stmt).all()
 
+    @staticmethod
+    def poll_active_workflows(engine, scheduler=None, handler=None):
+        """Like ``poll_active_workflow_ids`` but return ``(id, history_id, user_id)`` rows."""
+        and_conditions = WorkflowInvocation._active_workflow_conditions(scheduler=scheduler, handler=handler)
+        stmt = (
+            select(WorkflowInvocation.id, WorkflowInvocation.history_id, History.user_id)
+            .join(History, WorkflowInvocation.history_id == History.id)
+            .filter(and_(*and_conditions))
+            .order_by(WorkflowInvocation.id.asc())
+        )
+        with engine.connect() as conn:
+            return conn.execute(stmt).all()
+
     def add_output(self, workflow_output, step, output_object):
         if not hasattr(output_object, "history_content_type"):
             # assuming this is a simple type, just JSON-ify it and stick in the database. In the future
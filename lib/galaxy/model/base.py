@@ -14,6 +14,7 @@ from inspect import (
 )
 from typing import (
     Dict,
+    Optional,
     Type,
     TYPE_CHECKING,
     Union,
@@ -30,6 +31,8 @@ from sqlalchemy.orm import (
 from galaxy.util.bunch import Bunch
 
 if TYPE_CHECKING:
+    from galaxy.model.orm.engine_factory import QueryFingerprintStats
+    from galaxy.model.read_replica import ReadReplica
     from galaxy.model.store import SessionlessContext
 
 log = logging.getLogger(__name__)
@@ -79,6 +82,9 @@ def check_database_connection(session):
 
 # TODO: Refactor this to be a proper class, not a bunch.
 class ModelMapping(Bunch):
+    query_fingerprint_stats: Optional["QueryFingerprintStats"] = None
+    read_replica: Optional["ReadReplica"] = None
+
     def __init__(self, model_modules, engine):
         self.engine = engine
         self._SessionLocal = sessionmaker(autoflush=False)
@@ -110,6 +116,29 @@ class ModelMapping(Bunch):
         """
         return self._SessionLocal()
 
+    def configure_read_replica(self, read_replica: "ReadReplica") -> None:
+        from galaxy.model.read_replica import track_writes
+
+        track_writes(self._SessionLocal)
+        self.read_replica = read_replica
+
+    @contextlib.contextmanager
+    def read_session(self, history_id: Optional[int] = None):
+        """
+        Yield a session for read-only queries.
+
+        If a read replica is configured this is a session on the replica, unless the
+        current session has written or the replica may be behind (see
+        :class:`galaxy.model.read_replica.ReadReplica`). Objects loaded through a replica
+        session are detached when the block exits.
+        """
+        session = self.session()
+        if self.read_replica is None:
+            yield session
+        else:
+            with self.read_replica.session(session, history_id) as read_session:
+                yield read_session
+
     def request_scopefunc(self):
         """
         Return a value that is used as dictionary key for sqlalchemy's ScopedRegistry.
@@ -119,14 +148,20 @@ class ModelMapping(Bunch):
         """
         return REQUEST_ID.get().get("request") or threading.get_ident()
 
-    @staticmethod
-    def set_request_id(request_id):
+    def set_request_id(self, request_id):
+        if self.query_fingerprint_stats:
+            self.query_fingerprint_stats.start(request_id)
         # Set REQUEST_ID to a new dict.
         # This new ContextVar value will only be seen by the current asyncio context
         # and descendant threadpools, but not other threads or asyncio contexts.
         return REQUEST_ID.set({"request": request_id})
 
-    def unset_request_id(self, request_id):
+    def unset_request_id(self, request_id, scope: str = "request"):
+        """End the session scope of ``request_id``.
+
+        ``scope`` names the web route, loop or task, statements executed in
+        the scope are aggregated under that name.
+        """
         # Unconditionally calling self.gx_app.model.session.remove()
         # would create a new session if the session was not accessed
         # in a request, so we check if there is a sqlalchemy session
@@ -134,6 +169,8 @@ class ModelMapping(Bunch):
         if request_id in self.scoped_registry.registry:
             self.scoped_registry.registry[request_id].close()
             del self.scoped_registry.registry[request_id]
+        if self.query_fingerprint_stats:
+            self.query_fingerprint_stats.finish(request_id, scope)
 
     @property
     def context(self) -> scoped_session:
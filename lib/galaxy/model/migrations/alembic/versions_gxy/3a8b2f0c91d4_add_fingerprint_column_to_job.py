@@ -0,0 +1,42 @@
+"""add fingerprint column to job
+
+Revision ID: 3a8b2f0c91d4
+Revises: 570bce1e82f9
+Create Date: 2026-10-18 10:12:41.372615
+
+"""
+
+from sqlalchemy import (
+    Column,
+    String,
+)
+
+from galaxy.model.database_object_names import build_index_name
+from galaxy.model.migrations.util import (
+    add_column,
+    drop_column,
+    drop_index,
+    transaction,
+)
+
+# revision identifiers, used by Alembic.
+revision = "3a8b2f0c91d4"
+down_revision = "570bce1e82f9"
+branch_labels = None
+depends_on = None
+
+
+# database object names used in this revision
+table_name = "job"
+column_name = "fingerprint"
+index_name = build_index_name(table_name, column_name)
+
+
+def upgrade():
+    add_column(table_name, Column(column_name, String(64), index=True))
+
+
+def downgrade():
+    with transaction():
+        drop_index(index_name, table_name)
+        drop_column(table_name, column_name)
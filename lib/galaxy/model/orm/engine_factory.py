@@ -1,10 +1,23 @@
+import hashlib
 import inspect
 import logging
 import os
+import re
 import threading
 import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 from multiprocessing.util import register_after_fork
-from typing import Dict
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from sqlalchemy import (
     create_engine,
@@ -18,6 +31,147 @@ log = logging.getLogger(__name__)
 
 QUERY_COUNT_LOCAL = threading.local()
 WORKING_DIRECTORY = os.getcwd()
+MAX_QUERY_FINGERPRINTS = 10000
+
+_FINGERPRINT_SUBSTITUTIONS = [
+    # string literals
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    # bind parameters in the pyformat, format, named, numeric and qmark styles
+    (re.compile(r"%\(\w+\)s|%s|(?<![:\w]):\w+|\$\d+|\?"), "?"),
+    # expanding parameters that haven't been rendered yet
+    (re.compile(r"__\[POSTCOMPILE_\w+\]"), "?"),
+    # numeric literals
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"\s+"), " "),
+    # IN lists and VALUES rows of any length
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(...)"),
+    (re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+"), "(...)"),
+]
+
+
+@lru_cache(maxsize=1024)
+def fingerprint_statement(statement: str) -> str:
+    """Normalize a SQL statement by replacing literals and bind parameters.
+
+    Statements that only differ in their parameters, or in the length of IN lists,
+    share a fingerprint.
+    """
+    for pattern, replacement in _FINGERPRINT_SUBSTITUTIONS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+
+class QueryFingerprints:
+    """Number of executions and total time of the statements executed in one scope, by fingerprint."""
+
+    def __init__(self) -> None:
+        self.queries: Dict[str, List[Any]] = {}
+
+    def add(self, statement: str, duration: float) -> None:
+        fingerprint = fingerprint_statement(statement)
+        if (entry := self.queries.get(fingerprint)) is None:
+            self.queries[fingerprint] = [1, duration]
+        else:
+            entry[0] += 1
+            entry[1] += duration
+
+
+QUERY_FINGERPRINTS: ContextVar[Optional[QueryFingerprints]] = ContextVar("query_fingerprints", default=None)
+
+
+class QueryFingerprintStats:
+    """Aggregate statement fingerprints of web requests, background loop iterations and tasks.
+
+    A scope is started with ``start(key)`` (``ModelMapping.set_request_id`` does this
+    for request scoped sessions) and recorded under a name with ``finish(key, name)``.
+    Scopes in which a single fingerprint executed more than ``repeat_threshold`` times
+    are logged and counted, these usually point at N+1 query patterns. Nothing is
+    recorded if ``repeat_threshold`` is ``0``.
+    """
+
+    def __init__(self, repeat_threshold: int = 0, statsd_client=None) -> None:
+        self.repeat_threshold = repeat_threshold
+        self.statsd_client = statsd_client
+        self._active: Dict[Any, Tuple[QueryFingerprints, Optional[QueryFingerprints]]] = {}
+        self._stats: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.repeat_threshold > 0
+
+    def start(self, key) -> None:
+        if not self.enabled:
+            return
+        fingerprints = QueryFingerprints()
+        self._active[key] = (fingerprints, QUERY_FINGERPRINTS.get())
+        QUERY_FINGERPRINTS.set(fingerprints)
+
+    def finish(self, key, name: str) -> None:
+        if (active := self._active.pop(key, None)) is None:
+            return
+        fingerprints, parent = active
+        QUERY_FINGERPRINTS.set(parent)
+        self.record(fingerprints, name)
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[None]:
+        key = str(uuid.uuid4())
+        self.start(key)
+        try:
+            yield
+        finally:
+            self.finish(key, name)
+
+    def record(self, fingerprints: QueryFingerprints, name: str) -> None:
+        with self._lock:
+            for fingerprint, (count, total) in fingerprints.queries.items():
+                if (stat := self._stats.get((name, fingerprint))) is None:
+                    if len(self._stats) >= MAX_QUERY_FINGERPRINTS:
+                        continue
+                    stat = self._stats[(name, fingerprint)] = {
+                        "scope": name,
+                        "fingerprint_id": fingerprint_id(fingerprint),
+                        "fingerprint": fingerprint,
+                        "scopes": 0,
+                        "count": 0,
+                        "max_count": 0,
+                        "total_time": 0.0,
+                        "repeated": 0,
+                    }
+                stat["scopes"] += 1
+                stat["count"] += count
+                stat["max_count"] = max(stat["max_count"], count)
+                stat["total_time"] += total
+                if count > self.repeat_threshold:
+                    stat["repeated"] += 1
+        for fingerprint, (count, total) in fingerprints.queries.items():
+            if count > self.repeat_threshold:
+                self._report_repeated(name, fingerprint, count, total)
+
+    def _report_repeated(self, name: str, fingerprint: str, count: int, total: float) -> None:
+        log.warning(
+            f"Statement executed [{count}] times ({total * 1000.0:0.3f} ms) in [{name}], possible N+1 query: {fingerprint}"
+        )
+        if self.statsd_client:
+            tags = {"scope": name, "fingerprint": fingerprint_id(fingerprint)}
+            self.statsd_client.incr("sql.repeated_queries", count, tags)
+            self.statsd_client.timing("sql.repeated_queries", total * 1000.0, tags)
+
+    def summary(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Return the aggregates that took the most time first."""
+        with self._lock:
+            stats = [dict(stat) for stat in self._stats.values()]
+        stats.sort(key=lambda stat: stat["total_time"], reverse=True)
+        return stats[:limit]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
 
 
 def reset_request_query_counts():
@@ -57,6 +211,7 @@ def build_engine(
     slow_query_log_threshold=0,
     thread_local_log=None,
     log_query_counts=False,
+    record_query_fingerprints=False,
 ):
     if database_query_profiling_proxy or slow_query_log_threshold or thread_local_log or log_query_counts:
 
@@ -110,6 +265,18 @@ def build_engine(
     else:
         engine = create_engine(url, **engine_options)
 
+    if record_query_fingerprints:
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def before_cursor_execute_fingerprint(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("fingerprint_start_time", []).append(time.time())
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def after_cursor_execute_fingerprint(conn, cursor, statement, parameters, context, executemany):
+            total = time.time() - conn.info["fingerprint_start_time"].pop(-1)
+            if (fingerprints := QUERY_FINGERPRINTS.get()) is not None:
+                fingerprints.add(statement, total)
+
     # Prevent sharing connection across fork: https://docs.sqlalchemy.org/en/14/core/pooling.html#using-connection-pools-with-multiprocessing-or-os-fork
     register_after_fork(engine, lambda e: e.dispose())
 
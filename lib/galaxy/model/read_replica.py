@@ -0,0 +1,114 @@
+"""Route read-only queries to a streaming replica of the Galaxy database.
+
+Reads are only sent to the replica if they can't observe stale data that matters:
+a session that has written in the current request or task keeps reading from the
+primary, history scoped reads fall back to the primary if the replica has not
+caught up with the history's ``update_time`` yet, and all reads fall back to the
+primary while the replica lags more than ``max_lag`` seconds behind.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import (
+    Iterator,
+    Optional,
+)
+
+from sqlalchemy import (
+    event,
+    select,
+    text,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import (
+    Session,
+    sessionmaker,
+)
+
+from galaxy.model import History
+
+log = logging.getLogger(__name__)
+
+WRITES_KEY = "read_replica_writes"
+POSTGRES_REPLICA_LAG = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+def track_writes(session_factory: sessionmaker) -> None:
+    """Mark sessions created by ``session_factory`` once they have flushed changes."""
+
+    @event.listens_for(session_factory, "after_flush")
+    def after_flush(session, flush_context):
+        session.info[WRITES_KEY] = True
+
+
+def has_writes(session: Session) -> bool:
+    return bool(session.new or session.dirty or session.deleted or session.info.get(WRITES_KEY))
+
+
+class ReadReplica:
+    def __init__(self, engine: Engine, max_lag: float = 10.0, lag_check_interval: float = 5.0) -> None:
+        self.engine = engine
+        self.max_lag = max_lag
+        self.lag_check_interval = lag_check_interval
+        self._sessionmaker = sessionmaker(bind=engine, autoflush=False)
+        self._lag: Optional[float] = None
+        self._lag_checked_at = 0.0
+
+    def lag(self) -> Optional[float]:
+        """Return the replication lag in seconds, checked at most every ``lag_check_interval`` seconds.
+
+        ``None`` is returned if the lag could not be determined.
+        """
+        now = time.time()
+        if now - self._lag_checked_at >= self.lag_check_interval:
+            self._lag_checked_at = now
+            self._lag = self._check_lag()
+        return self._lag
+
+    def _check_lag(self) -> Optional[float]:
+        if self.engine.name != "postgresql":
+            return 0.0
+        try:
+            with self.engine.connect() as conn:
+                lag = conn.execute(POSTGRES_REPLICA_LAG).scalar()
+        except Exception:
+            log.exception("Failed to determine the replication lag of the read replica")
+            return None
+        if lag is None:
+            # nothing has been replayed yet
+            return None
+        return float(lag)
+
+    def is_current(self) -> bool:
+        lag = self.lag()
+        return lag is not None and lag <= self.max_lag
+
+    def _history_is_current(self, primary: Session, replica: Session, history_id: int) -> bool:
+        stmt = select(History.update_time).where(History.id == history_id)
+        primary_update_time = primary.scalar(stmt)
+        replica_update_time = replica.scalar(stmt)
+        if primary_update_time is None:
+            return True
+        return replica_update_time is not None and replica_update_time >= primary_update_time
+
+    @contextmanager
+    def session(self, primary: Session, history_id: Optional[int] = None) -> Iterator[Session]:
+        """Yield a session reading from the replica, or ``primary`` if the replica may return stale results.
+
+        Objects loaded from the replica session are detached once the block exits.
+        """
+        if has_writes(primary) or not self.is_current():
+            yield primary
+            return
+        replica = self._sessionmaker()
+        try:
+            if history_id is not None and not self._history_is_current(primary, replica, history_id):
+                yield primary
+            else:
+                yield replica
+        finally:
+            replica.close()
@@ -18,6 +18,7 @@ from tempfile import mkdtemp
 from types import TracebackType
 from typing import (
     Any,
+    BinaryIO,
     Callable,
     cast,
     Dict,
@@ -113,6 +114,8 @@ from galaxy.util import (
 from galaxy.util.bunch import Bunch
 from galaxy.util.compression_utils import CompressedFile
 from galaxy.util.path import StrPath
+from galaxy.util.read_ahead import read_ahead
+from galaxy.util.zipstream import ZipstreamWrapper
 from ._bco_convert_utils import (
     bco_workflow_version,
     SoftwarePrerequisiteTracker,
@@ -1866,6 +1869,8 @@ class ModelExportStore(metaclass=abc.ABCMeta):
 class DirectoryModelExportStore(ModelExportStore):
     app: Optional[StoreAppProtocol]
     file_sources: Optional[ConfiguredFileSources]
+    # Set by stores that write dataset files recorded in self.archive_files into an archive themselves
+    streams_files: bool = False
 
     def __init__(
         self,
@@ -1884,7 +1889,8 @@ class DirectoryModelExportStore(ModelExportStore):
         :param app: Galaxy App or app-like object. Must be provided if `for_edit` and/or `serialize_dataset_objects` are True
         :param for_edit: Allow modifying existing HDA and dataset metadata during import.
         :param serialize_dataset_objects: If True will encode IDs using the host secret. Defaults `for_edit`.
-        :param export_files: How files should be exported, can be 'symlink', 'copy' or None, in which case files
+        :param export_files: How files should be exported, can be 'symlink', 'copy', 'stream' (for archive stores,
+                             files are read into the archive directly) or None, in which case files
                              will not be serialized.
         :param serialize_jobs: Include job data in model export. Not needed for set_metadata script.
         """
@@ -1925,6 +1931,8 @@ class DirectoryModelExportStore(ModelExportStore):
         self.collection_datasets: Set[int] = set()
         self.collections_attrs: List[Union[model.DatasetCollection, model.HistoryDatasetCollectionAssociation]] = []
         self.dataset_id_to_path: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+        # archive name -> path of dataset files and extra files directories streamed into archives
+        self.archive_files: Dict[str, str] = {}
 
         self.job_output_dataset_associations: Dict[int, Dict[str, model.DatasetInstance]] = {}
 
@@ -1947,6 +1955,11 @@ class DirectoryModelExportStore(ModelExportStore):
                 else:
                     shutil.copyfile(src, dest)
 
+        elif self.export_files == "stream" and self.streams_files:
+
+            def add(src, dest):
+                self.archive_files[os.path.relpath(dest, export_directory)] = src
+
         else:
             raise Exception(f"Unknown export_files parameter type encountered {self.export_files}")
 
@@ -1981,7 +1994,7 @@ class DirectoryModelExportStore(ModelExportStore):
             return
 
         if file_name:
-            if not os.path.exists(dir_path):
+            if not os.path.exists(dir_path) and self.export_files != "stream":
                 os.makedirs(dir_path)
 
             conversion = self.dataset_implicit_conversions.get(dataset)
@@ -2851,12 +2864,22 @@ class ROCrateArchiveModelExportStore(DirectoryModelExportStore, WriteCrates):
         shutil.rmtree(self.temp_output_dir)
 
 
-class TarModelExportStore(DirectoryModelExportStore):
+class ArchiveModelExportStore(DirectoryModelExportStore):
+    """Write the export as a single archive in one sequential pass.
+
+    Only the model attributes are written to a temporary export directory. With
+    ``export_files="stream"`` dataset files are read straight from the object store into
+    the archive instead of being staged in the export directory, optionally reading the
+    next ``parallel_reads`` files ahead.
+    """
+
+    archive_format: str
     file_source_uri: Optional[StrPath]
     out_file: StrPath
+    streams_files = True
 
-    def __init__(self, uri: StrPath, gzip: bool = True, **kwds) -> None:
-        self.gzip = gzip
+    def __init__(self, uri: StrPath, parallel_reads: int = 1, **kwds) -> None:
+        self.parallel_reads = parallel_reads
         temp_output_dir = tempfile.mkdtemp()
         self.temp_output_dir = temp_output_dir
         if "://" in str(uri):
@@ -2871,7 +2894,13 @@ class TarModelExportStore(DirectoryModelExportStore):
 
     def _finalize(self) -> None:
         super()._finalize()
-        tar_export_directory(self.export_directory, self.out_file, self.gzip)
+        write_export_archive(
+            self.export_directory,
+            self.out_file,
+            self.archive_format,
+            files=self.archive_files,
+            parallel_reads=self.parallel_reads,
+        )
         if self.file_source_uri:
             if not self.file_sources:
                 raise Exception(f"Need self.file_sources but {type(self)} is missing it: {self.file_sources}.")
@@ -2882,6 +2911,17 @@ class TarModelExportStore(DirectoryModelExportStore):
         shutil.rmtree(self.temp_output_dir)
 
 
+class TarModelExportStore(ArchiveModelExportStore):
+    def __init__(self, uri: StrPath, gzip: bool = True, **kwds) -> None:
+        self.gzip = gzip
+        self.archive_format = "tar.gz" if gzip else "tar"
+        super().__init__(uri, **kwds)
+
+
+class ZipModelExportStore(ArchiveModelExportStore):
+    archive_format = "zip"
+
+
 class BagDirectoryModelExportStore(DirectoryModelExportStore):
     def __init__(self, out_directory: str, **kwds) -> None:
         self.out_directory = out_directory
@@ -2934,6 +2974,7 @@ def get_export_store_factory(
 ) -> Callable[[StrPath], ModelExportStore]:
     export_store_class: Union[
         Type[TarModelExportStore],
+        Type[ZipModelExportStore],
         Type[BagArchiveModelExportStore],
         Type[ROCrateArchiveModelExportStore],
         Type[BcoModelExportStore],
@@ -2950,6 +2991,8 @@ def get_export_store_factory(
     elif download_format in ["tar"]:
         export_store_class = TarModelExportStore
         export_store_class_kwds["gzip"] = False
+    elif download_format == "zip":
+        export_store_class = ZipModelExportStore
     elif download_format == "rocrate.zip":
         export_store_class = ROCrateArchiveModelExportStore
     elif download_format == "bco.json":
@@ -2963,6 +3006,11 @@ def get_export_store_factory(
         export_store_class_kwds["bag_archiver"] = bag_archiver
     else:
         raise RequestParameterInvalidException(f"Unknown download format [{download_format}]")
+    if issubclass(export_store_class, ArchiveModelExportStore):
+        if export_files == "symlink":
+            # Archive stores read dataset files into the archive directly, no need to stage them.
+            export_store_class_kwds["export_files"] = "stream"
+        export_store_class_kwds["parallel_reads"] = app.config.model_store_export_parallel_reads
     return lambda path: export_store_class(path, **export_store_class_kwds)
 
 
@@ -2976,6 +3024,87 @@ def tar_export_directory(export_directory: StrPath, out_file: StrPath, gzip: boo
             store_archive.add(os.path.join(export_directory, export_path), arcname=export_path)
 
 
+def write_export_archive(
+    export_directory: StrPath,
+    out_file: Union[StrPath, BinaryIO],
+    archive_format: str,
+    files: Optional[Dict[str, str]] = None,
+    parallel_reads: int = 1,
+) -> None:
+    """Write the contents of ``export_directory`` and ``files`` (archive name -> path) to a tar, tar.gz or zip archive.
+
+    The archive is written in a single sequential pass, so ``out_file`` may be a non-seekable
+    stream. Files are read from their source paths (following symbolic links) while they are
+    written, reading the next ``parallel_reads`` files ahead.
+    """
+    sources = [(os.path.join(export_directory, name), name) for name in sorted(os.listdir(export_directory))]
+    sources.extend((path, arcname) for arcname, path in (files or {}).items())
+    entries = [entry for path, arcname in sources for entry in _archive_entries(path, arcname)]
+    contents = read_ahead((path for path, _ in entries if not os.path.isdir(path)), parallel_reads=parallel_reads)
+    with contextlib.ExitStack() as stack:
+        stack.callback(contents.close)
+        if isinstance(out_file, (str, os.PathLike)):
+            out = stack.enter_context(open(out_file, "wb"))
+        else:
+            out = out_file
+        if archive_format == "zip":
+            archive = ZipstreamWrapper()
+            for path, arcname in entries:
+                if os.path.isdir(path):
+                    archive.add_path(path, arcname)
+                else:
+                    # chunks are pulled when the archive is streamed, in the order the entries were added
+                    archive.write_iter(_next_file_chunks(contents, path), arcname, os.path.getsize(path))
+            for chunk in archive.response():
+                out.write(chunk)
+        elif archive_format in ["tar", "tar.gz"]:
+            mode = "w|gz" if archive_format == "tar.gz" else "w|"
+            with tarfile.open(fileobj=out, mode=mode, dereference=True) as store_archive:
+                for path, arcname in entries:
+                    tarinfo = store_archive.gettarinfo(path, arcname)
+                    if os.path.isdir(path):
+                        store_archive.addfile(tarinfo)
+                    else:
+                        store_archive.addfile(tarinfo, _ChunksReader(_next_file_chunks(contents, path)))
+        else:
+            raise Exception(f"Unknown archive format encountered {archive_format}")
+
+
+def _archive_entries(path: str, arcname: str) -> Iterator[Tuple[str, str]]:
+    yield path, arcname
+    if os.path.isdir(path):
+        for root, directories, filenames in os.walk(path, followlinks=True):
+            for name in sorted(directories) + sorted(filenames):
+                entry_path = os.path.join(root, name)
+                yield entry_path, os.path.join(arcname, os.path.relpath(entry_path, path))
+
+
+def _next_file_chunks(contents: Iterator[Tuple[str, Iterator[bytes]]], expected_path: str) -> Iterator[bytes]:
+    path, chunks = next(contents)
+    assert path == expected_path, f"Expected to read {expected_path}, got {path}"
+    yield from chunks
+
+
+class _ChunksReader:
+    """Minimal file-like object tarfile can read the contents of an entry from."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self.chunks = chunks
+        self.buffer = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer += chunk
+        if size < 0:
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
 def get_export_dataset_filename(name: str, ext: str, encoded_id: str, conversion_key: Optional[str]) -> str:
     """
     Builds a filename for a dataset using its name an extension.
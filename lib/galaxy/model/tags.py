@@ -10,7 +10,13 @@ from typing import (
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.sql import select
+from sqlalchemy.sql import (
+    and_,
+    delete,
+    insert,
+    or_,
+    select,
+)
 from sqlalchemy.sql.expression import func
 
 import galaxy.model
@@ -98,6 +104,68 @@ class TagHandler:
         item.update()
         return item.tags
 
+    def add_tags_to_items(self, user, item_class, item_ids: List[int], new_tags_list: List[str]) -> None:
+        """Add tags to all items of ``item_class`` with the given ids using one insert statement."""
+        # precondition: items are already security checked against user
+        item_tag_assoc_class = self.get_tag_assoc_class(item_class)
+        item_id_col = self.get_id_col_in_item_tag_assoc_table(item_class)
+        user_id = user.id if user else None
+        rows = []
+        for name, value in self.parse_tags_list(new_tags_list):
+            if name is None:
+                continue
+            tag = self._get_or_create_tag(name.lower())
+            if not tag:
+                log.warning(f"Failed to create tag with name {name.lower()}")
+                continue
+            lc_value = value.lower() if value else None
+            tagged_stmt = select(item_id_col).where(
+                item_id_col.in_(item_ids),
+                item_tag_assoc_class.tag_id == tag.id,
+                item_tag_assoc_class.user_id == user_id,
+                item_tag_assoc_class.value == lc_value,
+            )
+            tagged_ids = set(self.sa_session.scalars(tagged_stmt))
+            rows.extend(
+                {
+                    item_id_col.key: item_id,
+                    "tag_id": tag.id,
+                    "user_id": user_id,
+                    "user_tname": name,
+                    "user_value": value,
+                    "value": lc_value,
+                }
+                for item_id in item_ids
+                if item_id not in tagged_ids
+            )
+        if rows:
+            self.sa_session.execute(insert(item_tag_assoc_class), rows)
+
+    def remove_tags_from_items(self, item_class, item_ids: List[int], tag_to_remove_list: List[str]) -> None:
+        """Remove tags from all items of ``item_class`` with the given ids using one delete statement."""
+        # precondition: items are already security checked against user
+        item_tag_assoc_class = self.get_tag_assoc_class(item_class)
+        item_id_col = self.get_id_col_in_item_tag_assoc_table(item_class)
+        conditions = []
+        for tag_str in tag_to_remove_list:
+            # match the tag strings built by get_tags_list, "name" or "name:value"
+            conditions.append(and_(item_tag_assoc_class.user_tname == tag_str, item_tag_assoc_class.value.is_(None)))
+            for i, char in enumerate(tag_str):
+                if char == ":":
+                    conditions.append(
+                        and_(
+                            item_tag_assoc_class.user_tname == tag_str[:i],
+                            item_tag_assoc_class.user_value == tag_str[i + 1 :],
+                        )
+                    )
+        if conditions:
+            stmt = (
+                delete(item_tag_assoc_class)
+                .where(item_id_col.in_(item_ids), or_(*conditions))
+                .execution_options(synchronize_session=False)
+            )
+            self.sa_session.execute(stmt)
+
     def get_tag_assoc_class(self, item_class):
         """Returns tag association class for item class."""
         return self.item_tag_assoc_info[item_class.__name__].tag_assoc_class
@@ -507,7 +575,13 @@ class GalaxyTagHandlerSession(GalaxyTagHandler):
     def _get_tag(self, tag_name):
         """Get tag from cache or database."""
         # Avoids creating multiple new tags with the same tag_name, which violates unique key constraint
-        return self.created_tags.get(tag_name) or super(GalaxyTagHandler, self)._get_tag(tag_name)
+        if tag_name in self.created_tags:
+            return self.created_tags[tag_name]
+        tag = super(GalaxyTagHandler, self)._get_tag(tag_name)
+        if tag:
+            # Also avoids looking up the same tag once per item when tagging many items
+            self.created_tags[tag_name] = tag
+        return tag
 
     def _create_tag_instance(self, tag_name):
         """Create tag and and store in cache."""
@@ -274,6 +274,16 @@ class ObjectStore(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def prefetch(self, obj, extra_dir=None, extra_dir_at_root=False, alt_name=None):
+        """
+        Start pulling the object into a local cache in the background, if the object store has one.
+
+        This is a hint that the object will be accessed soon (e.g. by a job that was just
+        dispatched); it returns immediately and never raises if the object does not exist.
+        """
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def get_object_url(self, obj, extra_dir=None, extra_dir_at_root=False, alt_name=None, obj_dir=False):
         """
@@ -477,6 +487,12 @@ class BaseObjectStore(ObjectStore):
     def update_from_file(self, obj, **kwargs):
         return self._invoke("update_from_file", obj, **kwargs)
 
+    def prefetch(self, obj, **kwargs):
+        return self._invoke("prefetch", obj, **kwargs)
+
+    def _prefetch(self, obj, **kwargs):
+        """Only object stores with a local cache have anything to prefetch."""
+
     def get_object_url(self, obj, **kwargs):
         return self._invoke("get_object_url", obj, **kwargs)
 
@@ -1015,6 +1031,10 @@ class NestedObjectStore(BaseObjectStore):
             kwargs["create"] = False
         return self._call_method("_update_from_file", obj, ObjectNotFound, True, **kwargs)
 
+    def _prefetch(self, obj, **kwargs):
+        """For the first backend that has this `obj`, prefetch it."""
+        return self._call_method("_prefetch", obj, None, False, **kwargs)
+
     def _get_object_url(self, obj, **kwargs):
         """For the first backend that has this `obj`, get its URL."""
         return self._call_method("_get_object_url", obj, None, False, **kwargs)
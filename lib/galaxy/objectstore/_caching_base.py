@@ -1,11 +1,20 @@
+import codecs
 import logging
 import os
 import shutil
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from typing import (
     Any,
     Dict,
+    Iterator,
     Optional,
+    Set,
 )
 
 from galaxy.exceptions import (
@@ -17,15 +26,30 @@ from galaxy.util import (
     directory_hash_id,
     unlink,
 )
+from galaxy.util.filelock import (
+    FileLock,
+    FileLockException,
+)
 from galaxy.util.path import safe_relpath
 from ._util import fix_permissions
 from .caching import (
+    cache_index_enabled,
+    CacheIndex,
     CacheTarget,
+    DEFAULT_CACHE_INDEX_RECONCILE_INTERVAL,
+    DOWNLOAD_LOCK_SUFFIX,
+    DOWNLOAD_TMP_SUFFIX,
     InProcessCacheMonitor,
 )
 
 log = logging.getLogger(__name__)
 
+DEFAULT_DOWNLOAD_LOCK_TIMEOUT = 600
+DOWNLOAD_LOCK_POLL_INTERVAL = 0.5
+# How often to check whether the process holding a download lock is still alive
+DOWNLOAD_LOCK_STALE_CHECK_INTERVAL = 2
+PREFETCH_THREADS = 4
+
 
 class CachingConcreteObjectStore(ConcreteObjectStore):
     staging_path: str
@@ -36,6 +60,28 @@ class CachingConcreteObjectStore(ConcreteObjectStore):
     cache_size: int
     cache_monitor: Optional[InProcessCacheMonitor] = None
     cache_monitor_interval: int
+    use_cache_index: bool = False
+    _cache_index: Optional[CacheIndex] = None
+    ranged_read_max_size: int = 0
+    download_lock_timeout: int = DEFAULT_DOWNLOAD_LOCK_TIMEOUT
+    _prefetch_executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self, config, config_dict=None, **kwargs):
+        super().__init__(config, config_dict, **kwargs)
+        self.use_cache_index = cache_index_enabled(config, config_dict or {})
+        self.ranged_read_max_size = int(getattr(config, "object_store_ranged_read_max_size", 0) or 0)
+        self.download_lock_timeout = int(
+            getattr(config, "object_store_cache_download_lock_timeout", None) or DEFAULT_DOWNLOAD_LOCK_TIMEOUT
+        )
+        self._prefetching: Set[str] = set()
+        self._prefetch_lock = threading.Lock()
+
+    @property
+    def cache_index(self) -> Optional[CacheIndex]:
+        """Index of the files in the cache, if enabled (requires ``staging_path`` to be set)."""
+        if self.use_cache_index and self._cache_index is None:
+            self._cache_index = CacheIndex(self.staging_path)
+        return self._cache_index
 
     def _ensure_staging_path_writable(self):
         staging_path = self.staging_path
@@ -112,24 +158,139 @@ class CachingConcreteObjectStore(ConcreteObjectStore):
         cache_path = self._get_cache_path(rel_path)
         return os.path.exists(cache_path)
 
+    def _cached_and_complete(self, rel_path: str) -> bool:
+        # Downloads are moved into place once complete, so a non-empty cache file is never partial
+        cache_path = self._get_cache_path(rel_path)
+        return os.path.exists(cache_path) and os.path.getsize(cache_path) > 0
+
+    @contextmanager
+    def _download_lock(self, cache_path: str) -> Iterator[None]:
+        """Serialize downloads of ``cache_path`` across all threads and processes sharing the cache.
+
+        The lock file records the host and process holding the lock, locks left behind by
+        killed processes (see ``_download_lock_is_stale``) are broken.
+        """
+        lock = FileLock(
+            f"{cache_path}{DOWNLOAD_LOCK_SUFFIX}",
+            timeout=DOWNLOAD_LOCK_STALE_CHECK_INTERVAL,
+            delay=DOWNLOAD_LOCK_POLL_INTERVAL,
+        )
+        while True:
+            try:
+                lock.acquire()
+                break
+            except FileLockException:
+                self._break_stale_download_lock(lock.lockfile)
+        os.write(lock.fd, f"{socket.gethostname()} {os.getpid()}".encode())
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def _break_stale_download_lock(self, lockfile: str) -> None:
+        try:
+            lock_stat = os.stat(lockfile)
+            with open(lockfile) as fh:
+                owner = fh.read()
+        except FileNotFoundError:
+            # released in the meantime
+            return
+        if self._download_lock_is_stale(lock_stat.st_mtime, owner):
+            log.warning("Breaking stale lock '%s' of a download that did not complete", lockfile)
+            try:
+                # don't remove a lock that another waiter has broken and taken in the meantime
+                if os.stat(lockfile).st_ino == lock_stat.st_ino:
+                    os.unlink(lockfile)
+            except FileNotFoundError:
+                pass
+
+    def _download_lock_is_stale(self, lock_mtime: float, owner: str) -> bool:
+        """A lock is stale if its owner process on this host no longer exists.
+
+        Locks held by processes on other hosts, or whose owner hasn't been recorded, can't be
+        checked and are considered stale once they are older than ``download_lock_timeout``.
+        """
+        host, _, pid = owner.partition(" ")
+        if host == socket.gethostname() and pid.isdigit():
+            try:
+                os.kill(int(pid), 0)
+            except ProcessLookupError:
+                return True
+            except PermissionError:
+                pass
+            # the owner is still downloading, however long that takes
+            return False
+        return time.time() - lock_mtime > self.download_lock_timeout
+
     def _pull_into_cache(self, rel_path) -> bool:
         # Ensure the cache directory structure exists (e.g., dataset_#_files/)
         rel_path_dir = os.path.dirname(rel_path)
         if not os.path.exists(self._get_cache_path(rel_path_dir)):
             os.makedirs(self._get_cache_path(rel_path_dir), exist_ok=True)
-        # Now pull in the file
-        file_ok = self._download(rel_path)
-        if file_ok:
-            fix_permissions(self.config, self._get_cache_path(rel_path_dir))
-        else:
-            unlink(self._get_cache_path(rel_path), ignore_errors=True)
+        cache_path = self._get_cache_path(rel_path)
+        with self._download_lock(cache_path):
+            if self._cached_and_complete(rel_path):
+                # Pulled into the cache by a concurrent request while we were waiting for the lock
+                return True
+            # Now pull in the file, next to its final location so that it can be moved into place atomically
+            download_path = f"{cache_path}.{uuid.uuid4().hex}{DOWNLOAD_TMP_SUFFIX}"
+            try:
+                file_ok = self._download(rel_path, download_path)
+                if file_ok:
+                    os.replace(download_path, cache_path)
+            finally:
+                unlink(download_path, ignore_errors=True)
+            if file_ok:
+                fix_permissions(self.config, self._get_cache_path(rel_path_dir))
+                if self.cache_index:
+                    self.cache_index.add(cache_path)
         return file_ok
 
+    def _prefetch(self, obj, **kwargs):
+        if kwargs.get("dir_only", False):
+            return
+        rel_path = self._construct_path(obj, **kwargs)
+        if self._cached_and_complete(rel_path):
+            return
+        with self._prefetch_lock:
+            if rel_path in self._prefetching:
+                return
+            self._prefetching.add(rel_path)
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=PREFETCH_THREADS, thread_name_prefix=f"{self.store_type}-prefetch"
+                )
+        self._prefetch_executor.submit(self._prefetch_rel_path, rel_path)
+
+    def _prefetch_rel_path(self, rel_path: str) -> None:
+        try:
+            if not self._cached_and_complete(rel_path) and self._exists_remotely(rel_path):
+                log.debug("Prefetching '%s' into cache", rel_path)
+                self._pull_into_cache(rel_path)
+        except Exception:
+            log.exception("Failed to prefetch '%s' into cache", rel_path)
+        finally:
+            with self._prefetch_lock:
+                self._prefetching.discard(rel_path)
+
+    def _shutdown_prefetch(self) -> None:
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False)
+
     def _get_data(self, obj, start=0, count=-1, **kwargs):
         rel_path = self._construct_path(obj, **kwargs)
         # Check cache first and get file if not there
         if not self._in_cache(rel_path):
+            if 0 < count <= self.ranged_read_max_size:
+                # Small reads of uncached objects are served straight from the remote
+                # store, without materializing the whole object in the cache.
+                data = self._get_remote_range(rel_path, start, count)
+                if data is not None:
+                    # Drop a trailing partial multi-byte character instead of failing on it.
+                    return codecs.getincrementaldecoder("utf-8")(errors="replace").decode(data)
             self._pull_into_cache(rel_path)
+        elif self.cache_index:
+            self.cache_index.touch(self._get_cache_path(rel_path))
         # Read the file content from cache
         data_file = open(self._get_cache_path(rel_path))
         data_file.seek(start)
@@ -137,6 +298,14 @@ class CachingConcreteObjectStore(ConcreteObjectStore):
         data_file.close()
         return content
 
+    def _get_remote_range(self, rel_path: str, start: int, count: int) -> Optional[bytes]:
+        """Read ``count`` bytes starting at ``start`` from the remote object.
+
+        Returns ``None`` if the object store does not support ranged reads or the
+        read failed, in which case the whole object is pulled into the cache instead.
+        """
+        return None
+
     def _exists(self, obj, **kwargs):
         in_cache = exists_remotely = False
         rel_path = self._construct_path(obj, **kwargs)
@@ -212,6 +381,8 @@ class CachingConcreteObjectStore(ConcreteObjectStore):
         return True
 
     def _push_to_storage(self, rel_path, source_file=None, from_string=None):
+        if self.cache_index and os.path.exists(self._get_cache_path(rel_path)):
+            self.cache_index.add(self._get_cache_path(rel_path))
         source_file = source_file or self._get_cache_path(rel_path)
         if from_string is None and not os.path.exists(source_file):
             log.error(
@@ -289,13 +460,17 @@ class CachingConcreteObjectStore(ConcreteObjectStore):
         # For dir_only - the cache cleaning may have left empty directories so I think we need to
         # always resync the cache. Gotta make sure we're being judicious in out data.extra_files_path
         # calls I think.
-        if not dir_only and self._in_cache(rel_path) and os.path.getsize(self._get_cache_path(rel_path)) > 0:
+        if not dir_only and self._cached_and_complete(rel_path):
+            if self.cache_index:
+                self.cache_index.touch(cache_path)
             return cache_path
 
         # Check if the file exists in persistent storage and, if it does, pull it into cache
         elif self._exists(obj, **kwargs):
             if dir_only:
                 self._download_directory_into_cache(rel_path, cache_path)
+                if self.cache_index:
+                    self.cache_index.add_directory(cache_path)
                 return cache_path
             else:
                 if self._pull_into_cache(rel_path):
@@ -331,10 +506,14 @@ class CachingConcreteObjectStore(ConcreteObjectStore):
             # but requires iterating through each individual key in S3 and deleing it.
             if entire_dir and extra_dir:
                 shutil.rmtree(self._get_cache_path(rel_path), ignore_errors=True)
+                if self.cache_index:
+                    self.cache_index.remove_directory(self._get_cache_path(rel_path))
                 return self._delete_remote_all(rel_path)
             else:
                 # Delete from cache first
                 unlink(self._get_cache_path(rel_path), ignore_errors=True)
+                if self.cache_index:
+                    self.cache_index.remove(self._get_cache_path(rel_path))
                 # Delete from S3 as well
                 if self._exists_remotely(rel_path):
                     return self._delete_existing_remote(rel_path)
@@ -376,14 +555,23 @@ class CachingConcreteObjectStore(ConcreteObjectStore):
             self.staging_path,
             self.cache_size,
             0.9,
+            use_index=self.use_cache_index,
+            index_reconcile_interval=getattr(
+                self.config, "object_store_cache_index_reconcile_interval", DEFAULT_CACHE_INDEX_RECONCILE_INTERVAL
+            ),
         )
 
     def _shutdown_cache_monitor(self) -> None:
         self.cache_monitor and self.cache_monitor.shutdown()
+        self._shutdown_prefetch()
+        if self._cache_index is not None:
+            self._cache_index.flush_touches()
 
     def _start_cache_monitor_if_needed(self):
         if self.enable_cache_monitor:
-            self.cache_monitor = InProcessCacheMonitor(self.cache_target, self.cache_monitor_interval)
+            self.cache_monitor = InProcessCacheMonitor(
+                self.cache_target, self.cache_monitor_interval, cache_index=self.cache_index
+            )
 
     def _get_remote_size(self, rel_path: str) -> int:
         raise NotImplementedError()
@@ -391,7 +579,8 @@ class CachingConcreteObjectStore(ConcreteObjectStore):
     def _exists_remotely(self, rel_path: str) -> bool:
         raise NotImplementedError()
 
-    def _download(self, rel_path: str) -> bool:
+    def _download(self, rel_path: str, local_destination: str) -> bool:
+        """Download the remote object ``rel_path`` to the (temporary) path ``local_destination``."""
         raise NotImplementedError()
 
     # Do not need to override these if instead replacing _delete
@@ -238,8 +238,7 @@ class AzureBlobObjectStore(CachingConcreteObjectStore):
     def _blob_client(self, rel_path: str):
         return self.service.get_blob_client(self.container_name, rel_path)
 
-    def _download(self, rel_path):
-        local_destination = self._get_cache_path(rel_path)
+    def _download(self, rel_path, local_destination):
         try:
             log.debug("Pulling '%s' into cache to %s", rel_path, local_destination)
             if not self._caching_allowed(rel_path):
@@ -261,6 +260,13 @@ class AzureBlobObjectStore(CachingConcreteObjectStore):
         with open(local_destination, "wb") as f:
             self._blob_client(rel_path).download_blob().download_to_stream(f, **kwd)
 
+    def _get_remote_range(self, rel_path, start, count):
+        try:
+            return self._blob_client(rel_path).download_blob(offset=start, length=count).readall()
+        except AzureHttpError:
+            log.exception("Problem reading range of '%s' from Azure", rel_path)
+        return None
+
     def _download_directory_into_cache(self, rel_path, cache_path):
         blobs = self._blobs_from(rel_path)
         for blob in blobs:
@@ -3,10 +3,14 @@
 
 import logging
 import os
+import sqlite3
 import threading
 import time
+from contextlib import contextmanager
 from math import inf
 from typing import (
+    Dict,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -24,6 +28,13 @@ log = logging.getLogger(__name__)
 
 
 ONE_GIGA_BYTE = 1024 * 1024 * 1024
+CACHE_INDEX_FILENAME = ".galaxy_cache_index.sqlite"
+DEFAULT_CACHE_INDEX_RECONCILE_INTERVAL = 24 * 60 * 60
+# Maximum number of seconds recorded accesses to cached files are buffered before they are written to the index
+DEFAULT_CACHE_INDEX_TOUCH_FLUSH_INTERVAL = 60
+# Lock files guarding downloads of cache files are named <cache file>.galaxy_download.lock
+DOWNLOAD_LOCK_SUFFIX = ".galaxy_download"
+DOWNLOAD_TMP_SUFFIX = ".galaxy_download.tmp"
 
 
 FileListT = List[Tuple[time.struct_time, str, int]]
@@ -33,6 +44,8 @@ class CacheTarget(NamedTuple):
     path: str
     size: int  # cache size in gigabytes
     limit: float  # cache limit as a percent
+    use_index: bool = False  # track cache contents in a CacheIndex instead of walking the cache directory
+    index_reconcile_interval: int = DEFAULT_CACHE_INDEX_RECONCILE_INTERVAL  # seconds between index repairs
 
     def fits_in_cache(self, bytes: int) -> bool:
         # if we don't have a positive cache size - interpret it as an unbounded
@@ -54,8 +67,15 @@ def check_caches(targets: List[CacheTarget]):
         check_cache(target)
 
 
-def check_cache(cache_target: CacheTarget):
-    """Run a step of the cache monitor."""
+def check_cache(cache_target: CacheTarget, cache_index: Optional["CacheIndex"] = None):
+    """Run a step of the cache monitor.
+
+    ``cache_index`` is the index used by the object store owning the cache, if any, its
+    buffered file accesses are written to the index before the cache is cleaned.
+    """
+    if cache_target.use_index:
+        _check_cache_with_index(cache_target, cache_index)
+        return
     total_size, file_list = _get_cache_size_files(cache_target.path)
     # Sort the file list (based on access time)
     file_list.sort()
@@ -77,9 +97,29 @@ def check_cache(cache_target: CacheTarget):
         _clean_cache(file_list, delete_this_much)
 
 
+def _check_cache_with_index(cache_target: CacheTarget, index: Optional["CacheIndex"] = None):
+    if index is None:
+        index = CacheIndex(cache_target.path)
+    else:
+        index.flush_touches()
+    if time.time() - index.last_reconcile > cache_target.index_reconcile_interval:
+        index.reconcile()
+    total_size = index.total_size
+    cache_limit = cache_target.size * ONE_GIGA_BYTE * cache_target.limit
+    if total_size > cache_limit:
+        log.debug(
+            "Initiating cache cleaning: current cache size: %s; clean until smaller than: %s",
+            nice_size(total_size),
+            nice_size(cache_limit),
+        )
+        _clean_cache_with_index(index, total_size - cache_limit)
+
+
 def reset_cache(cache_target: CacheTarget):
     _, file_list = _get_cache_size_files(cache_target.path)
     _clean_cache(file_list, inf)
+    if cache_target.use_index:
+        CacheIndex(cache_target.path).clear()
 
 
 def _clean_cache(file_list: FileListT, delete_this_much: float) -> None:
@@ -106,6 +146,25 @@ def _clean_cache(file_list: FileListT, delete_this_much: float) -> None:
             return
 
 
+def _clean_cache_with_index(index: "CacheIndex", delete_this_much: float) -> None:
+    """Delete least recently used files tracked by ``index`` until the size of the deleted
+    files is greater than ``delete_this_much`` bytes.
+    """
+    deleted_amount = 0
+    deleted_paths = []
+    for path, size in index.least_recently_used():
+        if deleted_amount >= delete_this_much:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        deleted_amount += size
+        deleted_paths.append(path)
+    index.remove(*deleted_paths)
+    log.debug("Cache cleaning done. Total space freed: %s", nice_size(deleted_amount))
+
+
 def _get_cache_size_files(cache_path) -> Tuple[int, FileListT]:
     """Returns cache size and cache files.
 
@@ -116,6 +175,8 @@ def _get_cache_size_files(cache_path) -> Tuple[int, FileListT]:
 
     for dirpath, _, filenames in os.walk(cache_path):
         for filename in filenames:
+            if _is_bookkeeping_file(filename):
+                continue
             file_path = os.path.join(dirpath, filename)
             file_size = os.path.getsize(file_path)
             cache_size += file_size
@@ -127,6 +188,217 @@ def _get_cache_size_files(cache_path) -> Tuple[int, FileListT]:
     return cache_size, file_list
 
 
+def _is_bookkeeping_file(filename: str) -> bool:
+    """Files Galaxy keeps in the cache directory, including downloads in progress, that must never be evicted."""
+    return (
+        filename.startswith(CACHE_INDEX_FILENAME)
+        or filename.endswith(f"{DOWNLOAD_LOCK_SUFFIX}.lock")
+        or filename.endswith(DOWNLOAD_TMP_SUFFIX)
+    )
+
+
+class CacheIndex:
+    """Keep track of the files in an object store cache directory and their sizes and
+    access times in a SQLite database stored in the cache directory, so that the cache
+    size is known and cache cleaning can evict least recently used files without walking
+    the (potentially huge) cache directory.
+
+    The index is updated by the caching object stores whenever files are pulled into or
+    removed from the cache. Files that end up in the cache by other means are picked up
+    by :meth:`reconcile`, which the cache monitor runs periodically.
+
+    Accesses to cached files are buffered in memory and written to the index in batches
+    (see :meth:`touch`), so that reading from the cache does not write to the index.
+    """
+
+    def __init__(self, cache_path: str, touch_flush_interval: float = DEFAULT_CACHE_INDEX_TOUCH_FLUSH_INTERVAL):
+        self.cache_path = os.path.abspath(cache_path)
+        self.index_path = os.path.join(self.cache_path, CACHE_INDEX_FILENAME)
+        self.touch_flush_interval = touch_flush_interval
+        # absolute path -> time of the last access not yet written to the index
+        self._touched: Dict[str, float] = {}
+        self._touched_lock = threading.Lock()
+        self._last_touch_flush = time.time()
+        conn = sqlite3.connect(self.index_path, timeout=60, isolation_level=None)
+        try:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entry (
+                    path TEXT PRIMARY KEY, size INTEGER NOT NULL, last_access REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS ix_cache_entry_last_access ON cache_entry (last_access);
+                CREATE TABLE IF NOT EXISTS cache_stat (key TEXT PRIMARY KEY, value REAL NOT NULL);
+                INSERT OR IGNORE INTO cache_stat (key, value) VALUES ('total_size', 0), ('last_reconcile', 0);
+                CREATE TRIGGER IF NOT EXISTS cache_entry_insert AFTER INSERT ON cache_entry BEGIN
+                    UPDATE cache_stat SET value = value + NEW.size WHERE key = 'total_size';
+                END;
+                CREATE TRIGGER IF NOT EXISTS cache_entry_delete AFTER DELETE ON cache_entry BEGIN
+                    UPDATE cache_stat SET value = value - OLD.size WHERE key = 'total_size';
+                END;
+                CREATE TRIGGER IF NOT EXISTS cache_entry_update AFTER UPDATE OF size ON cache_entry BEGIN
+                    UPDATE cache_stat SET value = value - OLD.size + NEW.size WHERE key = 'total_size';
+                END;
+                """
+            )
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self, write: bool = True) -> Iterator[sqlite3.Connection]:
+        # The cache may be shared by many Galaxy processes, use a short lived connection per operation.
+        conn = sqlite3.connect(self.index_path, timeout=60, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def _relpath(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.cache_path)
+
+    def _get_stat(self, key: str) -> float:
+        with self._transaction(write=False) as conn:
+            return conn.execute("SELECT value FROM cache_stat WHERE key = ?", (key,)).fetchone()[0]
+
+    @property
+    def total_size(self) -> int:
+        """Total size in bytes of all tracked files."""
+        return int(self._get_stat("total_size"))
+
+    @property
+    def last_reconcile(self) -> float:
+        return self._get_stat("last_reconcile")
+
+    def add(self, *paths: str) -> None:
+        """Record that the given files are in the cache (or were updated) and were just accessed."""
+        now = time.time()
+        entries = []
+        for path in paths:
+            if _is_bookkeeping_file(os.path.basename(path)):
+                continue
+            try:
+                entries.append((self._relpath(path), os.path.getsize(path), now))
+            except OSError:
+                continue
+        if entries:
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT INTO cache_entry (path, size, last_access) VALUES (?, ?, ?) "
+                    "ON CONFLICT (path) DO UPDATE SET size = excluded.size, last_access = excluded.last_access",
+                    entries,
+                )
+
+    def add_directory(self, path: str) -> None:
+        """Record all files below the given cache directory."""
+        self.add(*(os.path.join(dirpath, f) for dirpath, _, filenames in os.walk(path) for f in filenames))
+
+    def touch(self, path: str) -> None:
+        """Record an access to a cached file, adding it to the index if it is not tracked yet.
+
+        The access is only buffered, buffered accesses are written to the index by
+        :meth:`flush_touches` once they are older than ``touch_flush_interval`` seconds
+        or when the cache monitor runs.
+        """
+        now = time.time()
+        with self._touched_lock:
+            self._touched[path] = now
+            flush = now - self._last_touch_flush >= self.touch_flush_interval
+        if flush:
+            self.flush_touches()
+
+    def flush_touches(self) -> None:
+        """Write buffered accesses to cached files to the index in one transaction."""
+        with self._touched_lock:
+            touched, self._touched = self._touched, {}
+            self._last_touch_flush = time.time()
+        entries = []
+        for path, last_access in touched.items():
+            try:
+                entries.append((self._relpath(path), os.path.getsize(path), last_access))
+            except OSError:
+                # evicted in the meantime
+                continue
+        if entries:
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT INTO cache_entry (path, size, last_access) VALUES (?, ?, ?) "
+                    "ON CONFLICT (path) DO UPDATE SET last_access = max(last_access, excluded.last_access)",
+                    entries,
+                )
+
+    def remove(self, *paths: str) -> None:
+        if paths:
+            with self._touched_lock:
+                for path in paths:
+                    self._touched.pop(path, None)
+            with self._transaction() as conn:
+                conn.executemany("DELETE FROM cache_entry WHERE path = ?", ((self._relpath(p),) for p in paths))
+
+    def remove_directory(self, path: str) -> None:
+        """Forget about all files below the given cache directory."""
+        prefix = os.path.join(self._relpath(path), "")
+        with self._transaction() as conn:
+            # path range instead of LIKE so that the primary key index can be used
+            conn.execute(
+                "DELETE FROM cache_entry WHERE path >= ? AND path < ?", (prefix, prefix[:-1] + chr(ord(os.sep) + 1))
+            )
+
+    def least_recently_used(self, batch_size: int = 1000) -> Iterator[Tuple[str, int]]:
+        """Iterate over (absolute path, size) of tracked files, least recently used first."""
+        last: Tuple[float, str] = (-inf, "")
+        while True:
+            with self._transaction(write=False) as conn:
+                rows = conn.execute(
+                    "SELECT last_access, path, size FROM cache_entry WHERE (last_access, path) > (?, ?) "
+                    "ORDER BY last_access, path LIMIT ?",
+                    (*last, batch_size),
+                ).fetchall()
+            for _last_access, path, size in rows:
+                yield os.path.join(self.cache_path, path), size
+            if len(rows) < batch_size:
+                return
+            last = rows[-1][0], rows[-1][1]
+
+    def clear(self) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM cache_entry")
+
+    def reconcile(self) -> int:
+        """Rebuild the index from the files actually present in the cache directory.
+
+        Returns the difference in bytes between the tracked and the actual cache size.
+        """
+        tracked_size = self.total_size
+        cache_size, file_list = _get_cache_size_files(self.cache_path)
+        entries = ((self._relpath(path), size, time.mktime(atime)) for atime, path, size in file_list)
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM cache_entry")
+            conn.executemany("INSERT INTO cache_entry (path, size, last_access) VALUES (?, ?, ?)", entries)
+            conn.execute("UPDATE cache_stat SET value = ? WHERE key = 'last_reconcile'", (time.time(),))
+        drift = tracked_size - cache_size
+        log.info(
+            "Reconciled cache index for %s: %d files, %s (index was off by %s bytes)",
+            self.cache_path,
+            len(file_list),
+            nice_size(cache_size),
+            drift,
+        )
+        return drift
+
+
+def cache_index_enabled(config, config_dict) -> bool:
+    cache_config_dict = config_dict.get("cache") or {}
+    use_index = cache_config_dict.get("index")
+    if use_index is None:
+        use_index = getattr(config, "object_store_cache_index", False)
+    return string_as_bool(use_index)
+
+
 def parse_caching_config_dict_from_xml(config_xml):
     cache_els = config_xml.findall("cache")
     if len(cache_els) > 0:
@@ -135,6 +407,7 @@ def parse_caching_config_dict_from_xml(config_xml):
         staging_path = c_xml.get("path", None)
         monitor = c_xml.get("monitor", "auto")
         cache_updated_data = string_as_bool(c_xml.get("cache_updated_data", "True"))
+        use_index = c_xml.get("index", None)
 
         cache_dict = {
             "size": cache_size,
@@ -142,6 +415,8 @@ def parse_caching_config_dict_from_xml(config_xml):
             "monitor": monitor,
             "cache_updated_data": cache_updated_data,
         }
+        if use_index is not None:
+            cache_dict["index"] = string_as_bool(use_index)
     else:
         cache_dict = {}
     return cache_dict
@@ -177,7 +452,13 @@ def enable_cache_monitor(config, config_dict) -> Tuple[bool, int]:
 
 
 class InProcessCacheMonitor:
-    def __init__(self, cache_target: CacheTarget, interval: int = 30, initial_sleep: Optional[int] = 2):
+    def __init__(
+        self,
+        cache_target: CacheTarget,
+        interval: int = 30,
+        initial_sleep: Optional[int] = 2,
+        cache_index: Optional[CacheIndex] = None,
+    ):
         # This Event object is initialized to False
         # It is set to True in shutdown(), causing
         # the cache monitor thread to return/terminate
@@ -186,6 +467,7 @@ class InProcessCacheMonitor:
         self.sleeper = Sleeper()
 
         self.cache_target = cache_target
+        self.cache_index = cache_index
         self.interval = interval
         self.initial_sleep = initial_sleep
 
@@ -201,7 +483,7 @@ class InProcessCacheMonitor:
                 self.initial_sleep
             )  # startup sleep hack - probably originally implemented to prevent contention at app startup
         while not self.stop_cache_monitor_event.is_set():
-            check_cache(self.cache_target)
+            check_cache(self.cache_target, self.cache_index)
             self.sleeper.sleep(self.interval)
 
     def shutdown(self):
@@ -6,6 +6,9 @@ import logging
 import os
 import os.path
 
+import requests
+
+from galaxy.util import DEFAULT_SOCKET_TIMEOUT
 from ._caching_base import CachingConcreteObjectStore
 from ._util import UsesAxel
 from .caching import enable_cache_monitor
@@ -248,8 +251,7 @@ class Cloud(CachingConcreteObjectStore, UsesAxel):
             return False
         return exists
 
-    def _download(self, rel_path):
-        local_destination = self._get_cache_path(rel_path)
+    def _download(self, rel_path, local_destination):
         try:
             log.debug("Pulling key '%s' into cache to %s", rel_path, local_destination)
             key = self.bucket.objects.get(rel_path)
@@ -263,6 +265,23 @@ class Cloud(CachingConcreteObjectStore, UsesAxel):
             log.exception("Problem downloading key '%s' from S3 bucket '%s'", rel_path, self.bucket.name)
         return False
 
+    def _get_remote_range(self, rel_path, start, count):
+        # CloudBridge has no ranged download, use an HTTP range request against a signed URL.
+        try:
+            url = self.bucket.objects.get(rel_path).generate_url(expires_in=300)
+            headers = {"Range": f"bytes={start}-{start + count - 1}"}
+            with requests.get(url, headers=headers, stream=True, timeout=DEFAULT_SOCKET_TIMEOUT) as response:
+                if response.status_code == 416:
+                    # start is past the end of the object
+                    return b""
+                if response.status_code != 206:
+                    # Range not honored, don't stream the whole object into memory
+                    return None
+                return response.content
+        except Exception:
+            log.exception("Problem reading range of key '%s' from bucket '%s'", rel_path, self.bucket.name)
+        return None
+
     def _download_directory_into_cache(self, rel_path, cache_path):
         # List objects in the specified cloud folder
         objects = self.bucket.objects.list(prefix=rel_path)
@@ -345,9 +345,8 @@ class IRODSObjectStore(CachingConcreteObjectStore):
         finally:
             log.debug("irods_pt _exists_remotely: %s", ipt_timer)
 
-    def _download(self, rel_path):
+    def _download(self, rel_path, cache_path):
         ipt_timer = ExecutionTimer()
-        cache_path = self._get_cache_path(rel_path)
         log.debug("Pulling data object '%s' into cache to %s", rel_path, cache_path)
 
         p = Path(rel_path)
@@ -371,6 +370,31 @@ class IRODSObjectStore(CachingConcreteObjectStore):
         finally:
             log.debug("irods_pt _download: %s", ipt_timer)
 
+    def _get_remote_range(self, rel_path, start, count):
+        ipt_timer = ExecutionTimer()
+        p = Path(rel_path)
+        data_object_name = p.stem + p.suffix
+        subcollection_name = p.parent
+
+        collection_path = f"{self.home}/{subcollection_name}"
+        data_object_path = f"{collection_path}/{data_object_name}"
+        options = {kw.DEST_RESC_NAME_KW: self.resource}
+
+        try:
+            data_obj = self.session.data_objects.get(data_object_path, **options)
+            with data_obj.open("r") as data_obj_fp:
+                data_obj_fp.seek(start)
+                return data_obj_fp.read(count)
+        except (DataObjectDoesNotExist, CollectionDoesNotExist):
+            log.warning("Collection or data object (%s) does not exist", data_object_path)
+            return None
+        except Exception:
+            # fall back to pulling the whole object into the cache
+            log.exception("Failed to read range of data object (%s)", data_object_path)
+            return None
+        finally:
+            log.debug("irods_pt _get_remote_range: %s", ipt_timer)
+
     def _push_to_storage(self, rel_path, source_file=None, from_string=None):
         """
         Push the file pointed to by ``rel_path`` to the iRODS. Extract folder name
@@ -180,10 +180,8 @@ class OnedataObjectStore(CachingConcreteObjectStore):
                 log.exception("Trouble checking '%s' existence in Onedata", rel_path)
                 return False
 
-    def _download(self, rel_path):
+    def _download(self, rel_path, dst_path):
         try:
-            dst_path = self._get_cache_path(rel_path)
-
             log.debug("Pulling file '%s' into cache to %s", rel_path, dst_path)
 
             onedata_path = self._construct_onedata_path(rel_path)
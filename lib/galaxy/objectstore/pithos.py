@@ -143,9 +143,9 @@ class PithosObjectStore(CachingConcreteObjectStore):
         if project and c.get("x-container-policy-project") != project:
             self.pithos.reassign_container(project)
 
-    def _download(self, rel_path):
-        local_destination = self._get_cache_path(rel_path)
+    def _download(self, rel_path, local_destination):
         self.pithos.download_object(rel_path, local_destination)
+        return True
 
     # No need to overwrite "shutdown"
 
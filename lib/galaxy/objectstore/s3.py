@@ -301,8 +301,7 @@ class S3ObjectStore(CachingConcreteObjectStore, CloudConfigMixin, UsesAxel):
     def _transfer_cb(self, complete, total):
         self.transfer_progress += 10
 
-    def _download(self, rel_path):
-        local_destination = self._get_cache_path(rel_path)
+    def _download(self, rel_path, local_destination):
         try:
             log.debug("Pulling key '%s' into cache to %s", rel_path, local_destination)
             key = self._bucket.get_key(rel_path)
@@ -326,6 +325,19 @@ class S3ObjectStore(CachingConcreteObjectStore, CloudConfigMixin, UsesAxel):
             log.exception("Problem downloading key '%s' from S3 bucket '%s'", rel_path, self._bucket.name)
         return False
 
+    def _get_remote_range(self, rel_path, start, count):
+        try:
+            key = self._bucket.get_key(rel_path)
+            if key is None:
+                return None
+            return key.get_contents_as_string(headers={"Range": f"bytes={start}-{start + count - 1}"})
+        except S3ResponseError as e:
+            if e.status == 416:
+                # start is past the end of the key
+                return b""
+            log.exception("Problem reading range of key '%s' from S3 bucket '%s'", rel_path, self._bucket.name)
+        return None
+
     def _push_to_storage(self, rel_path, source_file=None, from_string=None):
         """
         Push the file pointed to by ``rel_path`` to the object store naming the key
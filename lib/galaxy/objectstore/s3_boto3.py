@@ -7,6 +7,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Optional,
     TYPE_CHECKING,
 )
 
@@ -314,8 +315,7 @@ class S3ObjectStore(CachingConcreteObjectStore):
                 return False
             raise
 
-    def _download(self, rel_path: str) -> bool:
-        local_destination = self._get_cache_path(rel_path)
+    def _download(self, rel_path: str, local_destination: str) -> bool:
         try:
             log.debug("Pulling key '%s' into cache to %s", rel_path, local_destination)
             if not self._caching_allowed(rel_path):
@@ -327,6 +327,19 @@ class S3ObjectStore(CachingConcreteObjectStore):
             log.exception("Failed to download file from S3")
         return False
 
+    def _get_remote_range(self, rel_path: str, start: int, count: int) -> Optional[bytes]:
+        try:
+            response = self._client.get_object(
+                Bucket=self.bucket, Key=rel_path, Range=f"bytes={start}-{start + count - 1}"
+            )
+            return response["Body"].read()
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "InvalidRange":
+                # start is past the end of the object
+                return b""
+            log.exception("Failed to read range of '%s' from S3", rel_path)
+        return None
+
     def _push_string_to_path(self, rel_path: str, from_string: str) -> bool:
         try:
             self._client.put_object(Body=from_string.encode("utf-8"), Bucket=self.bucket, Key=rel_path)
@@ -220,7 +220,8 @@ def recalculate_user_disk_usage(app, **kwargs):
     if user_id := kwargs.get("user_id", None):
         user = sa_session.get(User, user_id)
         if user:
-            user.calculate_and_set_disk_usage(app.object_store)
+            if drift := user.reconcile_disk_usage(app.object_store):
+                log.info("Corrected disk usage drift (recorded minus calculated bytes) of user %s: %s", user_id, drift)
         else:
             log.error(f"Recalculate user disk usage task failed, user {user_id} not found")
     else:
@@ -291,6 +292,16 @@ def job_rule_modules(app):
     return rules_module_list
 
 
+def job_inputs_ready(app, **kwargs):
+    dataset_ids = kwargs.get("dataset_ids")
+    job_ids = kwargs.get("job_ids")
+    if dataset_ids:
+        app.job_manager.job_handler.job_queue.notify_inputs_ready(dataset_ids)
+    workflow_scheduling_manager = getattr(app, "workflow_scheduling_manager", None)
+    if workflow_scheduling_manager:
+        workflow_scheduling_manager.dependencies_finished(job_ids=job_ids, dataset_ids=dataset_ids)
+
+
 def admin_job_lock(app, **kwargs):
     job_lock = kwargs.get("job_lock", False)
     # job_queue is exposed in the root app, but this will be 'fixed' at some
@@ -308,6 +319,7 @@ control_message_to_task = {
     "reload_tool_data_tables": reload_tool_data_tables,
     "reload_job_rules": reload_job_rules,
     "admin_job_lock": admin_job_lock,
+    "job_inputs_ready": job_inputs_ready,
     "reload_sanitize_allowlist": reload_sanitize_allowlist,
     "recalculate_user_disk_usage": recalculate_user_disk_usage,
     "rebuild_toolbox_search_index": rebuild_toolbox_search_index,
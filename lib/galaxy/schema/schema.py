@@ -1151,6 +1151,33 @@ class EncodedHistoryContentItem(HistoryContentItemBase):
     id: EncodedDatabaseIdField
 
 
+class HistoryContentChange(EncodedHistoryContentItem):
+    """A dataset or collection that changed in a History."""
+
+    hid: int = Field(
+        ...,
+        title="HID",
+        description="The index position of this item in the History.",
+    )
+    update_time: datetime = UpdateTimeField
+
+
+class HistoryChanges(Model):
+    """The contents of a History that changed since a given time."""
+
+    id: HistoryID
+    update_time: datetime = Field(
+        ...,
+        title="Update Time",
+        description="The last time the History was modified, pass it as `since` to wait for the next change.",
+    )
+    items: List[HistoryContentChange] = Field(
+        ...,
+        title="Items",
+        description="The datasets and collections of the History that changed.",
+    )
+
+
 class UpdateContentItem(HistoryContentItem):
     """Used for updating a particular history item. All fields are optional."""
 
@@ -1668,6 +1695,7 @@ class ModelStoreFormat(str, Enum):
     TGZ = "tgz"
     TAR = "tar"
     TAR_DOT_GZ = "tar.gz"
+    ZIP = "zip"
     BAG_DOT_ZIP = "bag.zip"
     BAG_DOT_TAR = "bag.tar"
     BAG_DOT_TGZ = "bag.tgz"
@@ -1676,7 +1704,7 @@ class ModelStoreFormat(str, Enum):
 
     @classmethod
     def is_compressed(cls, value: "ModelStoreFormat"):
-        return value in [cls.TAR_DOT_GZ, cls.TGZ, cls.TAR, cls.ROCRATE_ZIP]
+        return value in [cls.TAR_DOT_GZ, cls.TGZ, cls.TAR, cls.ZIP, cls.ROCRATE_ZIP]
 
     @classmethod
     def is_bag(cls, value: "ModelStoreFormat"):
@@ -21,6 +21,7 @@ from galaxy.model.base import (
     SharedModelMapping,
 )
 from galaxy.model.mapping import GalaxyModelMapping
+from galaxy.model.orm.engine_factory import QueryFingerprintStats
 from galaxy.model.security import (
     GalaxyRBACAgent,
     HostAgent,
@@ -123,6 +124,7 @@ class MinimalManagerApp(MinimalApp):
     notification_manager: Any  # 'galaxy.managers.notification.NotificationManager'
     object_store: BaseObjectStore
     tool_shed_registry: ToolShedRegistry
+    query_fingerprint_stats: QueryFingerprintStats
 
     @property
     @abc.abstractmethod
@@ -270,6 +270,14 @@ class ToolDataTable(Dictifiable):
     def is_current_version(self, other_version):
         return self._loaded_content_version == other_version
 
+    def get_content_version(self) -> Tuple[int, int]:
+        """Return a key that changes whenever the loaded entries change.
+
+        Entries read from index files that are found after the table was configured don't
+        increment the version, so the number of entries is part of the key.
+        """
+        return (self._loaded_content_version, len(self.data))
+
     def merge_tool_data_table(
         self,
         other_table: "ToolDataTable",
@@ -310,6 +318,10 @@ class TabularToolDataTable(ToolDataTable):
 
     type_key = "tabular"
 
+    # per column indexes of entries by field value, built lazily for the content version they were built for
+    _indexes: Dict[int, Dict[str, List[List[str]]]]
+    _indexes_version: Optional[Tuple[int, int]] = None
+
     def __init__(
         self,
         config_element: Element,
@@ -493,26 +505,25 @@ class TabularToolDataTable(ToolDataTable):
 
     def get_field(self, value):
         rval = None
-        for i in self.get_named_fields_list():
-            if i["value"] == value:
-                rval = TabularToolDataField(i)
+        if entries := self._get_index(self.columns["value"]).get(value):
+            rval = TabularToolDataField(self._get_named_fields(entries[-1], self.get_column_name_list()))
         return rval
 
     # This method is used in tools, so need to keep its API stable
     def get_named_fields_list(self) -> List[Dict[Union[str, int], str]]:
-        rval = []
         named_columns = self.get_column_name_list()
-        for fields in self.get_fields():
-            field_dict = {}
-            for i, field in enumerate(fields):
-                if i == len(named_columns):
-                    break
-                field_name: Optional[Union[str, int]] = named_columns[i]
-                if field_name is None:
-                    field_name = i  # check that this is supposed to be 0 based.
-                field_dict[field_name] = field
-            rval.append(field_dict)
-        return rval
+        return [self._get_named_fields(fields, named_columns) for fields in self.get_fields()]
+
+    def _get_named_fields(self, fields: List[str], named_columns: List[Union[str, None]]) -> Dict[Union[str, int], str]:
+        field_dict: Dict[Union[str, int], str] = {}
+        for i, field in enumerate(fields):
+            if i == len(named_columns):
+                break
+            field_name: Optional[Union[str, int]] = named_columns[i]
+            if field_name is None:
+                field_name = i  # check that this is supposed to be 0 based.
+            field_dict[field_name] = field
+        return field_dict
 
     def get_version_fields(self):
         return (self._loaded_content_version, self.get_fields())
@@ -628,19 +639,39 @@ class TabularToolDataTable(ToolDataTable):
                 return []
         rval = []
         # Look for table entry.
-        for fields in self.get_fields():
-            if fields[query_col] == query_val:
-                if return_attr is None:
-                    field_dict = {}
-                    for i, col_name in enumerate(self.get_column_name_list()):
-                        field_dict[col_name or i] = fields[i]
-                    rval.append(field_dict)
-                else:
-                    rval.append(fields[return_col])
-                if limit is not None and len(rval) == limit:
-                    break
+        try:
+            entries = self._get_index(query_col).get(query_val, [])
+        except TypeError:
+            # unhashable query value, can't match any field
+            return []
+        column_names = self.get_column_name_list() if return_attr is None else []
+        for fields in entries:
+            if return_attr is None:
+                field_dict = {}
+                for i, col_name in enumerate(column_names):
+                    field_dict[col_name or i] = fields[i]
+                rval.append(field_dict)
+            else:
+                rval.append(fields[return_col])
+            if limit is not None and len(rval) == limit:
+                break
         return rval
 
+    def _get_index(self, column: int) -> Dict[str, List[List[str]]]:
+        """Return the entries of the table keyed by the value of ``column``, in table order."""
+        content_version = self.get_content_version()
+        if self._indexes_version != content_version:
+            self._indexes = {}
+            self._indexes_version = content_version
+        indexes = self._indexes
+        index = indexes.get(column)
+        if index is None:
+            index = {}
+            for fields in self.data:
+                index.setdefault(fields[column], []).append(fields)
+            indexes[column] = index
+        return index
+
     # This method is used in tools, so need to keep its API stable
     def get_filename_for_source(self, source: EntrySource, default: Optional[str] = None) -> Optional[str]:
         source_repo_info: Optional[dict] = None
@@ -1960,6 +1960,7 @@ class Tool(Dictifiable):
         preferred_object_store_id=None,
         flush_job=True,
         skip=False,
+        bulk=False,
     ):
         """
         Return a pair with whether execution is successful as well as either
@@ -1979,6 +1980,7 @@ class Tool(Dictifiable):
                 preferred_object_store_id=preferred_object_store_id,
                 flush_job=flush_job,
                 skip=skip,
+                bulk=bulk,
             )
             job = rval[0]
             out_data = rval[1]
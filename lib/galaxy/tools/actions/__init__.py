@@ -8,6 +8,7 @@ from typing import (
     Any,
     cast,
     Dict,
+    Iterable,
     List,
     Set,
     TYPE_CHECKING,
@@ -15,6 +16,8 @@ from typing import (
 )
 
 from packaging.version import Version
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from galaxy import model
 from galaxy.exceptions import (
@@ -24,6 +27,7 @@ from galaxy.exceptions import (
 from galaxy.job_execution.actions.post import ActionBox
 from galaxy.managers.context import ProvidesHistoryContext
 from galaxy.model import (
+    Dataset,
     HistoryDatasetAssociation,
     Job,
     LibraryDatasetDatasetAssociation,
@@ -44,7 +48,10 @@ from galaxy.tools.parameters.wrapped import (
     LegacyUnprefixedDict,
     WrappedParameters,
 )
-from galaxy.util import ExecutionTimer
+from galaxy.util import (
+    chunk_iterable,
+    ExecutionTimer,
+)
 from galaxy.util.template import fill_template
 
 if TYPE_CHECKING:
@@ -64,6 +71,17 @@ class ToolExecutionCache:
         self.current_user_roles = trans.get_current_user_roles()
         self.chrom_info = {}
         self.cached_collection_elements = {}
+        self.datasets: Dict[int, Dataset] = {}
+
+    def prefetch_datasets(self, dataset_ids: Iterable[int]):
+        """Load datasets and their permissions with a few queries, instead of lazy loading them one by one
+        while checking access to the inputs of each job."""
+        missing = sorted({dataset_id for dataset_id in dataset_ids if dataset_id not in self.datasets})
+        for ids in chunk_iterable(missing):
+            stmt = select(Dataset).where(Dataset.id.in_(ids)).options(selectinload(Dataset.actions))
+            for dataset in self.trans.sa_session.scalars(stmt):
+                # keep a reference, the session's identity map only holds weak references
+                self.datasets[dataset.id] = dataset
 
     def get_chrom_info(self, tool_id, input_dbkey):
         genome_builds = self.trans.app.genome_builds
@@ -97,6 +115,8 @@ class DefaultToolAction(ToolAction):
     """Default tool action is to run an external command"""
 
     produces_real_jobs = True
+    # Whether ``galaxy.tools.execute.execute`` may create the jobs of a large batch in bulk mode
+    supports_bulk_execution = True
 
     def _collect_input_datasets(
         self,
@@ -403,16 +423,28 @@ class DefaultToolAction(ToolAction):
         preferred_object_store_id=None,
         flush_job=True,
         skip=False,
+        bulk=False,
     ):
         """
         Executes a tool, creating job and tool outputs, associating them, and
         submitting the job to the job queue. If history is not specified, use
         trans.history as destination for tool's output datasets.
+
+        If ``bulk`` is set, outputs are staged in the history but not added,
+        the caller needs to call ``history.add_pending_items()`` once all jobs
+        have been created.
         """
         trans.check_user_activation()
         incoming = incoming or {}
         self._check_access(tool, trans)
         app = trans.app
+        fingerprint = None
+        if app.config.job_cache_fingerprints and not completed_job:
+            # Computed before ``incoming`` gets extended with the job's outputs and internal parameters,
+            # the inputs are identified from the objects in ``incoming`` without querying the database.
+            fingerprint = tool.job_search.fingerprint(
+                tool.id, tool.version, tool.params_to_strings(incoming, app, nested=True), incoming
+            )
         if execution_cache is None:
             execution_cache = ToolExecutionCache(trans)
         current_user_roles = execution_cache.current_user_roles
@@ -669,7 +701,8 @@ class DefaultToolAction(ToolAction):
             if name not in incoming and name not in child_dataset_names:
                 # don't add already existing datasets, i.e. async created
                 history.stage_addition(data)
-        history.add_pending_items(set_output_hid=set_output_hid)
+        if not bulk:
+            history.add_pending_items(set_output_hid=set_output_hid)
 
         log.info(add_datasets_timer)
         job_setup_timer = ExecutionTimer()
@@ -685,6 +718,7 @@ class DefaultToolAction(ToolAction):
             for data in out_data.values():
                 data.set_skipped(object_store_populator)
         job.preferred_object_store_id = preferred_object_store_id
+        job.fingerprint = fingerprint
         self._record_inputs(trans, tool, job, incoming, inp_data, inp_dataset_collections)
         self._record_outputs(job, out_data, output_collections)
         # execute immediate post job actions and associate post job actions that are to be executed after the job is complete
@@ -9,6 +9,8 @@ log = logging.getLogger(__name__)
 class DataManagerToolAction(DefaultToolAction):
     """Tool action used for Data Manager Tools"""
 
+    supports_bulk_execution = False
+
     def execute(self, tool, trans, **kwds):
         rval = super().execute(tool, trans, **kwds)
         if isinstance(rval, tuple) and len(rval) >= 2 and isinstance(rval[0], trans.app.model.Job):
@@ -131,6 +131,8 @@ class SetMetadataToolAction(ToolAction):
             include_command=False,
             max_metadata_value_size=app.config.max_metadata_value_size,
             max_discovered_files=app.config.max_discovered_files,
+            metadata_threads=app.config.metadata_threads,
+            metadata_cache_dir=app.config.metadata_cache_dir,
             validate_outputs=validate_outputs,
             job=job,
             kwds={"overwrite": overwrite},
@@ -8,6 +8,7 @@ import collections
 import logging
 import typing
 from abc import abstractmethod
+from contextlib import nullcontext
 from typing import (
     Any,
     Callable,
@@ -15,6 +16,7 @@ from typing import (
     List,
     NamedTuple,
     Optional,
+    Set,
 )
 
 from boltons.iterutils import remap
@@ -95,7 +97,7 @@ def execute(
         )
     execution_cache = ToolExecutionCache(trans)
 
-    def execute_single_job(execution_slice, completed_job, skip=False):
+    def execute_single_job(execution_slice, completed_job, skip=False, bulk=False):
         job_timer = tool.app.execution_timer_factory.get_timer(
             "internals.galaxy.tools.execute.job_single", SINGLE_EXECUTION_SUCCESS_MESSAGE
         )
@@ -128,6 +130,7 @@ def execute(
             preferred_object_store_id=preferred_object_store_id,
             flush_job=False,
             skip=skip,
+            bulk=bulk,
         )
         if job:
             log.debug(job_timer.to_str(tool_id=tool.id, job_id=job.id))
@@ -160,21 +163,39 @@ def execute(
     execution_tracker.ensure_implicit_collections_populated(history, mapping_params.param_template)
     job_count = len(execution_tracker.param_combinations)
 
+    bulk_threshold = tool.app.config.bulk_job_creation_threshold
+    bulk = (
+        bulk_threshold > 0
+        and job_count >= bulk_threshold
+        and rerun_remap_job_id is None
+        and getattr(tool_action, "supports_bulk_execution", False)
+    )
+    if bulk:
+        # Check access to all inputs with a few queries and add the outputs of all jobs to their histories
+        # at once, without autoflush the new objects are then inserted in batches when committing below.
+        execution_cache.prefetch_datasets(input_dataset_ids(execution_tracker.param_combinations))
+    bulk_histories: List[model.History] = []
+
     jobs_executed = 0
     has_remaining_jobs = False
     execution_slice = None
     job_datasets: Dict[str, List[model.DatasetInstance]] = {}  # job: list of dataset instances created by job
 
-    for i, execution_slice in enumerate(execution_tracker.new_execution_slices()):
-        if max_num_jobs is not None and jobs_executed >= max_num_jobs:
-            has_remaining_jobs = True
-            break
-        else:
-            skip = execution_slice.param_combination.pop("__when_value__", None) is False
-            execute_single_job(execution_slice, completed_jobs[i], skip=skip)
-            history = execution_slice.history or history
-            jobs_executed += 1
-
+    with trans.sa_session.no_autoflush if bulk else nullcontext():
+        for i, execution_slice in enumerate(execution_tracker.new_execution_slices()):
+            if max_num_jobs is not None and jobs_executed >= max_num_jobs:
+                has_remaining_jobs = True
+                break
+            else:
+                skip = execution_slice.param_combination.pop("__when_value__", None) is False
+                execute_single_job(execution_slice, completed_jobs[i], skip=skip, bulk=bulk)
+                history = execution_slice.history or history
+                if bulk and not any(h is history for h in bulk_histories):
+                    bulk_histories.append(history)
+                jobs_executed += 1
+
+        for bulk_history in bulk_histories:
+            bulk_history.add_pending_items()
     if execution_slice:
         history.add_pending_items()
     # Make sure collections, implicit jobs etc are flushed even if there are no precreated output datasets
@@ -224,6 +245,26 @@ def execute(
     return execution_tracker
 
 
+def input_dataset_ids(param_combinations: List[Dict[str, Any]]) -> Set[int]:
+    """Return the ids of the datasets referenced by the dataset inputs in ``param_combinations``."""
+    dataset_ids: Set[int] = set()
+
+    def visit(value):
+        if isinstance(value, dict):
+            for v in value.values():
+                visit(v)
+        elif isinstance(value, list):
+            for v in value:
+                visit(v)
+        elif isinstance(value, model.DatasetCollectionElement):
+            visit(value.hda)
+        elif isinstance(value, model.HistoryDatasetAssociation) and value.dataset_id is not None:
+            dataset_ids.add(value.dataset_id)
+
+    visit(param_combinations)
+    return dataset_ids
+
+
 class ExecutionSlice:
     def __init__(self, job_index, param_combination, dataset_collection_elements=None):
         self.job_index = job_index
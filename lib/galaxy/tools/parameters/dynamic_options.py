@@ -8,6 +8,7 @@ import json
 import logging
 import os
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from io import StringIO
 from typing import (
@@ -15,7 +16,10 @@ from typing import (
     cast,
     Dict,
     get_args,
+    Hashable,
+    List,
     Optional,
+    Tuple,
 )
 
 from typing_extensions import Literal
@@ -42,6 +46,9 @@ from .cancelable_request import request
 
 log = logging.getLogger(__name__)
 
+# Number of filtered option lists cached per dynamic options definition
+FILTERED_OPTIONS_CACHE_SIZE = 8
+
 
 class Filter:
     """
@@ -67,6 +74,17 @@ class Filter:
         """Returns a list of options after the filter is applied"""
         raise TypeError("Abstract Method")
 
+    def get_cache_key(self, trans, other_values) -> Optional[Hashable]:
+        """
+        Returns a hashable key for everything besides the options the result of
+        filter_options depends on, or None if the filtered options must not be cached.
+        """
+        return None
+
+
+def _workflow_building(trans) -> bool:
+    return bool(trans is not None and trans.workflow_building_mode)
+
 
 class StaticValueFilter(Filter):
     """
@@ -91,13 +109,20 @@ class StaticValueFilter(Filter):
         self.column = d_option.column_spec_to_index(column)
         self.keep = string_as_bool(elem.get("keep", "True"))
 
-    def filter_options(self, options, trans, other_values):
-        rval = []
+    def _get_filter_value(self, trans):
         filter_value = self.value
         try:
             filter_value = User.expand_user_properties(trans.user, filter_value)
         except Exception:
             pass
+        return filter_value
+
+    def get_cache_key(self, trans, other_values):
+        return self._get_filter_value(trans)
+
+    def filter_options(self, options, trans, other_values):
+        rval = []
+        filter_value = self._get_filter_value(trans)
         for fields in options:
             if self.keep == (filter_value == fields[self.column]):
                 rval.append(fields)
@@ -127,13 +152,20 @@ class RegexpFilter(Filter):
         self.column = d_option.column_spec_to_index(column)
         self.keep = string_as_bool(elem.get("keep", "True"))
 
-    def filter_options(self, options, trans, other_values):
-        rval = []
+    def _get_filter_value(self, trans):
         filter_value = self.value
         try:
             filter_value = User.expand_user_properties(trans.user, filter_value)
         except Exception:
             pass
+        return filter_value
+
+    def get_cache_key(self, trans, other_values):
+        return self._get_filter_value(trans)
+
+    def filter_options(self, options, trans, other_values):
+        rval = []
+        filter_value = self._get_filter_value(trans)
         filter_pattern = re.compile(filter_value)
         for fields in options:
             if self.keep == (filter_pattern.match(fields[self.column]) is not None):
@@ -285,9 +317,23 @@ class ParamValueFilter(Filter):
     def get_dependency_name(self):
         return self.ref_name
 
+    def get_cache_key(self, trans, other_values):
+        if _workflow_building(trans):
+            return "workflow_building"
+        return tuple(self._get_ref_values(other_values))
+
     def filter_options(self, options, trans, other_values):
-        if trans is not None and trans.workflow_building_mode:
+        if _workflow_building(trans):
             return []
+        ref_values = self._get_ref_values(other_values)
+
+        rval = []
+        for fields in options:
+            if self.keep == (fields[self.column] in ref_values):
+                rval.append(fields)
+        return rval
+
+    def _get_ref_values(self, other_values) -> List[str]:
         ref = other_values.get(self.ref_name, None)
         if ref is None:
             ref = []
@@ -309,13 +355,7 @@ class ParamValueFilter(Filter):
                     break
                 r = getattr(r, ref_attribute)
             ref_values.append(r)
-        ref_values = [str(_) for _ in ref_values]
-
-        rval = []
-        for fields in options:
-            if self.keep == (fields[self.column] in ref_values):
-                rval.append(fields)
-        return rval
+        return [str(_) for _ in ref_values]
 
 
 class UniqueValueFilter(Filter):
@@ -337,6 +377,9 @@ class UniqueValueFilter(Filter):
     def get_dependency_name(self):
         return self.dynamic_option.dataset_ref_name
 
+    def get_cache_key(self, trans, other_values):
+        return ()
+
     def filter_options(self, options, trans, other_values):
         rval = []
         seen = set()
@@ -366,6 +409,9 @@ class MultipleSplitterFilter(Filter):
         assert columns is not None, "Required 'column' attribute missing from filter"
         self.columns = [d_option.column_spec_to_index(column) for column in columns.split(",")]
 
+    def get_cache_key(self, trans, other_values):
+        return ()
+
     def filter_options(self, options, trans, other_values):
         rval = []
         for fields in options:
@@ -396,6 +442,9 @@ class AttributeValueSplitterFilter(Filter):
         assert columns is not None, "Required 'column' attribute missing from filter"
         self.columns = [d_option.column_spec_to_index(column) for column in columns.split(",")]
 
+    def get_cache_key(self, trans, other_values):
+        return ()
+
     def filter_options(self, options, trans, other_values):
         attr_names = set()
         rval = []
@@ -435,6 +484,9 @@ class AdditionalValueFilter(Filter):
         if self.index is not None:
             self.index = int(self.index)
 
+    def get_cache_key(self, trans, other_values):
+        return ()
+
     def filter_options(self, options, trans, other_values):
         rval = list(options)
         add_value = []
@@ -483,6 +535,21 @@ class RemoveValueFilter(Filter):
         self.multiple = string_as_bool(elem.get("multiple", "False"))
         self.separator = elem.get("separator", ",")
 
+    def get_cache_key(self, trans, other_values):
+        if _workflow_building(trans):
+            return "workflow_building"
+        if self.value is not None:
+            return self.value
+        if self.ref_name is not None:
+            value = other_values.get(self.ref_name)
+            if isinstance(value, str):
+                return value
+            if isinstance(value, list) and all(isinstance(v, str) for v in value):
+                return tuple(value)
+            return None
+        # depends on the metadata of a dataset
+        return None
+
     def filter_options(self, options, trans, other_values):
         from galaxy.tools.wrappers import DatasetFilenameWrapper
 
@@ -535,6 +602,9 @@ class SortByColumnFilter(Filter):
         self.column = d_option.column_spec_to_index(column)
         self.reverse = string_as_bool(elem.get("reverse_sort_order", "False"))
 
+    def get_cache_key(self, trans, other_values):
+        return ()
+
     def filter_options(self, options, trans, other_values):
         return sorted(options, key=lambda x: x[self.column], reverse=self.reverse)
 
@@ -576,6 +646,8 @@ class DynamicOptions:
         self.has_dataset_dependencies = False
         self.validators = []
         self.converter_safe = True
+        # filtered options of the data table keyed by table content version and filter cache keys
+        self._filtered_options_cache: "OrderedDict[Tuple[Hashable, ...], List[List[str]]]" = OrderedDict()
 
         # Parse the <options> tag
         self.separator = elem.get("separator", "\t")
@@ -754,18 +826,58 @@ class DynamicOptions:
                 except Exception as e:
                     log.warning("Could not read contents from %s: %s", dataset, str(e))
                     continue
-        elif self.tool_data_table:
-            options = self.tool_data_table.get_fields()
+        elif tool_data_table := self.tool_data_table:
+            user_options = []
             if trans and trans.user and trans.workflow_building_mode != workflow_building_modes.ENABLED:
-                options += self.get_user_options(trans.user)
+                user_options = self.get_user_options(trans.user)
+            if not user_options:
+                return self._get_filtered_table_fields(tool_data_table, trans, other_values)
+            options = tool_data_table.get_fields() + user_options
         elif self.file_fields:
             options = list(self.file_fields)
         else:
             options = []
+        return self._filter_fields(options, trans, other_values)
+
+    def _filter_fields(self, options, trans, other_values):
         for filter in self.filters:
             options = filter.filter_options(options, trans, other_values)
         return options
 
+    def _get_filtered_table_fields(self, tool_data_table, trans, other_values):
+        """
+        Filter the fields of the data table, reusing the result of earlier calls with the
+        same table content and filter inputs. Large data tables make running the
+        filters on each form build expensive.
+        """
+        if not self.filters:
+            return tool_data_table.get_fields()
+        filter_keys = []
+        for filter in self.filters:
+            filter_key = filter.get_cache_key(trans, other_values)
+            if filter_key is None:
+                return self._filter_fields(tool_data_table.get_fields(), trans, other_values)
+            filter_keys.append(filter_key)
+        cache_key = (tool_data_table.get_content_version(), *filter_keys)
+        cache = self._filtered_options_cache
+        options = cache.get(cache_key)
+        if options is None:
+            options = self._filter_fields(tool_data_table.get_fields(), trans, other_values)
+            cache[cache_key] = options
+            while len(cache) > FILTERED_OPTIONS_CACHE_SIZE:
+                try:
+                    cache.popitem(last=False)
+                except KeyError:
+                    # evicted by a concurrent request
+                    break
+        else:
+            try:
+                cache.move_to_end(cache_key)
+            except KeyError:
+                pass
+        # callers may modify the returned list
+        return list(options)
+
     def get_user_options(self, user: User):
         # stored metadata are key: value pairs, turn into flat lists of correct order
         fields = []
@@ -1963,16 +1963,27 @@ class StructuredExecutionTimer:
         self.timer_id = timer_id
         self.template = template
         self.tags = tags
+        self.phases: Dict[str, float] = {}
+        self._phase_begin = self.begin
 
     def __str__(self):
         return self.to_str()
 
+    def mark(self, phase):
+        """Attribute the time elapsed since the previous mark (or the start) to ``phase``."""
+        now = time.time()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._phase_begin
+        self._phase_begin = now
+
     def to_str(self, **kwd):
         if kwd:
             message = string.Template(self.template).safe_substitute(kwd)
         else:
             message = self.template
         log_message = message + f" ({self.elapsed * 1000:0.3f} ms)"
+        if self.phases:
+            phases = ", ".join(f"{phase}: {elapsed * 1000:0.3f} ms" for phase, elapsed in self.phases.items())
+            log_message += f" [{phases}]"
         return log_message
 
     @property
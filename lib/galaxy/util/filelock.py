@@ -42,6 +42,7 @@ class FileLock:
         while True:
             try:
                 self.fd = os.open(self.lockfile, os.O_CREAT | os.O_EXCL | os.O_RDWR)
+                self.inode = os.fstat(self.fd).st_ino
                 break
             except OSError as e:
                 if e.errno != errno.EEXIST:
@@ -54,11 +55,17 @@ class FileLock:
     def release(self):
         """Get rid of the lock by deleting the lockfile.
         When working in a `with` statement, this gets automatically
-        called at the end.
+        called at the end. A lockfile that has been broken and recreated
+        by another process in the meantime is left alone.
         """
         if self.is_locked:
+            try:
+                # compared while the lockfile is still open, so that its inode can't have been reused
+                if os.stat(self.lockfile).st_ino == self.inode:
+                    os.unlink(self.lockfile)
+            except FileNotFoundError:
+                pass
             os.close(self.fd)
-            os.unlink(self.lockfile)
             self.is_locked = False
 
     def __enter__(self):
@@ -0,0 +1,121 @@
+"""Read files in the background while they are consumed in order.
+
+Writing an archive of many large files reads each file exactly once and in order. When
+the files live on a network file system or a slow object store cache the archive writer
+spends most of its time waiting for reads. :func:`read_ahead` reads the next files in a
+pool of threads while the current file is consumed, holding at most ``buffered_chunks``
+chunks per file in memory.
+"""
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Deque,
+    Generator,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from galaxy.util import CHUNK_SIZE
+
+_DONE = object()
+
+
+class FileChunks:
+    """Iterator over the chunks of a file read by a background thread."""
+
+    def __init__(self, path: str, chunk_size: int, buffered_chunks: int, cancelled: threading.Event) -> None:
+        self.path = path
+        self.chunk_size = chunk_size
+        self.cancelled = cancelled
+        self.finished = False
+        self._queue: "queue.Queue[Union[bytes, BaseException, object]]" = queue.Queue(maxsize=buffered_chunks)
+
+    def read(self) -> None:
+        try:
+            with open(self.path, "rb") as fh:
+                while chunk := fh.read(self.chunk_size):
+                    if not self._put(chunk):
+                        return
+        except Exception as e:
+            self._put(e)
+        else:
+            self._put(_DONE)
+
+    def _put(self, item) -> bool:
+        while not self.cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def __iter__(self) -> "FileChunks":
+        return self
+
+    def __next__(self) -> bytes:
+        if self.finished:
+            raise StopIteration
+        item = self._queue.get()
+        if item is _DONE:
+            self.finished = True
+            raise StopIteration
+        if isinstance(item, BaseException):
+            self.finished = True
+            raise item
+        assert isinstance(item, bytes)
+        return item
+
+
+def iter_file_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    with open(path, "rb") as fh:
+        while chunk := fh.read(chunk_size):
+            yield chunk
+
+
+def read_ahead(
+    paths: Iterable[str],
+    parallel_reads: int = 4,
+    chunk_size: int = CHUNK_SIZE,
+    buffered_chunks: int = 16,
+) -> Generator[Tuple[str, Iterator[bytes]], None, None]:
+    """Yield ``(path, chunks)`` for each path in order while reading the next files ahead.
+
+    Up to ``parallel_reads`` files are read concurrently, so at most
+    ``parallel_reads * buffered_chunks * chunk_size`` bytes are buffered. Chunks of a file
+    that are not consumed before advancing to the next file are discarded.
+    """
+    if parallel_reads <= 1:
+        for path in paths:
+            yield path, iter_file_chunks(path, chunk_size)
+        return
+    pending = iter(paths)
+    cancelled = threading.Event()
+    readers: Deque[FileChunks] = deque()
+    with ThreadPoolExecutor(max_workers=parallel_reads, thread_name_prefix="read_ahead") as executor:
+
+        def read_next() -> None:
+            path: Optional[str] = next(pending, None)
+            if path is not None:
+                reader = FileChunks(path, chunk_size, buffered_chunks, cancelled)
+                readers.append(reader)
+                executor.submit(reader.read)
+
+        try:
+            for _ in range(parallel_reads):
+                read_next()
+            while readers:
+                reader = readers.popleft()
+                yield reader.path, reader
+                # free the reading thread if the consumer skipped the rest of the file
+                for _ in reader:
+                    pass
+                read_next()
+        finally:
+            cancelled.set()
@@ -1,6 +1,7 @@
 """Entry point for the usage of Cheetah templating within Galaxy."""
 
 import traceback
+from functools import lru_cache
 from lib2to3.refactor import RefactoringTool
 
 from Cheetah.Compiler import Compiler
@@ -18,6 +19,9 @@ from . import unicodify
 myfixes = [f for f in myfixes if not f.startswith("libpasteurize")]
 refactoring_tool = RefactoringTool(myfixes, {"print_function": True})
 
+# Maximum number of compiled template classes kept per process.
+COMPILED_TEMPLATE_CACHE_SIZE = 1000
+
 
 class InputNotFoundSyntaxError(SyntaxError):
     pass
@@ -31,7 +35,9 @@ class FixedModuleCodeCompiler(Compiler):
         return self._moduleDef
 
 
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
 def create_compiler_class(module_code):
+    # Cached so that retries for the same module code reuse the compiled template below.
     class CustomCompilerClass(FixedModuleCodeCompiler):
         pass
 
@@ -39,6 +45,28 @@ def create_compiler_class(module_code):
     return CustomCompilerClass
 
 
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def compile_template(template_text, compiler_class=Compiler):
+    """Compile a cheetah template to a template class.
+
+    Compiling is much more expensive than filling in a template, and the same
+    command line, config file and label templates are filled in once per job. Compiled
+    classes are cached by template text and compiler class, ``compile_template.cache_info()``
+    reports cache hits and misses. Job handlers send these to statsd while preparing jobs.
+    """
+    return Template.compile(source=template_text, compilerClass=compiler_class)
+
+
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def futurized_compiler_class(template_text, compiler_class=Compiler):
+    # The generated module code contains the time it was generated at, cache it to reuse the compiled template.
+    module_code = Template.compile(source=template_text, compilerClass=compiler_class, returnAClass=False).decode(
+        "utf-8"
+    )
+    module_code = futurize_preprocessor(module_code)
+    return create_compiler_class(module_code)
+
+
 def fill_template(
     template_text,
     context=None,
@@ -62,17 +90,13 @@ def fill_template(
     if isinstance(python_template_version, str):
         python_template_version = Version(python_template_version)
     try:
-        klass = Template.compile(source=template_text, compilerClass=compiler_class)
+        klass = compile_template(template_text, compiler_class)
     except ParseError as e:
         # Might happen on invalid syntax within a cheetah statement, like `#if $smxsize <> 128.0`
         if first_exception is None:
             first_exception = e
         if python_template_version.release[0] < 3 and retry > 0:
-            module_code = Template.compile(
-                source=template_text, compilerClass=compiler_class, returnAClass=False
-            ).decode("utf-8")
-            module_code = futurize_preprocessor(module_code)
-            compiler_class = create_compiler_class(module_code)
+            compiler_class = futurized_compiler_class(template_text, compiler_class)
             return fill_template(
                 template_text=template_text,
                 context=context,
@@ -2,6 +2,7 @@ import os
 import zlib
 from typing import (
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -68,6 +69,13 @@ class ZipstreamWrapper:
             self.size += size
             self.archive.write(path, archive_name)
 
+    def write_iter(self, chunks: Iterable[bytes], archive_name: str, size: int) -> None:
+        """Add a file whose contents are only read from ``chunks`` while the archive is streamed."""
+        if self.upstream_mod_zip:
+            raise Exception("Cannot add file contents to archive assembled by mod-zip")
+        self.size += size
+        self.archive.write_iter(archive_name, chunks)
+
     def write(self, path: str, archive_name: Optional[str] = None) -> None:
         if os.path.isdir(path):
             pardir = os.path.join(path, os.pardir)
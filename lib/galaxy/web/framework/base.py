@@ -173,7 +173,8 @@ class WebApplication:
             self._model.set_request_id(request_id)  # Start SQLAlchemy session scope
             return self.handle_request(request_id, path_info, environ, start_response)
         finally:
-            self._model.unset_request_id(request_id)  # End SQLAlchemy session scope
+            # End SQLAlchemy session scope
+            self._model.unset_request_id(request_id, environ.get("controller_action_key") or "web.unmatched")
             self.trace(message="Handle request finished")
             if self.trace_logger:
                 self.trace_logger.context_remove("request_id")
@@ -94,14 +94,15 @@ def get_app() -> StructuredApp:
     return cast(StructuredApp, galaxy_app.app)
 
 
-async def get_app_with_request_session() -> AsyncGenerator[StructuredApp, None]:
+async def get_app_with_request_session(request: Request) -> AsyncGenerator[StructuredApp, None]:
     app = get_app()
     request_id = request_context.data["X-Request-ID"]
     app.model.set_request_id(request_id)
     try:
         yield app
     finally:
-        app.model.unset_request_id(request_id)
+        route = request.scope.get("route")
+        app.model.unset_request_id(request_id, f"api.{request.method} {route.path if route else 'unmatched'}")
 
 
 DependsOnApp = cast(StructuredApp, Depends(get_app_with_request_session))
@@ -11,7 +11,10 @@ from typing import (
     Optional,
 )
 
-from fastapi import Path
+from fastapi import (
+    Path,
+    Query,
+)
 
 from galaxy.managers.configuration import ConfigurationManager
 from galaxy.managers.context import ProvidesUserContext
@@ -129,6 +132,23 @@ class FastAPIConfiguration:
         """Return tool lineages for tools that have them."""
         return self.configuration_manager.tool_lineages()
 
+    @router.get(
+        "/api/configuration/query_fingerprints",
+        require_admin=True,
+        summary="Return SQL statement fingerprints aggregated by web route, background loop and task",
+        response_description="SQL statement fingerprints that took the most time",
+    )
+    def query_fingerprints(
+        self, limit: int = Query(default=100, ge=1, description="Maximum number of fingerprints to return.")
+    ) -> List[Dict[str, Any]]:
+        """Return the SQL statement fingerprints recorded by the Galaxy process serving this request.
+
+        Requires ``repeated_query_log_threshold`` to be set. ``count`` and ``total_time``
+        are summed over all recorded scopes, ``max_count`` is the highest number of executions
+        in a single scope and ``repeated`` the number of scopes that exceeded the threshold.
+        """
+        return self.configuration_manager.query_fingerprints(limit)
+
     @router.put(
         "/api/configuration/toolbox", require_admin=True, summary="Reload the Galaxy toolbox (but not individual tools)"
     )
@@ -5,6 +5,7 @@ API operations on a history.
 """
 
 import logging
+from datetime import datetime
 from typing import (
     Any,
     List,
@@ -50,6 +51,7 @@ from galaxy.schema.schema import (
     ExportHistoryArchivePayload,
     ExportTaskListResponse,
     HistoryArchiveExportResult,
+    HistoryChanges,
     JobExportHistoryArchiveListResponse,
     JobImportHistoryResponse,
     SetSlugPayload,
@@ -113,6 +115,23 @@ SearchQueryParam: Optional[str] = search_query_param(
     free_text_fields=["title", "description", "slug", "tag"],
 )
 
+ChangesSinceQueryParam: Optional[datetime] = Query(
+    default=None,
+    title="Since",
+    description=(
+        "Wait for changes made after this time, usually the `update_time` returned by the previous request. "
+        "If omitted the current update time of the history is returned right away."
+    ),
+)
+
+ChangesTimeoutQueryParam: float = Query(
+    default=30,
+    ge=0,
+    le=60,
+    title="Timeout",
+    description="The maximum number of seconds to wait for the history to change.",
+)
+
 ShowOwnQueryParam: bool = Query(default=True, title="Show histories owned by user.", description="")
 
 ShowPublishedQueryParam: bool = Query(default=True, title="Include published histories.", description="")
@@ -315,6 +334,24 @@ class FastAPIHistories:
     ) -> AnyHistoryView:
         return self.service.show(trans, serialization_params, history_id)
 
+    @router.get(
+        "/api/histories/{history_id}/changes",
+        summary="Wait for the history to change and return the contents that changed.",
+    )
+    async def changes(
+        self,
+        history_id: HistoryIDPathParam,
+        trans: ProvidesHistoryContext = DependsOnTrans,
+        since: Optional[datetime] = ChangesSinceQueryParam,
+        timeout: float = ChangesTimeoutQueryParam,
+    ) -> HistoryChanges:
+        """Long polling replacement for repeatedly requesting the history contents updated after a given time.
+
+        The request returns as soon as the history changes after `since`, or after `timeout` seconds
+        with an empty list of items. Pass the returned `update_time` as `since` of the next request.
+        """
+        return await self.service.wait_for_changes(trans, history_id, since, timeout)
+
     @router.post(
         "/api/histories/{history_id}/prepare_store_download",
         summary="Return a short term storage token to monitor download of the history.",
@@ -384,7 +384,7 @@ class DatasetInterface(BaseUIController, UsesAnnotations, UsesItemRatings, UsesE
                     )
                 else:
                     path = data.dataset.get_file_name()
-                    datatype = guess_ext(path, trans.app.datatypes_registry.sniff_order)
+                    datatype = guess_ext(path, trans.app.datatypes_registry.sniffer_index)
                     trans.app.datatypes_registry.change_datatype(data, datatype)
                     with transaction(trans.sa_session):
                         trans.sa_session.commit()
@@ -2,6 +2,10 @@ import glob
 import logging
 import os
 import shutil
+from datetime import (
+    datetime,
+    timezone,
+)
 from pathlib import Path
 from tempfile import (
     NamedTemporaryFile,
@@ -15,10 +19,13 @@ from typing import (
     Union,
 )
 
+import anyio
 from sqlalchemy import (
     false,
+    literal,
     select,
     true,
+    union_all,
 )
 
 from galaxy import (
@@ -40,6 +47,7 @@ from galaxy.managers.histories import (
     HistoryManager,
     HistorySerializer,
 )
+from galaxy.managers.history_changes import HistoryChangeFeed
 from galaxy.managers.users import UserManager
 from galaxy.model import HistoryDatasetAssociation
 from galaxy.model.base import transaction
@@ -62,6 +70,9 @@ from galaxy.schema.schema import (
     CustomBuildsMetadataResponse,
     ExportHistoryArchivePayload,
     HistoryArchiveExportResult,
+    HistoryChanges,
+    HistoryContentChange,
+    HistoryContentType,
     HistoryImportArchiveSourceType,
     JobExportHistoryArchiveModel,
     JobIdResponse,
@@ -122,6 +133,7 @@ class HistoriesService(ServiceBase, ConsumesModelStores, ServesExportStores):
         filters: HistoryFilters,
         short_term_storage_allocator: ShortTermStorageAllocator,
         notification_service: NotificationService,
+        change_feed: HistoryChangeFeed,
     ):
         super().__init__(security)
         self.manager = manager
@@ -133,6 +145,7 @@ class HistoriesService(ServiceBase, ConsumesModelStores, ServesExportStores):
         self.filters = filters
         self.shareable_service = ShareableHistoryService(self.manager, self.serializer, notification_service)
         self.short_term_storage_allocator = short_term_storage_allocator
+        self.change_feed = change_feed
 
     def index(
         self,
@@ -365,6 +378,57 @@ class HistoriesService(ServiceBase, ConsumesModelStores, ServesExportStores):
             history = self.manager.get_accessible(history_id, trans.user, current_history=trans.history)
         return self._serialize_history(trans, history, serialization_params)
 
+    async def wait_for_changes(
+        self,
+        trans: ProvidesHistoryContext,
+        history_id: DecodedDatabaseIdField,
+        since: Optional[datetime],
+        timeout: float,
+    ) -> HistoryChanges:
+        """
+        Waits up to `timeout` seconds for the history to change after `since` and returns the
+        contents that changed. Without `since` the current update time of the history is returned
+        right away, so clients can start following the history from there.
+        """
+        # The database is queried in a worker thread, so the event loop keeps serving other requests.
+        update_time = await anyio.to_thread.run_sync(self._update_time, trans, history_id)
+        items: List[HistoryContentChange] = []
+        if since is not None:
+            if since.tzinfo is not None:
+                since = since.astimezone(timezone.utc).replace(tzinfo=None)
+            if update_time <= since:
+                update_time = await self.change_feed.wait_for_change(history_id, since, timeout) or update_time
+            if update_time > since:
+                items = await anyio.to_thread.run_sync(self._changed_contents, trans.sa_session, history_id, since)
+        return HistoryChanges(id=history_id, update_time=update_time, items=items)
+
+    def _update_time(self, trans: ProvidesHistoryContext, history_id: DecodedDatabaseIdField) -> datetime:
+        history = self.manager.get_accessible(history_id, trans.user, current_history=trans.history)
+        update_time = history.update_time
+        # Don't hold on to a database connection while waiting.
+        with transaction(trans.sa_session):
+            trans.sa_session.commit()
+        return update_time
+
+    def _changed_contents(
+        self, sa_session: galaxy_scoped_session, history_id: int, since: datetime
+    ) -> List[HistoryContentChange]:
+        selects = []
+        for content_class, content_type in (
+            (model.HistoryDatasetAssociation, HistoryContentType.dataset),
+            (model.HistoryDatasetCollectionAssociation, HistoryContentType.dataset_collection),
+        ):
+            selects.append(
+                select(
+                    content_class.id,
+                    literal(content_type.value).label("history_content_type"),
+                    content_class.hid,
+                    content_class.update_time,
+                ).where(content_class.history_id == history_id, content_class.update_time > since)
+            )
+        stmt = union_all(*selects).order_by("hid")
+        return [HistoryContentChange(**row._mapping) for row in sa_session.execute(stmt)]
+
     def prepare_download(
         self, trans: ProvidesHistoryContext, history_id: DecodedDatabaseIdField, payload: StoreExportPayload
     ) -> AsyncFile:
@@ -9,6 +9,7 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
     TYPE_CHECKING,
     Union,
 )
@@ -18,6 +19,13 @@ from pydantic import (
     ConfigDict,
     Field,
 )
+from sqlalchemy import (
+    false,
+    func,
+    select,
+    true,
+    update,
+)
 from typing_extensions import (
     Literal,
     Protocol,
@@ -29,6 +37,7 @@ from galaxy.celery.tasks import (
     materialize as materialize_task,
     prepare_dataset_collection_download,
     prepare_history_content_download,
+    purge_datasets,
     touch,
     write_history_content_to,
 )
@@ -59,13 +68,16 @@ from galaxy.managers.jobs import (
 )
 from galaxy.managers.library_datasets import LibraryDatasetsManager
 from galaxy.model import (
+    Dataset,
     History,
     HistoryDatasetAssociation,
     HistoryDatasetCollectionAssociation,
     LibraryDataset,
+    LibraryDatasetDatasetAssociation,
     User,
 )
 from galaxy.model.base import transaction
+from galaxy.model.orm.now import now
 from galaxy.model.security import GalaxyRBACAgent
 from galaxy.objectstore import BaseObjectStore
 from galaxy.schema import (
@@ -114,10 +126,12 @@ from galaxy.schema.tasks import (
     GenerateHistoryContentDownload,
     MaterializeDatasetInstanceTaskRequest,
     PrepareDatasetCollectionDownload,
+    PurgeDatasetsTaskRequest,
     WriteHistoryContentTo,
 )
 from galaxy.security.idencoding import IdEncodingHelper
 from galaxy.short_term_storage import ShortTermStorageAllocator
+from galaxy.util import chunk_iterable
 from galaxy.util.zipstream import ZipstreamWrapper
 from galaxy.webapps.galaxy.services.base import (
     async_task_summary,
@@ -697,6 +711,10 @@ class HistoriesContentsService(ServiceBase, ServesExportStores, ConsumesModelSto
         history = self.history_manager.get_mutable(history_id, trans.user, current_history=trans.history)
         filters = self.history_contents_filters.parse_query_filters(filter_query_params)
         self._validate_bulk_operation_params(payload, trans.user, trans)
+        if self.item_operator.has_set_operation(payload.operation) and (
+            payload.items or not any(f.filter_type == "function" for f in filters)
+        ):
+            return self._apply_set_operation(trans, history, filters, payload)
         contents: List["HistoryItem"]
         if payload.items:
             contents = self._get_contents_by_item_list(
@@ -988,6 +1006,14 @@ class HistoriesContentsService(ServiceBase, ServesExportStores, ConsumesModelSto
         serialization_params = self._handle_extra_serialization_for_media_type(serialization_params, accept)
         filter_query_params.order = filter_query_params.order or "hid-asc"
         order_by = self.build_order_by(self.history_contents_manager, filter_query_params.order)
+        # The summary of datasets can be built from columns without loading the datasets,
+        # unless a filter needs to be evaluated on the models.
+        summary_only = (
+            (serialization_params.view or "summary") == "summary"
+            and not serialization_params.keys
+            and not params.dataset_details
+            and not self.history_contents_filters.contains_non_orm_filter(filters)
+        )
         contents = self.history_contents_manager.contents(
             history,
             filters=filters,
@@ -995,16 +1021,20 @@ class HistoriesContentsService(ServiceBase, ServesExportStores, ConsumesModelSto
             offset=filter_query_params.offset,
             order_by=order_by,
             serialization_params=serialization_params,
+            expand_contained=not summary_only,
         )
-        items = [
-            self._serialize_content_item(
-                trans,
-                content,
-                dataset_details=params.dataset_details,
-                serialization_params=serialization_params,
-            )
-            for content in contents
-        ]
+        if summary_only:
+            items = self._serialize_content_summaries(trans, contents, serialization_params)
+        else:
+            items = [
+                self._serialize_content_item(
+                    trans,
+                    content,
+                    dataset_details=params.dataset_details,
+                    serialization_params=serialization_params,
+                )
+                for content in contents
+            ]
         if stats_requested:
             total_matches = self.history_contents_manager.contents_count(
                 history,
@@ -1073,13 +1103,7 @@ class HistoriesContentsService(ServiceBase, ServesExportStores, ConsumesModelSto
         )
         # Override URL generation to use UrlBuilder
         if trans.url_builder:
-            if rval.get("url"):
-                rval["url"] = trans.url_builder(
-                    "history_content_typed",
-                    history_id=self.encode_id(rval["history_id"]),
-                    id=self.encode_id(rval["id"]),
-                    type=rval["history_content_type"],
-                )
+            self._build_content_url(trans, rval)
             if rval.get("contents_url"):
                 rval["contents_url"] = trans.url_builder(
                     "contents_dataset_collection",
@@ -1088,6 +1112,38 @@ class HistoriesContentsService(ServiceBase, ServesExportStores, ConsumesModelSto
                 )
         return rval
 
+    def _serialize_content_summaries(self, trans, contents, serialization_params: SerializationParams):
+        """
+        Returns the summaries of `contents` as returned by ``HistoryContentsManager.contents``
+        with `expand_contained` set to False.
+
+        Dataset summaries are built from a column query by ``HDASerializer.serialize_summaries``,
+        collections are serialized as usual.
+        """
+        hda_ids = [content.id for content in contents if not isinstance(content, HistoryDatasetCollectionAssociation)]
+        summaries = self.hda_serializer.serialize_summaries(hda_ids, user=trans.user, trans=trans)
+        items = []
+        for content in contents:
+            if isinstance(content, HistoryDatasetCollectionAssociation):
+                item = self._serialize_content_item(
+                    trans, content, dataset_details=None, serialization_params=serialization_params
+                )
+            else:
+                item = summaries[content.id]
+                if trans.url_builder:
+                    self._build_content_url(trans, item)
+            items.append(item)
+        return items
+
+    def _build_content_url(self, trans, rval):
+        if rval.get("url"):
+            rval["url"] = trans.url_builder(
+                "history_content_typed",
+                history_id=self.encode_id(rval["history_id"]),
+                id=self.encode_id(rval["id"]),
+                type=rval["history_content_type"],
+            )
+
     def __collection_dict(self, trans, dataset_collection_instance, **kwds):
         return dictify_dataset_collection_instance(
             dataset_collection_instance,
@@ -1347,6 +1403,64 @@ class HistoriesContentsService(ServiceBase, ServesExportStores, ConsumesModelSto
                 errors.append(error)
         return errors
 
+    def _apply_set_operation(
+        self,
+        trans: ProvidesHistoryContext,
+        history: History,
+        filters,
+        payload: HistoryContentBulkOperationPayload,
+    ) -> HistoryContentBulkOperationResult:
+        hda_ids, hdca_ids = self._get_content_ids(trans, history, filters, payload.items)
+        item_hda_ids, item_hdca_ids = self.item_operator.apply_to_ids(
+            payload.operation, hda_ids, hdca_ids, payload.params, trans
+        )
+        # remaining items need per item work (e.g. stopping jobs) or may fail individually
+        contents: List["HistoryItem"] = []
+        if item_hda_ids:
+            contents.extend(self.hda_manager.get_owned_ids(item_hda_ids, history))
+        if item_hdca_ids:
+            contents.extend(self.hdca_manager.list(filters=[HistoryDatasetCollectionAssociation.id.in_(item_hdca_ids)]))
+        errors = self._apply_bulk_operation(contents, payload.operation, payload.params, trans)
+        with transaction(trans.sa_session):
+            trans.sa_session.commit()
+        success_count = len(hda_ids) + len(hdca_ids) - len(errors)
+        return HistoryContentBulkOperationResult(success_count=success_count, errors=errors)
+
+    def _get_content_ids(
+        self,
+        trans: ProvidesHistoryContext,
+        history: History,
+        filters,
+        items: Optional[List[HistoryContentItem]],
+    ) -> Tuple[List[int], List[int]]:
+        """Return the ids of the HDAs and HDCAs of the history selected by ``items`` or ``filters``."""
+        if items:
+            ids_by_type = {
+                content_type: [item.id for item in items if item.history_content_type == content_type]
+                for content_type in (HistoryContentType.dataset, HistoryContentType.dataset_collection)
+            }
+            hda_ids = self._ids_in_history(
+                trans, HistoryDatasetAssociation, history, ids_by_type[HistoryContentType.dataset]
+            )
+            hdca_ids = self._ids_in_history(
+                trans, HistoryDatasetCollectionAssociation, history, ids_by_type[HistoryContentType.dataset_collection]
+            )
+            return hda_ids, hdca_ids
+        hda_ids = []
+        hdca_ids = []
+        for row in self.history_contents_manager.contents(history, filters, expand_models=False):
+            if row.history_content_type == HistoryContentType.dataset:
+                hda_ids.append(row.id)
+            else:
+                hdca_ids.append(row.id)
+        return hda_ids, hdca_ids
+
+    def _ids_in_history(self, trans, model_class, history: History, ids: List[int]) -> List[int]:
+        if not ids:
+            return []
+        stmt = select(model_class.id).where(model_class.history_id == history.id, model_class.id.in_(ids))
+        return list(trans.sa_session.scalars(stmt))
+
     def _apply_operation_to_item(
         self,
         operation: HistoryContentItemOperation,
@@ -1385,12 +1499,25 @@ class HistoriesContentsService(ServiceBase, ServesExportStores, ConsumesModelSto
         return contents
 
 
+UPDATE_CHUNK_SIZE = 10000
+
+
 class ItemOperation(Protocol):
     def __call__(
         self, item: "HistoryItem", params: Optional[AnyBulkOperationParams], trans: ProvidesHistoryContext
     ) -> None: ...
 
 
+class SetOperation(Protocol):
+    def __call__(
+        self,
+        trans: ProvidesHistoryContext,
+        hda_ids: List[int],
+        hdca_ids: List[int],
+        params: Optional[AnyBulkOperationParams],
+    ) -> Tuple[List[int], List[int]]: ...
+
+
 class HistoryItemOperator:
     """Defines operations on history items."""
 
@@ -1417,6 +1544,15 @@ class HistoryItemOperator:
             HistoryContentItemOperation.add_tags: lambda item, params, trans: self._add_tags(trans, item, params),
             HistoryContentItemOperation.remove_tags: lambda item, params, trans: self._remove_tags(trans, item, params),
         }
+        self._set_operation_map: Dict[HistoryContentItemOperation, SetOperation] = {
+            HistoryContentItemOperation.hide: self._hide_ids,
+            HistoryContentItemOperation.unhide: self._unhide_ids,
+            HistoryContentItemOperation.delete: self._delete_ids,
+            HistoryContentItemOperation.undelete: self._undelete_ids,
+            HistoryContentItemOperation.purge: self._purge_ids,
+            HistoryContentItemOperation.add_tags: self._add_tags_to_ids,
+            HistoryContentItemOperation.remove_tags: self._remove_tags_from_ids,
+        }
 
     def apply(
         self,
@@ -1427,6 +1563,200 @@ class HistoryItemOperator:
     ):
         self._operation_map[operation](item, params, trans)
 
+    def has_set_operation(self, operation: HistoryContentItemOperation) -> bool:
+        return operation in self._set_operation_map
+
+    def apply_to_ids(
+        self,
+        operation: HistoryContentItemOperation,
+        hda_ids: List[int],
+        hdca_ids: List[int],
+        params: Optional[AnyBulkOperationParams],
+        trans: ProvidesHistoryContext,
+    ) -> Tuple[List[int], List[int]]:
+        """Apply the operation to all items at once using set based statements.
+
+        Returns the ids of the HDAs and HDCAs the operation must still be applied to one item at a time.
+        """
+        return self._set_operation_map[operation](trans, hda_ids, hdca_ids, params)
+
+    def _update(self, trans: ProvidesHistoryContext, model_class, ids: List[int], **values):
+        # update_time is set explicitly so that the history notices the change
+        for ids_chunk in chunk_iterable(ids, size=UPDATE_CHUNK_SIZE):
+            stmt = (
+                update(model_class)
+                .where(model_class.id.in_(ids_chunk))
+                .values(update_time=now(), **values)
+                .execution_options(synchronize_session=False)
+            )
+            trans.sa_session.execute(stmt)
+
+    def _hide_ids(
+        self,
+        trans: ProvidesHistoryContext,
+        hda_ids: List[int],
+        hdca_ids: List[int],
+        params: Optional[AnyBulkOperationParams],
+    ):
+        self._update(trans, HistoryDatasetAssociation, hda_ids, visible=False)
+        self._update(trans, HistoryDatasetCollectionAssociation, hdca_ids, visible=False)
+        return [], []
+
+    def _unhide_ids(
+        self,
+        trans: ProvidesHistoryContext,
+        hda_ids: List[int],
+        hdca_ids: List[int],
+        params: Optional[AnyBulkOperationParams],
+    ):
+        self._update(trans, HistoryDatasetAssociation, hda_ids, visible=True)
+        self._update(trans, HistoryDatasetCollectionAssociation, hdca_ids, visible=True)
+        return [], []
+
+    def _delete_ids(
+        self,
+        trans: ProvidesHistoryContext,
+        hda_ids: List[int],
+        hdca_ids: List[int],
+        params: Optional[AnyBulkOperationParams],
+    ):
+        self._update(trans, HistoryDatasetAssociation, hda_ids, deleted=True)
+        # deleting a collection also deletes its datasets
+        return [], hdca_ids
+
+    def _undelete_ids(
+        self,
+        trans: ProvidesHistoryContext,
+        hda_ids: List[int],
+        hdca_ids: List[int],
+        params: Optional[AnyBulkOperationParams],
+    ):
+        stmt = select(HistoryDatasetAssociation.id).where(
+            HistoryDatasetAssociation.id.in_(hda_ids), HistoryDatasetAssociation.purged == true()
+        )
+        purged_ids = set(trans.sa_session.scalars(stmt)) if hda_ids else set()
+        self._update(
+            trans, HistoryDatasetAssociation, [hda_id for hda_id in hda_ids if hda_id not in purged_ids], deleted=False
+        )
+        self._update(trans, HistoryDatasetCollectionAssociation, hdca_ids, deleted=False)
+        # purged datasets can't be undeleted, report them one by one
+        return list(purged_ids), []
+
+    def _purge_ids(
+        self,
+        trans: ProvidesHistoryContext,
+        hda_ids: List[int],
+        hdca_ids: List[int],
+        params: Optional[AnyBulkOperationParams],
+    ):
+        if not trans.app.config.allow_user_dataset_purge or not hda_ids:
+            return hda_ids, hdca_ids
+        hda_table = HistoryDatasetAssociation.table
+        state = func.coalesce(func.nullif(hda_table.c._state, ""), Dataset.state)
+        stmt = (
+            select(hda_table.c.id, hda_table.c.dataset_id, state.label("state"), History.user_id)
+            .join(Dataset, Dataset.id == hda_table.c.dataset_id)
+            .join(History, History.id == hda_table.c.history_id)
+            .where(hda_table.c.id.in_(hda_ids))
+        )
+        rows = trans.sa_session.execute(stmt).all()
+        # the creating jobs of datasets that are not terminal may need to be stopped
+        item_hda_ids = [row.id for row in rows if row.state not in Dataset.terminal_states]
+        purged_rows = [row for row in rows if row.state in Dataset.terminal_states]
+        purged_hda_ids = [row.id for row in purged_rows]
+        user_id = purged_rows[0].user_id if purged_rows else None
+        # determined before the HDAs are marked purged
+        quota_amounts = self._purged_quota_amounts(trans, user_id, purged_hda_ids) if user_id else {}
+        self._update(trans, HistoryDatasetAssociation, purged_hda_ids, deleted=True, purged=True)
+        if quota_amounts:
+            user = trans.sa_session.get(User, user_id)
+            assert user
+            for quota_source_label, amount in quota_amounts.items():
+                user.adjust_total_disk_usage(-amount, quota_source_label)
+        with transaction(trans.sa_session):
+            trans.sa_session.commit()
+        if purged_rows:
+            # files are only removed once all associations of their dataset are purged
+            request = PurgeDatasetsTaskRequest(dataset_ids=list({row.dataset_id for row in purged_rows}))
+            if trans.app.config.enable_celery_tasks:
+                purge_datasets.delay(request=request, task_user_id=getattr(trans.user, "id", None))
+            else:
+                self.hda_manager.dataset_manager.purge_datasets(request)
+        return item_hda_ids, hdca_ids
+
+    def _purged_quota_amounts(
+        self, trans: ProvidesHistoryContext, user_id: int, hda_ids: List[int]
+    ) -> Dict[Optional[str], int]:
+        """Return the disk usage freed by purging the given HDAs of the user per quota source label.
+
+        Like ``HistoryDatasetAssociation.quota_amount`` a dataset only counts once, and only if it
+        isn't purged, isn't in a library and the user doesn't keep another unpurged HDA of it.
+        """
+        hda_table = HistoryDatasetAssociation.table
+        other_hda = hda_table.alias("other_hda")
+        ldda_table = LibraryDatasetDatasetAssociation.table
+        purged_dataset_ids = select(hda_table.c.dataset_id).where(
+            hda_table.c.id.in_(hda_ids), hda_table.c.purged == false()
+        )
+        still_referenced = (
+            select(other_hda.c.id)
+            .join(History, History.id == other_hda.c.history_id)
+            .where(
+                other_hda.c.dataset_id == Dataset.id,
+                other_hda.c.purged == false(),
+                other_hda.c.id.not_in(hda_ids),
+                History.user_id == user_id,
+            )
+            .exists()
+        )
+        in_library = select(ldda_table.c.id).where(ldda_table.c.dataset_id == Dataset.id).exists()
+        stmt = (
+            select(Dataset.object_store_id, func.sum(func.coalesce(Dataset.total_size, Dataset.file_size, 0)))
+            .where(Dataset.id.in_(purged_dataset_ids), Dataset.purged == false(), ~still_referenced, ~in_library)
+            .group_by(Dataset.object_store_id)
+        )
+        quota_source_map = trans.app.object_store.get_quota_source_map()
+        amounts: Dict[Optional[str], int] = {}
+        for object_store_id, amount in trans.sa_session.execute(stmt):
+            quota_source_info = quota_source_map.get_quota_source_info(object_store_id)
+            if amount and quota_source_info.use:
+                amounts[quota_source_info.label] = amounts.get(quota_source_info.label, 0) + int(amount)
+        return amounts
+
+    def _add_tags_to_ids(
+        self,
+        trans: ProvidesHistoryContext,
+        hda_ids: List[int],
+        hdca_ids: List[int],
+        params: Optional[AnyBulkOperationParams],
+    ):
+        tags = cast(TagOperationParams, params).tags
+        for model_class, ids in (
+            (HistoryDatasetAssociation, hda_ids),
+            (HistoryDatasetCollectionAssociation, hdca_ids),
+        ):
+            for ids_chunk in chunk_iterable(ids, size=UPDATE_CHUNK_SIZE):
+                trans.tag_handler.add_tags_to_items(trans.user, model_class, list(ids_chunk), tags)
+            self._update(trans, model_class, ids)
+        return [], []
+
+    def _remove_tags_from_ids(
+        self,
+        trans: ProvidesHistoryContext,
+        hda_ids: List[int],
+        hdca_ids: List[int],
+        params: Optional[AnyBulkOperationParams],
+    ):
+        tags = cast(TagOperationParams, params).tags
+        for model_class, ids in (
+            (HistoryDatasetAssociation, hda_ids),
+            (HistoryDatasetCollectionAssociation, hdca_ids),
+        ):
+            for ids_chunk in chunk_iterable(ids, size=UPDATE_CHUNK_SIZE):
+                trans.tag_handler.remove_tags_from_items(model_class, list(ids_chunk), tags)
+            self._update(trans, model_class, ids)
+        return [], []
+
     def _get_item_manager(self, item: "HistoryItem"):
         if isinstance(item, HistoryDatasetAssociation):
             return self.hda_manager
@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from enum import Enum
 from typing import (
     Any,
@@ -80,18 +81,22 @@ class JobsService(ServiceBase):
             or payload.implicit_collection_jobs_id is not None
             or payload.history_id is not None
         )
-        jobs = self.job_manager.index_query(trans, payload)
         out = []
-        for job in jobs.yield_per(model.YIELD_PER_ROWS):
-            # TODO: optimize if this crucial
-            if check_security_of_jobs and not security_check(trans, job.history, check_accessible=True):
-                raise exceptions.ItemAccessibilityException("Cannot access the request job objects.")
-            job_dict = job.to_dict(view, system_details=is_admin)
-            if view == JobIndexViewEnum.admin_job_list:
-                job_dict["decoded_job_id"] = job.id
-            if user_details:
-                job_dict["user_email"] = job.get_user_email()
-            out.append(job_dict)
+        # The security check compares the job's history with models of the request session,
+        # so only jobs that don't need it can be listed from the read replica.
+        read_session = nullcontext(None) if check_security_of_jobs else trans.app.model.read_session()
+        with read_session as session:
+            jobs = self.job_manager.index_query(trans, payload, session=session)
+            for job in jobs.yield_per(model.YIELD_PER_ROWS):
+                # TODO: optimize if this crucial
+                if check_security_of_jobs and not security_check(trans, job.history, check_accessible=True):
+                    raise exceptions.ItemAccessibilityException("Cannot access the request job objects.")
+                job_dict = job.to_dict(view, system_details=is_admin)
+                if view == JobIndexViewEnum.admin_job_list:
+                    job_dict["decoded_job_id"] = job.id
+                if user_details:
+                    job_dict["user_email"] = job.get_user_email()
+                out.append(job_dict)
 
         return out
 
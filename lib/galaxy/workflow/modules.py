@@ -139,7 +139,7 @@ def to_cwl(value, hda_references, step):
         # not be needed.
         if not value.dataset.in_ready_state():
             why = f"dataset [{value.id}] is needed for valueFrom expression and is non-ready"
-            raise DelayedWorkflowEvaluation(why=why)
+            raise DelayedWorkflowEvaluation(why=why, dataset_ids=[value.dataset.id])
         if not value.is_ok:
             raise FailWorkflowEvaluation(
                 why=InvocationFailureDatasetFailed(
@@ -2478,8 +2478,13 @@ def load_module_sections(trans):
 
 
 class DelayedWorkflowEvaluation(Exception):
-    def __init__(self, why=None):
+    def __init__(self, why=None, job_ids=None, dataset_ids=None, transitive=False):
         self.why = why
+        # Jobs and datasets that need to reach a terminal state before the evaluation can proceed, if known.
+        self.job_ids = job_ids or []
+        self.dataset_ids = dataset_ids or []
+        # Delayed only because a step this step depends on was delayed while scheduling the same invocation.
+        self.transitive = transitive
 
 
 class CancelWorkflowEvaluation(Exception):
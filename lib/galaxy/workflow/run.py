@@ -5,6 +5,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
     TYPE_CHECKING,
     Union,
@@ -65,8 +66,9 @@ def schedule(
     workflow: "Workflow",
     workflow_run_config: WorkflowRunConfig,
     workflow_invocation: WorkflowInvocation,
+    blockers: Optional["InvocationBlockers"] = None,
 ) -> Tuple[WorkflowOutputsType, WorkflowInvocation]:
-    return __invoke(trans, workflow, workflow_run_config, workflow_invocation)
+    return __invoke(trans, workflow, workflow_run_config, workflow_invocation, blockers=blockers)
 
 
 def __invoke(
@@ -75,6 +77,7 @@ def __invoke(
     workflow_run_config: WorkflowRunConfig,
     workflow_invocation: Optional[WorkflowInvocation] = None,
     populate_state: bool = False,
+    blockers: Optional["InvocationBlockers"] = None,
 ) -> Tuple[WorkflowOutputsType, WorkflowInvocation]:
     """Run the supplied workflow in the supplied target_history."""
     if populate_state:
@@ -90,6 +93,7 @@ def __invoke(
         workflow,
         workflow_run_config,
         workflow_invocation=workflow_invocation,
+        blockers=blockers,
     )
     workflow_invocation = invoker.workflow_invocation
     outputs = {}
@@ -154,6 +158,7 @@ class WorkflowInvoker:
         workflow_run_config: WorkflowRunConfig,
         workflow_invocation: Optional[WorkflowInvocation] = None,
         progress: Optional["WorkflowProgress"] = None,
+        blockers: Optional["InvocationBlockers"] = None,
     ) -> None:
         self.trans = trans
         self.workflow = workflow
@@ -188,6 +193,7 @@ class WorkflowInvoker:
                 copy_inputs_to_history=workflow_run_config.copy_inputs_to_history,
                 use_cached_job=workflow_run_config.use_cached_job,
                 replacement_dict=workflow_run_config.replacement_dict,
+                blockers=blockers,
             )
         self.progress = progress
 
@@ -221,6 +227,7 @@ class WorkflowInvoker:
             max_jobs_to_schedule = self.progress.maximum_jobs_to_schedule_or_none
             if max_jobs_to_schedule is not None and max_jobs_to_schedule <= 0:
                 max_jobs_per_iteration_reached = True
+                self.progress.blockers.unknown = True
                 break
             step_delayed = False
             step_timer = ExecutionTimer()
@@ -241,12 +248,14 @@ class WorkflowInvoker:
                 incomplete_or_none = self._invoke_step(workflow_invocation_step)
                 if incomplete_or_none is False:
                     step_delayed = delayed_steps = True
+                    self.progress.blockers.unknown = True
                     workflow_invocation_step.state = "ready"
                     self.progress.mark_step_outputs_delayed(step, why="Not all jobs scheduled for state.")
                 else:
                     workflow_invocation_step.state = "scheduled"
             except modules.DelayedWorkflowEvaluation as de:
                 step_delayed = delayed_steps = True
+                self.progress.blockers.record(de)
                 self.progress.mark_step_outputs_delayed(step, why=de.why)
             except Exception as e:
                 log.exception(
@@ -296,11 +305,11 @@ class WorkflowInvoker:
         # No steps created yet - have to delay evaluation.
         if not step_invocation:
             delayed_why = f"depends on step [{output_id}] but that step has not been invoked yet"
-            raise modules.DelayedWorkflowEvaluation(why=delayed_why)
+            raise modules.DelayedWorkflowEvaluation(why=delayed_why, transitive=True)
 
         if step_invocation.state != "scheduled":
             delayed_why = f"depends on step [{output_id}] job has not finished scheduling yet"
-            raise modules.DelayedWorkflowEvaluation(delayed_why)
+            raise modules.DelayedWorkflowEvaluation(delayed_why, transitive=True)
 
         # TODO: Handle implicit dependency on stuff like pause steps.
         for job in step_invocation.jobs:
@@ -309,7 +318,7 @@ class WorkflowInvoker:
                 delayed_why = (
                     f"depends on step [{output_id}] but one or more jobs created from that step have not finished yet"
                 )
-                raise modules.DelayedWorkflowEvaluation(why=delayed_why)
+                raise modules.DelayedWorkflowEvaluation(why=delayed_why, job_ids=[job.id])
 
             if job.state != job.states.OK:
                 raise modules.FailWorkflowEvaluation(
@@ -334,6 +343,42 @@ class WorkflowInvoker:
 STEP_OUTPUT_DELAYED = object()
 
 
+class InvocationBlockers:
+    """
+    Collects the jobs and datasets a workflow invocation (and its subworkflow invocations)
+    is waiting on while it is being scheduled, so that the scheduling manager can skip the
+    invocation until one of them reaches a terminal state.
+    """
+
+    def __init__(self) -> None:
+        self.job_ids: Set[int] = set()
+        self.dataset_ids: Set[int] = set()
+        # Set if a step was delayed for a reason that is not tied to a job or dataset
+        # (e.g. a paused step or the maximum number of jobs per iteration being reached).
+        self.unknown = False
+
+    def record(self, delayed: modules.DelayedWorkflowEvaluation) -> None:
+        if delayed.job_ids or delayed.dataset_ids:
+            self.job_ids.update(delayed.job_ids)
+            self.dataset_ids.update(delayed.dataset_ids)
+        elif not delayed.transitive:
+            self.unknown = True
+
+    @property
+    def known(self) -> bool:
+        """Whether the invocation is known to only wait on the collected jobs and datasets."""
+        return not self.unknown and bool(self.job_ids or self.dataset_ids)
+
+
+def _populating_job_ids(hdca: model.HistoryDatasetCollectionAssociation) -> List[int]:
+    """Ids of the jobs that will populate ``hdca``."""
+    if hdca.implicit_collection_jobs:
+        return [job_association.job_id for job_association in hdca.implicit_collection_jobs.jobs]
+    if hdca.job_id:
+        return [hdca.job_id]
+    return []
+
+
 class ModuleInjector(Protocol):
     trans: "WorkRequestContext"
 
@@ -360,6 +405,7 @@ class WorkflowProgress:
         replacement_dict: Optional[Dict[str, str]] = None,
         subworkflow_collection_info=None,
         when_values=None,
+        blockers: Optional[InvocationBlockers] = None,
     ) -> None:
         self.outputs: Dict[int, Any] = {}
         self.module_injector = module_injector
@@ -375,6 +421,7 @@ class WorkflowProgress:
         self.subworkflow_collection_info = subworkflow_collection_info
         self.subworkflow_structure = subworkflow_collection_info.structure if subworkflow_collection_info else None
         self.when_values = when_values
+        self.blockers = blockers or InvocationBlockers()
 
     @property
     def maximum_jobs_to_schedule_or_none(self) -> Optional[int]:
@@ -466,7 +513,7 @@ class WorkflowProgress:
         step_outputs = self.outputs[output_step_id]
         if step_outputs is STEP_OUTPUT_DELAYED:
             delayed_why = f"dependent step [{output_step_id}] delayed, so this step must be delayed"
-            raise modules.DelayedWorkflowEvaluation(why=delayed_why)
+            raise modules.DelayedWorkflowEvaluation(why=delayed_why, transitive=True)
         try:
             replacement = step_outputs[output_name]
         except KeyError:
@@ -494,7 +541,7 @@ class WorkflowProgress:
                     )
 
                 delayed_why = f"dependent collection [{replacement.id}] not yet populated with datasets"
-                raise modules.DelayedWorkflowEvaluation(why=delayed_why)
+                raise modules.DelayedWorkflowEvaluation(why=delayed_why, job_ids=_populating_job_ids(replacement))
 
         if isinstance(replacement, model.DatasetCollection):
             raise NotImplementedError
@@ -503,7 +550,7 @@ class WorkflowProgress:
         ):
             if isinstance(replacement, model.HistoryDatasetAssociation):
                 if replacement.is_pending:
-                    raise modules.DelayedWorkflowEvaluation()
+                    raise modules.DelayedWorkflowEvaluation(dataset_ids=[replacement.dataset.id])
                 if not replacement.is_ok:
                     raise modules.FailWorkflowEvaluation(
                         why=InvocationFailureDatasetFailed(
@@ -515,11 +562,11 @@ class WorkflowProgress:
                     )
             else:
                 if not replacement.collection.populated:
-                    raise modules.DelayedWorkflowEvaluation()
-                pending = False
+                    raise modules.DelayedWorkflowEvaluation(job_ids=_populating_job_ids(replacement))
+                pending_dataset_ids = []
                 for dataset_instance in replacement.dataset_instances:
                     if dataset_instance.is_pending:
-                        pending = True
+                        pending_dataset_ids.append(dataset_instance.dataset.id)
                     elif not dataset_instance.is_ok:
                         raise modules.FailWorkflowEvaluation(
                             why=InvocationFailureDatasetFailed(
@@ -529,8 +576,8 @@ class WorkflowProgress:
                                 dependent_workflow_step_id=output_step_id,
                             )
                         )
-                if pending:
-                    raise modules.DelayedWorkflowEvaluation()
+                if pending_dataset_ids:
+                    raise modules.DelayedWorkflowEvaluation(dataset_ids=pending_dataset_ids)
 
         return replacement
 
@@ -540,7 +587,7 @@ class WorkflowProgress:
         step_outputs = self.outputs[step.id]
         if step_outputs is STEP_OUTPUT_DELAYED:
             delayed_why = f"depends on workflow output [{output_name}] but that output has not been created yet"
-            raise modules.DelayedWorkflowEvaluation(why=delayed_why)
+            raise modules.DelayedWorkflowEvaluation(why=delayed_why, transitive=True)
         else:
             return step_outputs[output_name]
 
@@ -714,6 +761,7 @@ class WorkflowProgress:
             replacement_dict=self.replacement_dict,
             subworkflow_collection_info=subworkflow_collection_info,
             when_values=when_values,
+            blockers=self.blockers,
         )
 
     def raw_to_galaxy(self, value: dict):
@@ -723,7 +771,8 @@ class WorkflowProgress:
         try:
             step_invocation.workflow_step.module.recover_mapping(step_invocation, self)
         except modules.DelayedWorkflowEvaluation as de:
+            self.blockers.record(de)
             self.mark_step_outputs_delayed(step_invocation.workflow_step, de.why)
 
 
-__all__ = ("queue_invoke", "WorkflowRunConfig")
+__all__ = ("InvocationBlockers", "queue_invoke", "WorkflowRunConfig")
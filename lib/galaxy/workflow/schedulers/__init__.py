@@ -35,8 +35,12 @@ class WorkflowSchedulingPlugin(metaclass=ABCMeta):
 
 class ActiveWorkflowSchedulingPlugin(WorkflowSchedulingPlugin, metaclass=ABCMeta):
     @abstractmethod
-    def schedule(self, workflow_invocation):
+    def schedule(self, workflow_invocation, blockers=None):
         """Optionally return one or more commands to instrument job. These
         commands will be executed on the compute server prior to the job
         running.
+
+        If ``blockers`` (a ``galaxy.workflow.run.InvocationBlockers``) is
+        supplied, the jobs and datasets the invocation is waiting on should be
+        recorded in it.
         """
@@ -3,7 +3,10 @@ it simply schedules the whole workflow up front when offered.
 """
 
 import logging
-from typing import TYPE_CHECKING
+from typing import (
+    Optional,
+    TYPE_CHECKING,
+)
 
 from galaxy.work import context
 from galaxy.workflow import (
@@ -14,6 +17,7 @@ from . import ActiveWorkflowSchedulingPlugin
 
 if TYPE_CHECKING:
     from galaxy.model import WorkflowInvocation
+    from galaxy.workflow.run import InvocationBlockers
 
 
 log = logging.getLogger(__name__)
@@ -31,7 +35,9 @@ class CoreWorkflowSchedulingPlugin(ActiveWorkflowSchedulingPlugin):
     def shutdown(self):
         pass
 
-    def schedule(self, workflow_invocation: "WorkflowInvocation") -> None:
+    def schedule(
+        self, workflow_invocation: "WorkflowInvocation", blockers: Optional["InvocationBlockers"] = None
+    ) -> None:
         workflow = workflow_invocation.workflow
         history = workflow_invocation.history
         request_context = context.WorkRequestContext(
@@ -43,6 +49,7 @@ class CoreWorkflowSchedulingPlugin(ActiveWorkflowSchedulingPlugin):
             workflow=workflow,
             workflow_run_config=workflow_run_config,
             workflow_invocation=workflow_invocation,
+            blockers=blockers,
         )
 
 
@@ -1,5 +1,21 @@
 import os
+import threading
+import time
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
 from functools import partial
+from itertools import zip_longest
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import galaxy.workflow.schedulers
 from galaxy import model
@@ -12,6 +28,7 @@ from galaxy.util.monitors import Monitors
 from galaxy.util.xml_macros import load
 from galaxy.web_stack.handlers import ConfiguresHandlers
 from galaxy.web_stack.message import WorkflowSchedulingMessage
+from galaxy.workflow.run import InvocationBlockers
 
 log = get_logger(__name__)
 
@@ -136,6 +153,11 @@ class WorkflowSchedulingManager(ConfiguresHandlers):
             flush=flush,
         )
 
+    def dependencies_finished(self, job_ids=None, dataset_ids=None):
+        """Let the request monitor of this process know that the given jobs and datasets reached a terminal state."""
+        if self.request_monitor:
+            self.request_monitor.dependencies_finished(job_ids=job_ids, dataset_ids=dataset_ids)
+
     def shutdown(self):
         exception = None
         for workflow_scheduler in self.workflow_schedulers.values():
@@ -275,10 +297,150 @@ class WorkflowSchedulingManager(ConfiguresHandlers):
         self.app.application_stack.register_postfork_function(self.request_monitor.start)
 
 
+class InvocationDependencyTracker:
+    """
+    Keeps track of the jobs and datasets active workflow invocations are blocked on, so that the
+    workflow request monitor only needs to re-evaluate an invocation once one of them reached a
+    terminal state. Dependencies may be reported as finished from any thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # invocation id -> (ids of the jobs, ids of the datasets) the invocation is waiting on
+        self.blocked_on: Dict[int, Tuple[Set[int], Set[int]]] = {}
+        # job id -> ids of the invocations waiting on the job
+        self.waiting_on_job: Dict[int, Set[int]] = {}
+        # dataset id -> ids of the invocations waiting on the dataset
+        self.waiting_on_dataset: Dict[int, Set[int]] = {}
+        # Finished jobs and datasets are numbered, so that dependencies finishing while an invocation
+        # is being evaluated are not missed when the invocation is tracked afterwards.
+        self._sequence = 0
+        self._finished_job_ids: Dict[int, int] = {}
+        self._finished_dataset_ids: Dict[int, int] = {}
+        # sequence number at the start of an evaluation -> number of evaluations in progress
+        self._evaluations: Dict[int, int] = {}
+
+    def __contains__(self, invocation_id):
+        return invocation_id in self.blocked_on
+
+    def __len__(self):
+        return len(self.blocked_on)
+
+    def begin_evaluation(self) -> int:
+        """Called before evaluating an invocation, the result needs to be passed to ``track`` and ``end_evaluation``."""
+        with self._lock:
+            self._evaluations[self._sequence] = self._evaluations.get(self._sequence, 0) + 1
+            return self._sequence
+
+    def end_evaluation(self, since: int):
+        with self._lock:
+            self._evaluations[since] -= 1
+            if not self._evaluations[since]:
+                del self._evaluations[since]
+
+    def track(
+        self, invocation_id: int, job_ids: Iterable[int] = (), dataset_ids: Iterable[int] = (), since: int = 0
+    ) -> bool:
+        """Block the invocation on the given jobs and datasets, return ``False`` if it can't be blocked
+        because it doesn't wait on any or because one of them finished after the evaluation started at ``since``.
+        """
+        blocking_job_ids = set(job_ids)
+        blocking_dataset_ids = set(dataset_ids)
+        with self._lock:
+            self._discard(invocation_id)
+            if not (blocking_job_ids or blocking_dataset_ids):
+                return False
+            for object_ids, finished in (
+                (blocking_job_ids, self._finished_job_ids),
+                (blocking_dataset_ids, self._finished_dataset_ids),
+            ):
+                if any(finished.get(object_id, -1) > since for object_id in object_ids):
+                    return False
+            self.blocked_on[invocation_id] = (blocking_job_ids, blocking_dataset_ids)
+            for job_id in blocking_job_ids:
+                self.waiting_on_job.setdefault(job_id, set()).add(invocation_id)
+            for dataset_id in blocking_dataset_ids:
+                self.waiting_on_dataset.setdefault(dataset_id, set()).add(invocation_id)
+            return True
+
+    def dependencies_finished(self, job_ids: Iterable[int] = (), dataset_ids: Iterable[int] = ()) -> List[int]:
+        """Mark jobs and datasets as finished and return the ids of the invocations to re-evaluate."""
+        with self._lock:
+            self._sequence += 1
+            woken = set()
+            for job_id in job_ids:
+                self._finished_job_ids[job_id] = self._sequence
+                woken.update(self.waiting_on_job.pop(job_id, ()))
+            for dataset_id in dataset_ids:
+                self._finished_dataset_ids[dataset_id] = self._sequence
+                woken.update(self.waiting_on_dataset.pop(dataset_id, ()))
+            for invocation_id in woken:
+                self._discard(invocation_id)
+            return sorted(woken)
+
+    def discard(self, invocation_id: int):
+        with self._lock:
+            self._discard(invocation_id)
+
+    def retain(self, invocation_ids: Iterable[int]):
+        """Stop tracking invocations that are no longer active and forget dependencies that finished
+        before all evaluations in progress started."""
+        active = set(invocation_ids)
+        with self._lock:
+            for invocation_id in [i for i in self.blocked_on if i not in active]:
+                self._discard(invocation_id)
+            oldest = min(self._evaluations, default=self._sequence)
+            for finished in (self._finished_job_ids, self._finished_dataset_ids):
+                for object_id in [i for i, sequence in finished.items() if sequence <= oldest]:
+                    del finished[object_id]
+
+    def _discard(self, invocation_id: int):
+        job_ids, dataset_ids = self.blocked_on.pop(invocation_id, ((), ()))
+        for object_ids, waiting in ((job_ids, self.waiting_on_job), (dataset_ids, self.waiting_on_dataset)):
+            for object_id in object_ids:
+                invocations = waiting.get(object_id)
+                if invocations is not None:
+                    invocations.discard(invocation_id)
+                    if not invocations:
+                        del waiting[object_id]
+
+
+def round_robin_histories(invocations: Iterable[Tuple[int, int, Optional[int]]]) -> List[Tuple[int, List[int]]]:
+    """Group ``(id, history_id, user_id)`` invocations by history and order the histories round-robin across
+    users (anonymous histories count as their own user), keeping the order of ``invocations`` otherwise."""
+    history_invocations: Dict[int, List[int]] = {}
+    user_histories: Dict[Any, List[int]] = {}
+    for invocation_id, history_id, user_id in invocations:
+        if history_id not in history_invocations:
+            history_invocations[history_id] = []
+            owner = ("user", user_id) if user_id is not None else ("history", history_id)
+            user_histories.setdefault(owner, []).append(history_id)
+        history_invocations[history_id].append(invocation_id)
+    return [
+        (history_id, history_invocations[history_id])
+        for history_ids in zip_longest(*user_histories.values())
+        for history_id in history_ids
+        if history_id is not None
+    ]
+
+
 class WorkflowRequestMonitor(Monitors):
     def __init__(self, app, workflow_scheduling_manager):
         self.app = app
         self.workflow_scheduling_manager = workflow_scheduling_manager
+        self.dependency_tracker: Optional[InvocationDependencyTracker] = None
+        if app.config.workflow_scheduling_dependency_wakeups:
+            self.dependency_tracker = InvocationDependencyTracker()
+        self._next_sweep = 0.0
+        # If configured, invocations of different histories are scheduled concurrently
+        self.executor: Optional[ThreadPoolExecutor] = None
+        if app.config.workflow_scheduling_threads > 1:
+            self.executor = ThreadPoolExecutor(
+                max_workers=app.config.workflow_scheduling_threads,
+                thread_name_prefix="WorkflowRequestMonitor.scheduling_thread",
+            )
+        # history id -> future of the task scheduling the history's invocations
+        self._in_flight: Dict[int, Future] = {}
         self._init_monitor_thread(
             name="WorkflowRequestMonitor.monitor_thread", target=self.__monitor, config=app.config
         )
@@ -308,25 +470,113 @@ class WorkflowRequestMonitor(Monitors):
                     "internal.galaxy.workflows.scheduling_manager.monitor_step",
                     "Workflow scheduling manager monitor step complete.",
                 )
-                for workflow_scheduler_id, workflow_scheduler in to_monitor.items():
-                    if not self.monitor_running:
-                        return
-
-                    self.__schedule(workflow_scheduler_id, workflow_scheduler)
+                sweep = self.__sweep_due()
+                active_invocation_ids: Set[int] = set()
+                with self.app.query_fingerprint_stats.scope("workflows.scheduling_manager.monitor_step"):
+                    for workflow_scheduler_id, workflow_scheduler in to_monitor.items():
+                        if not self.monitor_running:
+                            return
+
+                        active_invocation_ids.update(self.__schedule(workflow_scheduler_id, workflow_scheduler, sweep))
+                if self.dependency_tracker is not None:
+                    self.dependency_tracker.retain(active_invocation_ids)
                 log.trace(monitor_step_timer.to_str())
             except Exception:
                 log.exception("An exception occured scheduling while scheduling workflows")
             self._monitor_sleep(self.app.config.workflow_monitor_sleep)
 
-    def __schedule(self, workflow_scheduler_id, workflow_scheduler):
-        invocation_ids = self.__active_invocation_ids(workflow_scheduler_id)
-        for invocation_id in invocation_ids:
-            log.debug("Attempting to schedule workflow invocation [%s]", invocation_id)
-            self.__attempt_schedule(invocation_id, workflow_scheduler)
-            if not self.monitor_running:
-                return
+    def __sweep_due(self):
+        """Whether all active invocations should be evaluated, including those blocked on jobs or datasets."""
+        if self.dependency_tracker is None:
+            return True
+        now = time.time()
+        if now < self._next_sweep:
+            return False
+        self._next_sweep = now + self.app.config.workflow_scheduling_sweep_interval
+        return True
+
+    def __schedule(self, workflow_scheduler_id, workflow_scheduler, sweep=True):
+        if self.executor is None:
+            active_ids = self.__active_invocation_ids(workflow_scheduler_id)
+            invocations = [(invocation_id, None, None) for invocation_id in active_ids]
+        else:
+            invocations = self.__active_invocations(workflow_scheduler_id)
+        invocation_ids = [invocation[0] for invocation in invocations]
+        to_schedule = []
+        skipped = 0
+        for invocation in invocations:
+            if not sweep and self.dependency_tracker is not None and invocation[0] in self.dependency_tracker:
+                skipped += 1
+                continue
+            to_schedule.append(invocation)
+        if self.executor is None:
+            evaluated = 0
+            for invocation_id, _, _ in to_schedule:
+                log.debug("Attempting to schedule workflow invocation [%s]", invocation_id)
+                self.__attempt_schedule(invocation_id, workflow_scheduler)
+                evaluated += 1
+                if not self.monitor_running:
+                    break
+        else:
+            evaluated = self.__submit(to_schedule, workflow_scheduler)
+        if self.dependency_tracker is not None:
+            gauge = self.app.execution_timer_factory.gauge
+            gauge(
+                "internal.galaxy.workflows.scheduling_manager.evaluated_invocations",
+                evaluated,
+                scheduler=workflow_scheduler_id,
+            )
+            gauge(
+                "internal.galaxy.workflows.scheduling_manager.skipped_invocations",
+                skipped,
+                scheduler=workflow_scheduler_id,
+            )
+        return invocation_ids
+
+    def __submit(self, invocations, workflow_scheduler):
+        """Schedule ``(id, history_id, user_id)`` invocations in the worker pool and return how many were submitted.
+
+        Invocations of a history are scheduled one after another by a single task and a history is not
+        submitted again while its previous task is still running. Tasks are submitted round-robin across
+        users, so that a user with many (or very large) invocations doesn't hold up everybody else.
+        """
+        assert self.executor is not None
+        for history_id, future in list(self._in_flight.items()):
+            if future.done():
+                del self._in_flight[history_id]
+                exception = future.exception()
+                if exception is not None:
+                    log.error("Exception raised while scheduling workflow invocations", exc_info=exception)
+        submitted = 0
+        for history_id, invocation_ids in round_robin_histories(
+            invocation for invocation in invocations if invocation[1] not in self._in_flight
+        ):
+            self._in_flight[history_id] = self.executor.submit(
+                self.__schedule_history, invocation_ids, workflow_scheduler
+            )
+            submitted += len(invocation_ids)
+        return submitted
+
+    def __schedule_history(self, invocation_ids, workflow_scheduler):
+        # Runs in a worker thread, which doesn't see the fingerprint scope of the monitor step.
+        with self.app.query_fingerprint_stats.scope("workflows.scheduling_manager.schedule_history"):
+            for invocation_id in invocation_ids:
+                if not self.monitor_running:
+                    return
+                log.debug("Attempting to schedule workflow invocation [%s]", invocation_id)
+                self.__attempt_schedule(invocation_id, workflow_scheduler)
+
+    def dependencies_finished(self, job_ids=None, dataset_ids=None):
+        """Wake up invocations waiting on the given (now terminal) jobs and datasets."""
+        if self.dependency_tracker is None:
+            return
+        woken = self.dependency_tracker.dependencies_finished(job_ids or (), dataset_ids or ())
+        if woken:
+            log.debug("Workflow invocations %s no longer blocked", woken)
 
     def __attempt_schedule(self, invocation_id, workflow_scheduler):
+        if self.dependency_tracker is not None:
+            self.dependency_tracker.discard(invocation_id)
         with self.app.model.context() as session:
             workflow_invocation = session.get(model.WorkflowInvocation, invocation_id)
 
@@ -347,7 +597,19 @@ class WorkflowRequestMonitor(Monitors):
                     for i in workflow_invocation.history.workflow_invocations:
                         if i.active and i.id < workflow_invocation.id:
                             return False
-                workflow_scheduler.schedule(workflow_invocation)
+                if self.dependency_tracker is None:
+                    workflow_scheduler.schedule(workflow_invocation)
+                else:
+                    blockers = InvocationBlockers()
+                    since = self.dependency_tracker.begin_evaluation()
+                    try:
+                        workflow_scheduler.schedule(workflow_invocation, blockers=blockers)
+                        if workflow_invocation.active and blockers.known:
+                            self.dependency_tracker.track(
+                                invocation_id, blockers.job_ids, blockers.dataset_ids, since=since
+                            )
+                    finally:
+                        self.dependency_tracker.end_evaluation(since)
                 log.debug("Workflow invocation [%s] scheduled", workflow_invocation.id)
             except Exception:
                 # TODO: eventually fail this - or fail it right away?
@@ -365,8 +627,18 @@ class WorkflowRequestMonitor(Monitors):
             handler=handler,
         )
 
+    def __active_invocations(self, scheduler_id):
+        handler = self.app.config.server_name
+        return model.WorkflowInvocation.poll_active_workflows(
+            self.app.model.engine,
+            scheduler=scheduler_id,
+            handler=handler,
+        )
+
     def start(self):
         self.monitor_thread.start()
 
     def shutdown(self):
         self.shutdown_monitor()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
@@ -444,6 +444,28 @@ class TestHistoriesApi(ApiTestCase, BaseHistories):
         show_response = self._show(history_id)
         assert show_response["annotation"] == quoted_name
 
+    def test_changes(self):
+        history_id = self._create_history("TestHistoryForChanges")["id"]
+        changes_response = self._get(f"histories/{history_id}/changes")
+        self._assert_status_code_is(changes_response, 200)
+        since = changes_response.json()["update_time"]
+        hda = self.dataset_populator.new_dataset(history_id, wait=True)
+        changes_response = self._get(f"histories/{history_id}/changes", data={"since": since, "timeout": 5})
+        self._assert_status_code_is(changes_response, 200)
+        changes = changes_response.json()
+        assert changes["update_time"] > since
+        assert hda["id"] in [item["id"] for item in changes["items"]]
+
+    def test_changes_times_out_without_changes(self):
+        history_id = self._create_history("TestHistoryForChangesTimeout")["id"]
+        self.dataset_populator.new_dataset(history_id, wait=True)
+        since = self._get(f"histories/{history_id}/changes").json()["update_time"]
+        changes_response = self._get(f"histories/{history_id}/changes", data={"since": since, "timeout": 1})
+        self._assert_status_code_is(changes_response, 200)
+        changes = changes_response.json()
+        assert changes["update_time"] == since
+        assert changes["items"] == []
+
     def test_update_invalid_attribute(self):
         history_id = self._create_history("TestHistoryForInvalidUpdating")["id"]
         put_response = self._update(history_id, {"invalidkey": "moo"})
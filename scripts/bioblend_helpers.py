@@ -0,0 +1,16 @@
+"""Helpers shared by the scripts driving a running Galaxy server with bioblend (see ``test/manual``)."""
+
+import random
+
+from bioblend import galaxy
+
+
+def new_user_gi(host: str, api_key: str, name_prefix: str) -> galaxy.GalaxyInstance:
+    """Create a new local user with the admin ``api_key`` and return a ``GalaxyInstance`` acting as that user."""
+    gi = galaxy.GalaxyInstance(host, key=api_key)
+    name = "%s-user-%d" % (name_prefix, random.randint(0, 1000000))
+
+    user = gi.users.create_local_user(name, f"{name}@galaxytesting.dev", "pass123")
+    user_id = user["id"]
+    user_api_key = gi.users.create_user_apikey(user_id)
+    return galaxy.GalaxyInstance(host, user_api_key)
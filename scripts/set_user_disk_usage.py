@@ -44,27 +44,19 @@ def init():
     return init_models_from_config(config, object_store=object_store), object_store, engine
 
 
-def quotacheck(sa_session, users, engine, object_store):
+def quotacheck(sa_session, user, engine, object_store):
     sa_session.refresh(user)
-    current = user.get_disk_usage()
     print(user.username, "<" + user.email + ">:", end=" ")
-
-    if not args.dryrun:
-        # Apply new disk usage
-        user.calculate_and_set_disk_usage(object_store)
-        # And fetch
-        new = user.get_disk_usage()
-    else:
-        new = user.calculate_disk_usage_default_source(object_store)
-
-    print("old usage:", nice_size(current), "change:", end=" ")
-    if new in (current, None):
-        print("none")
-    else:
-        if new > current:
-            print(f"+{nice_size(new - current)}")
-        else:
-            print(f"-{nice_size(current - new)}")
+    # Reports (and unless in dry run mode corrects) how far the recorded usage is off per quota source.
+    drift = user.reconcile_disk_usage(object_store, dry_run=args.dryrun)
+    if not drift:
+        print("change: none")
+        return
+    changes = []
+    for label, amount in sorted(drift.items(), key=lambda item: item[0] or ""):
+        change = f"-{nice_size(amount)}" if amount > 0 else f"+{nice_size(-amount)}"
+        changes.append(f"{label or 'default'} {change}")
+    print("change:", ", ".join(changes))
 
 
 if __name__ == "__main__":
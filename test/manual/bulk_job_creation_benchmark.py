@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Time the creation of jobs for a tool mapped over large collections.
+
+Creates a list of each requested size with the ``create_input_collection`` test tool and
+then maps the ``cat`` test tool over it, reporting how long the tool request that creates
+the jobs took. Run it once against a Galaxy server creating jobs one by one and once against
+a server creating them in bulk to compare both:
+
+% GALAXY_CONFIG_OVERRIDE_BULK_JOB_CREATION_THRESHOLD=0 ./run.sh  # per job creation
+% .venv/bin/python test/manual/bulk_job_creation_benchmark.py --collection_sizes 1000 10000 100000
+% GALAXY_CONFIG_OVERRIDE_BULK_JOB_CREATION_THRESHOLD=100 ./run.sh  # bulk job creation
+% .venv/bin/python test/manual/bulk_job_creation_benchmark.py --collection_sizes 1000 10000 100000
+
+The server needs to be configured with the test tools (e.g. ``tool_config_file:
+test/functional/tools/sample_tool_conf.xml``).
+"""
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+galaxy_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir))
+sys.path[1:1] = [galaxy_root, os.path.join(galaxy_root, "lib"), os.path.join(galaxy_root, "test")]
+
+from scripts.bioblend_helpers import new_user_gi
+
+from galaxy_test.base.populators import GiDatasetPopulator
+
+LONG_TIMEOUT = 1000000000
+DESCRIPTION = "Script to time the creation of jobs for tools mapped over large collections."
+
+
+def main(argv=None):
+    arg_parser = ArgumentParser(description=DESCRIPTION)
+    arg_parser.add_argument("--api_key", default="testmasterapikey")
+    arg_parser.add_argument("--host", default="http://localhost:8080/")
+    arg_parser.add_argument("--collection_sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = arg_parser.parse_args(argv)
+
+    dataset_populator = GiDatasetPopulator(new_user_gi(args.host, args.api_key, "bulktest"))
+    print("collection size\tjob creation (s)\tjobs/s")
+    for collection_size in args.collection_sizes:
+        history_id = dataset_populator.new_history()
+        create_response = dataset_populator.run_tool(
+            "create_input_collection", {"collection_size": collection_size}, history_id
+        )
+        dataset_populator.wait_for_history_jobs(history_id, assert_ok=True, timeout=LONG_TIMEOUT)
+        hdca_id = create_response["output_collections"][0]["id"]
+        inputs = {"input1": {"batch": True, "values": [{"src": "hdca", "id": hdca_id}]}}
+        start = time.perf_counter()
+        run_response = dataset_populator.run_tool("cat", inputs, history_id)
+        elapsed = time.perf_counter() - start
+        assert len(run_response["jobs"]) == collection_size, run_response
+        print(f"{collection_size}\t{elapsed:.2f}\t{collection_size / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Time filling in tool command templates with and without the compiled template cache.
+
+Preparing a job fills in the command line, config file and output label templates of the
+tool. This script fills in a command line template with a different context for each job,
+once clearing the compiled template cache before each job and once keeping it, and reports
+the number of jobs prepared per second:
+
+% .venv/bin/python test/manual/fill_template_benchmark.py --jobs 1000
+"""
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+galaxy_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir))
+sys.path[1:1] = [os.path.join(galaxy_root, "lib"), os.path.join(galaxy_root, "test")]
+
+from galaxy.util.template import (
+    compile_template,
+    fill_template,
+)
+
+DESCRIPTION = "Script to time filling in tool command templates with and without the compiled template cache."
+COMMAND_TEMPLATE = """
+#import os
+#set $reads = []
+#for $i, $input in enumerate($inputs):
+    ln -s '$input' 'input_${i}.fastq' &&
+    #silent $reads.append("input_%s.fastq" % $i)
+#end for
+bowtie2
+    --threads \\${GALAXY_SLOTS:-4}
+    #if $paired == "yes":
+        -1 '${reads[0]}' -2 '${reads[1]}'
+    #else:
+        -U '${",".join($reads)}'
+    #end if
+    #if $advanced.min_score:
+        --score-min '$advanced.min_score'
+    #end if
+    -x '$reference'
+    -S '$output'
+    2> '${os.path.join($working_directory, "bowtie2.log")}'
+"""
+
+
+def _context(job_id):
+    return {
+        "inputs": [f"/data/objects/{job_id}/dataset_{i}.dat" for i in range(2)],
+        "paired": "yes" if job_id % 2 else "no",
+        "advanced": {"min_score": "L,0,-0.6" if job_id % 3 else ""},
+        "reference": "/data/genomes/hg38/bowtie2_index/hg38",
+        "output": f"/data/objects/{job_id}/output.dat",
+        "working_directory": f"/data/jobs/{job_id}/working",
+    }
+
+
+def _time_jobs(jobs, cache):
+    compile_template.cache_clear()
+    start = time.perf_counter()
+    for job_id in range(jobs):
+        if not cache:
+            compile_template.cache_clear()
+        fill_template(COMMAND_TEMPLATE, context=_context(job_id))
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    arg_parser = ArgumentParser(description=DESCRIPTION)
+    arg_parser.add_argument("--jobs", type=int, default=1000)
+    args = arg_parser.parse_args(argv)
+
+    print("cache\tjobs\ttime (s)\tjobs/s")
+    for cache in (False, True):
+        elapsed = _time_jobs(args.jobs, cache)
+        print(f"{'on' if cache else 'off'}\t{args.jobs}\t{elapsed:.2f}\t{args.jobs / elapsed:.1f}")
+    print(compile_template.cache_info())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""Time bulk operations on all contents of large histories.
+
+Creates a list of each requested size with the ``create_input_collection`` test tool and
+then applies each operation to all contents of the history with a single request to the
+``/api/histories/{history_id}/contents/bulk`` endpoint, reporting the time each request took:
+
+% .venv/bin/python test/manual/history_bulk_operation_benchmark.py --history_sizes 1000 10000 30000
+
+The server needs to be configured with the test tools (e.g. ``tool_config_file:
+test/functional/tools/sample_tool_conf.xml``).
+"""
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+galaxy_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir))
+sys.path[1:1] = [galaxy_root, os.path.join(galaxy_root, "lib"), os.path.join(galaxy_root, "test")]
+
+from scripts.bioblend_helpers import new_user_gi
+
+from galaxy_test.base.populators import GiDatasetPopulator
+
+LONG_TIMEOUT = 1000000000
+DESCRIPTION = "Script to time bulk operations on the contents of large histories."
+OPERATIONS = [
+    {"operation": "hide"},
+    {"operation": "unhide"},
+    {"operation": "add_tags", "params": {"type": "add_tags", "tags": ["group:benchmark"]}},
+    {"operation": "remove_tags", "params": {"type": "remove_tags", "tags": ["group:benchmark"]}},
+    {"operation": "delete"},
+    {"operation": "undelete"},
+    {"operation": "purge"},
+]
+
+
+def main(argv=None):
+    arg_parser = ArgumentParser(description=DESCRIPTION)
+    arg_parser.add_argument("--api_key", default="testmasterapikey")
+    arg_parser.add_argument("--host", default="http://localhost:8080/")
+    arg_parser.add_argument("--history_sizes", type=int, nargs="+", default=[1000, 10000, 30000])
+    args = arg_parser.parse_args(argv)
+
+    dataset_populator = GiDatasetPopulator(new_user_gi(args.host, args.api_key, "bulkopstest"))
+    print("history size\t" + "\t".join(f"{payload['operation']} (s)" for payload in OPERATIONS))
+    for history_size in args.history_sizes:
+        history_id = dataset_populator.new_history()
+        dataset_populator.run_tool("create_input_collection", {"collection_size": history_size}, history_id)
+        dataset_populator.wait_for_history_jobs(history_id, assert_ok=True, timeout=LONG_TIMEOUT)
+        timings = []
+        for payload in OPERATIONS:
+            start = time.perf_counter()
+            response = dataset_populator._put(f"histories/{history_id}/contents/bulk", data=payload, json=True)
+            elapsed = time.perf_counter() - start
+            response.raise_for_status()
+            result = response.json()
+            assert not result["errors"], result["errors"]
+            timings.append(elapsed)
+        print(f"{history_size}\t" + "\t".join(f"{timing:.2f}" for timing in timings))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
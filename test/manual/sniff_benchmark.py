@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""Compare datatype sniffing with and without the registry's sniffer index.
+
+Sniffs every file in ``lib/galaxy/datatypes/test`` (or the files passed on the command line)
+with the full sniff order and with ``Registry.sniffer_index``, checks both agree and reports
+the time spent in each.
+
+% .venv/bin/python test/manual/sniff_benchmark.py --repeat 5
+"""
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+galaxy_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir))
+sys.path[1:1] = [os.path.join(galaxy_root, "lib")]
+
+from galaxy.datatypes import sniff
+from galaxy.datatypes.registry import example_datatype_registry_for_sample
+
+DESCRIPTION = "Script to benchmark the sniffer index against walking the full sniff order."
+TEST_DATA = os.path.join(galaxy_root, "lib", "galaxy", "datatypes", "test")
+
+
+def main(argv=None):
+    arg_parser = ArgumentParser(description=DESCRIPTION)
+    arg_parser.add_argument("files", nargs="*", help="files to sniff, defaults to the datatypes test data")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    files = args.files or sorted(
+        os.path.join(TEST_DATA, f) for f in os.listdir(TEST_DATA) if os.path.isfile(os.path.join(TEST_DATA, f))
+    )
+    registry = example_datatype_registry_for_sample()
+    # Read the file prefixes up front, only sniffing is timed.
+    file_prefixes = [sniff.FilePrefix(f) for f in files]
+
+    timings = {}
+    results = {}
+    for label, sniff_order in (("sniff_order", registry.sniff_order), ("sniffer_index", registry.sniffer_index)):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            results[label] = [sniff.guess_ext(file_prefix, sniff_order) for file_prefix in file_prefixes]
+        timings[label] = time.perf_counter() - start
+
+    mismatches = [(f, a, b) for f, a, b in zip(files, results["sniff_order"], results["sniffer_index"]) if a != b]
+    for f, a, b in mismatches:
+        print(f"MISMATCH {f}: {a} (sniff_order) != {b} (sniffer_index)")
+    print(f"Sniffed {len(files)} files {args.repeat} times")
+    for label, timing in timings.items():
+        print(f"{label}: {timing:.3f}s ({timing / (len(files) * args.repeat) * 1000:.3f}ms per file)")
+    print(f"Speedup: {timings['sniff_order'] / timings['sniffer_index']:.2f}x")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
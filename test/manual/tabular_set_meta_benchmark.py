@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+"""Compare ``Tabular.set_meta`` against the previous line by line implementation.
+
+Generates a tabular file (or uses the files passed on the command line), sets metadata with
+``Tabular.set_meta`` and with a reference implementation that reads the file with ``readline()``
+and classifies every cell, checks both agree and reports the time spent in each.
+
+% .venv/bin/python test/manual/tabular_set_meta_benchmark.py --lines 1000000 --max-data-lines 0
+"""
+import os
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+
+galaxy_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir))
+sys.path[1:1] = [os.path.join(galaxy_root, "lib")]
+
+from galaxy.datatypes.tabular import (
+    MAX_DATA_LINES,
+    Tabular,
+)
+from galaxy.util import compression_utils
+from galaxy.util.bunch import Bunch
+
+DESCRIPTION = "Script to benchmark Tabular.set_meta against a line by line reference implementation."
+COLUMN_TYPE_ORDER = ["int", "float", "list", "str"]
+
+
+class BenchmarkDataset:
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self.metadata = Bunch()
+
+    def get_file_name(self, sync_cache=True):
+        return self.file_name
+
+    def has_data(self):
+        return True
+
+    def get_size(self):
+        return os.path.getsize(self.file_name)
+
+
+def guess_column_type(column_text):
+    if "_" not in column_text:
+        try:
+            int(column_text)
+            return "int"
+        except ValueError:
+            pass
+        try:
+            float(column_text)
+            return "float"
+        except ValueError:
+            if column_text.strip().lower() == "na":
+                return "float"
+    if "," in column_text:
+        return "list"
+    if column_text != "":
+        return "str"
+    return None
+
+
+def reference_set_meta(dataset, skip=None, max_data_lines=MAX_DATA_LINES):
+    """The line by line algorithm ``Tabular.set_meta`` used before reading the file in chunks."""
+    requested_skip = skip
+    skip = skip or 0
+    data_lines = comment_lines = 0
+    column_types: list = []
+    first_line_column_types: list = []
+    with compression_utils.get_fileobj(dataset.get_file_name()) as dataset_fh:
+        for i, line in enumerate(iter(dataset_fh.readline, "")):
+            line = line.rstrip("\r\n")
+            if i < skip or not line or line.startswith("#"):
+                comment_lines += 1
+            else:
+                data_lines += 1
+                for field_count, field in enumerate(line.split("\t")):
+                    if field_count >= len(column_types):
+                        column_types.append(None)
+                    column_type = guess_column_type(field)
+                    old_column_type = column_types[field_count]
+                    if column_type is not None and (
+                        old_column_type is None
+                        or COLUMN_TYPE_ORDER.index(column_type) > COLUMN_TYPE_ORDER.index(old_column_type)
+                    ):
+                        column_types[field_count] = column_type
+                if i == 0 and requested_skip is None:
+                    first_line_column_types = column_types
+                    column_types = [None for _ in first_line_column_types]
+            if max_data_lines is not None and data_lines >= max_data_lines:
+                if dataset_fh.tell() != dataset.get_size():
+                    data_lines = comment_lines = None
+                break
+    column_types.extend(first_line_column_types[len(column_types) :])
+    for i, column_type in enumerate(column_types):
+        if column_type is None:
+            first_line_column_type = first_line_column_types[i] if i < len(first_line_column_types) else None
+            column_types[i] = first_line_column_type or "str"
+    dataset.metadata.data_lines = data_lines
+    dataset.metadata.comment_lines = comment_lines
+    dataset.metadata.column_types = column_types
+    dataset.metadata.columns = len(column_types)
+
+
+def write_test_file(path, lines):
+    with open(path, "w") as fh:
+        fh.write("chrom\tstart\tend\tname\tscore\tstrand\ttags\n")
+        for i in range(lines):
+            if i % 10000 == 0:
+                fh.write("# a comment line\n")
+            strand = "+-"[i % 2]
+            fh.write(f"chr{i % 22 + 1}\t{i * 10}\t{i * 10 + 150}\tfeature{i % 5000}\t{i / 7:.3f}\t{strand}")
+            fh.write(f"\t{i % 3},{i % 5}\n")
+
+
+def main(argv=None):
+    arg_parser = ArgumentParser(description=DESCRIPTION)
+    arg_parser.add_argument("files", nargs="*", help="tabular files to use, defaults to a generated file")
+    arg_parser.add_argument("--lines", type=int, default=500000, help="number of lines of the generated file")
+    arg_parser.add_argument(
+        "--max-data-lines",
+        type=int,
+        default=MAX_DATA_LINES,
+        help="max_data_lines to pass to set_meta, 0 means the whole file is read",
+    )
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+    max_data_lines = args.max_data_lines or None
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        files = args.files
+        if not files:
+            files = [os.path.join(tmpdir, "benchmark.tabular")]
+            write_test_file(files[0], args.lines)
+        timings = {}
+        results = {}
+        for label, set_meta in (
+            ("reference", lambda dataset: reference_set_meta(dataset, max_data_lines=max_data_lines)),
+            ("set_meta", lambda dataset: Tabular().set_meta(dataset, max_data_lines=max_data_lines)),
+        ):
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                datasets = [BenchmarkDataset(f) for f in files]
+                for dataset in datasets:
+                    set_meta(dataset)
+            timings[label] = time.perf_counter() - start
+            results[label] = [
+                {key: dataset.metadata.get(key) for key in ("data_lines", "comment_lines", "column_types", "columns")}
+                for dataset in datasets
+            ]
+
+    mismatches = [(f, a, b) for f, a, b in zip(files, results["reference"], results["set_meta"]) if a != b]
+    for f, a, b in mismatches:
+        print(f"MISMATCH {f}: {a} (reference) != {b} (set_meta)")
+    print(f"Set metadata of {len(files)} files {args.repeat} times (max_data_lines={max_data_lines})")
+    for label, timing in timings.items():
+        print(f"{label}: {timing:.3f}s ({timing / (len(files) * args.repeat):.3f}s per file)")
+    print(f"Speedup: {timings['reference'] / timings['set_meta']:.2f}x")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
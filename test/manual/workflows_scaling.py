@@ -8,17 +8,17 @@ $ .venv/bin/python scripts/summarize_timings.py --file /tmp/<work_dir>/handler1.
 import functools
 import json
 import os
-import random
 import sys
 from argparse import ArgumentParser
 from threading import Thread
 from uuid import uuid4
 
-from bioblend import galaxy
 from gxformat2 import python_to_workflow
 
 galaxy_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir))
-sys.path[1:1] = [os.path.join(galaxy_root, "lib"), os.path.join(galaxy_root, "test")]
+sys.path[1:1] = [galaxy_root, os.path.join(galaxy_root, "lib"), os.path.join(galaxy_root, "test")]
+
+from scripts.bioblend_helpers import new_user_gi
 
 from galaxy_test.base.populators import (
     GiDatasetCollectionPopulator,
@@ -55,7 +55,7 @@ def main(argv=None):
     if not has_input:
         uuid = None
 
-    gi = _gi(args)
+    gi = new_user_gi(args.host, args.api_key, "wftest")
 
     workflow = python_to_workflow(workflow_struct)
     workflow_info = gi.workflows.import_workflow_json(workflow)
@@ -170,16 +170,5 @@ def _link(link, output_name=None):
     return {"$link": link}
 
 
-def _gi(args):
-    gi = galaxy.GalaxyInstance(args.host, key=args.api_key)
-    name = "wftest-user-%d" % random.randint(0, 1000000)
-
-    user = gi.users.create_local_user(name, f"{name}@galaxytesting.dev", "pass123")
-    user_id = user["id"]
-    api_key = gi.users.create_user_apikey(user_id)
-    user_gi = galaxy.GalaxyInstance(args.host, api_key)
-    return user_gi
-
-
 if __name__ == "__main__":
     main()
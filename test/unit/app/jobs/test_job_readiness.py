@@ -0,0 +1,94 @@
+from galaxy import model
+from galaxy.app_unittest_utils import galaxy_mock
+from galaxy.jobs.handler import (
+    JobHandlerQueue,
+    JobReadinessTracker,
+)
+
+
+def test_job_without_pending_inputs_is_ready():
+    tracker = JobReadinessTracker()
+    tracker.track(1)
+    tracker.track(2, [])
+    assert tracker.ready == {1, 2}
+    assert 1 in tracker
+    assert len(tracker) == 2
+    assert not tracker.blocking_dataset_ids
+
+
+def test_job_ready_after_last_input():
+    tracker = JobReadinessTracker()
+    tracker.track(1, [10, 11])
+    tracker.track(2, [11])
+    assert tracker.blocking_dataset_ids == {10, 11}
+    assert tracker.inputs_ready([11]) == [2]
+    assert tracker.ready == {2}
+    assert tracker.blocking_dataset_ids == {10}
+    # unknown datasets and repeated notifications are ignored
+    assert tracker.inputs_ready([11, 12]) == []
+    assert tracker.inputs_ready([10]) == [1]
+    assert tracker.ready == {1, 2}
+    assert not tracker.blocking_dataset_ids
+
+
+def test_discard():
+    tracker = JobReadinessTracker()
+    tracker.track(1, [10])
+    tracker.track(2, [10, 11])
+    tracker.track(3)
+    tracker.discard(2)
+    tracker.discard(3)
+    assert 2 not in tracker
+    assert 3 not in tracker
+    assert tracker.blocking_dataset_ids == {10}
+    assert tracker.inputs_ready([10, 11]) == [1]
+    tracker.clear()
+    assert len(tracker) == 0
+
+
+class TestReadyJobs:
+    def setup_method(self):
+        self.app = galaxy_mock.MockApp()
+        self.app.config.server_name = "handler0"
+        self.app.config.track_jobs_in_database = True
+        self.app.config.job_handler_incremental_readiness = True
+        self.app.config.job_handler_readiness_reconcile_interval = 3600
+        self.app.job_config.handler_assignment_methods = []
+        self.app.job_config.handler_ready_window_size = 100
+        self.session = self.app.model.context
+        self.queue = JobHandlerQueue(self.app, dispatcher=None)
+
+    def _job_with_input(self, dataset_state):
+        hda = model.HistoryDatasetAssociation(create_dataset=True, sa_session=self.session)
+        hda.dataset.state = dataset_state
+        job = model.Job()
+        job.state = model.Job.states.NEW
+        job.handler = "handler0"
+        job.add_input_dataset("input1", hda)
+        self.session.add_all([hda, job])
+        self.session.commit()
+        return job
+
+    def test_job_with_input_not_ready_is_excluded(self):
+        waiting_job = self._job_with_input(model.Dataset.states.QUEUED)
+        ready_job = self._job_with_input(model.Dataset.states.OK)
+        ready_jobs = self.queue._JobHandlerQueue__get_ready_jobs()
+        assert [job.id for job in ready_jobs] == [ready_job.id]
+        assert waiting_job.id not in {job.id for job in ready_jobs}
+
+    def test_job_with_input_not_ready_is_excluded_incremental(self):
+        waiting_job = self._job_with_input(model.Dataset.states.QUEUED)
+        ready_job = self._job_with_input(model.Dataset.states.OK)
+        tracker = self.queue.readiness_tracker
+        assert tracker is not None
+        ready_jobs = self.queue._JobHandlerQueue__get_ready_jobs_incremental(tracker)
+        assert [job.id for job in ready_jobs] == [ready_job.id]
+        # the input becoming ready is announced, only then the job is picked up
+        waiting_dataset = waiting_job.input_datasets[0].dataset.dataset
+        waiting_dataset.state = model.Dataset.states.OK
+        self.session.commit()
+        ready_jobs = self.queue._JobHandlerQueue__get_ready_jobs_incremental(tracker)
+        assert waiting_job.id not in {job.id for job in ready_jobs}
+        self.queue.notify_inputs_ready([waiting_dataset.id])
+        ready_jobs = self.queue._JobHandlerQueue__get_ready_jobs_incremental(tracker)
+        assert {job.id for job in ready_jobs} == {waiting_job.id, ready_job.id}
@@ -23,7 +23,9 @@ from galaxy.model import (
 )
 from galaxy.objectstore import BaseObjectStore
 from galaxy.tools import ToolBox
+from galaxy.util import StructuredExecutionTimer
 from galaxy.util.bunch import Bunch
+from galaxy.util.template import compile_template
 from galaxy.util.unittest import TestCase
 
 TEST_TOOL_ID = "cufftest"
@@ -93,6 +95,26 @@ class TestJobWrapper(AbstractTestCases.BaseWrapperTestCase):
     def _wrapper(self):
         return JobWrapper(self.job, self.queue)  # type: ignore[arg-type]
 
+    def test_prepare_timer_not_tagged_with_job_id(self):
+        tags = []
+
+        class RecordingTimer(StructuredExecutionTimer):
+            def to_str(self, **kwd):
+                tags.append(kwd)
+                return super().to_str(**kwd)
+
+        self.app.execution_timer_factory.get_timer = RecordingTimer
+        with self._prepared_wrapper():
+            assert tags == [{"tool_id": TEST_TOOL_ID, "destination_id": "unknown"}]
+
+    def test_prepare_reports_compiled_template_cache(self):
+        gauges = {}
+        self.app.execution_timer_factory.gauge = lambda path, value, **tags: gauges.__setitem__(path, value)
+        with self._prepared_wrapper():
+            cache_info = compile_template.cache_info()
+            assert gauges["internals.galaxy.util.template.compiled_template_cache.hits"] == cache_info.hits
+            assert gauges["internals.galaxy.util.template.compiled_template_cache.misses"] == cache_info.misses
+
 
 class TestTaskWrapper(AbstractTestCases.BaseWrapperTestCase):
     def setUp(self):
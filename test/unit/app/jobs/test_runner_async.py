@@ -0,0 +1,90 @@
+from galaxy import model
+from galaxy.app_unittest_utils import galaxy_mock
+from galaxy.jobs import JobDestination
+from galaxy.jobs.runners import (
+    AsynchronousJobRunner,
+    AsynchronousJobState,
+)
+from galaxy.util.bunch import Bunch
+
+
+class BulkStatusJobRunner(AsynchronousJobRunner):
+    runner_name = "BulkStatusRunner"
+
+    def __init__(self, app, nworkers, **kwargs):
+        super().__init__(app, nworkers, **kwargs)
+        self.status_calls = []
+
+    def get_external_job_states(self, job_destination, external_job_ids):
+        self.status_calls.append((job_destination.id, external_job_ids))
+        return {external_job_id: model.Job.states.RUNNING for external_job_id in external_job_ids}
+
+
+class TestAsynchronousJobRunnerStates:
+    def setup_method(self):
+        self.app = galaxy_mock.MockApp()
+        self.session = self.app.model.context
+        self.runner = BulkStatusJobRunner(self.app, 1)
+
+    def _job_state(
+        self, galaxy_state=model.Job.states.QUEUED, destination_id="cluster", external_job_id=None, is_task=False
+    ):
+        job = model.Job()
+        job.state = galaxy_state
+        self.session.add(job)
+        self.session.commit()
+
+        def get_state():
+            raise AssertionError("Galaxy job state should have been fetched in bulk")
+
+        job_wrapper = Bunch(
+            app=self.app,
+            job_id=job.id,
+            is_task=is_task,
+            get_state=get_state,
+            get_id_tag=lambda: str(job.id),
+            tool=Bunch(old_id="test_tool"),
+            user=None,
+        )
+        return AsynchronousJobState(
+            job_wrapper=job_wrapper,
+            job_id=external_job_id or f"external-{job.id}",
+            job_destination=JobDestination(id=destination_id),
+        )
+
+    def test_galaxy_job_states_fetched_in_bulk(self):
+        queued = self._job_state()
+        running = self._job_state(model.Job.states.RUNNING)
+        deleted = self._job_state(model.Job.states.DELETED)
+        task = self._job_state(is_task=True)
+        self.runner.watched = [queued, running, deleted, task]
+        states = self.runner.get_galaxy_job_states(self.runner.watched)
+        assert states == {
+            queued.job_wrapper.job_id: model.Job.states.QUEUED,
+            running.job_wrapper.job_id: model.Job.states.RUNNING,
+            deleted.job_wrapper.job_id: model.Job.states.DELETED,
+        }
+        self.runner.watched_galaxy_job_states = states
+        assert self.runner.get_galaxy_job_state(running) == model.Job.states.RUNNING
+        assert self.runner.get_galaxy_job_state(deleted) == model.Job.states.DELETED
+        # tasks are not part of the bulk lookup and still ask their wrapper
+        task.job_wrapper.get_state = lambda: model.Job.states.QUEUED
+        assert self.runner.get_galaxy_job_state(task) == model.Job.states.QUEUED
+
+    def test_galaxy_job_states_without_watched_jobs(self):
+        assert self.runner.get_galaxy_job_states([]) == {}
+
+    def test_external_job_states_queried_once_per_destination(self):
+        self.runner.watched = [
+            self._job_state(destination_id="cluster", external_job_id="1"),
+            self._job_state(destination_id="cloud", external_job_id="2"),
+            self._job_state(destination_id="cluster", external_job_id="3"),
+        ]
+        states = self.runner.get_watched_external_job_states()
+        assert states == {"1": model.Job.states.RUNNING, "2": model.Job.states.RUNNING, "3": model.Job.states.RUNNING}
+        assert sorted(self.runner.status_calls) == [("cloud", ["2"]), ("cluster", ["1", "3"])]
+
+    def test_external_job_states_default_to_individual_checks(self):
+        runner = AsynchronousJobRunner(self.app, 1)
+        runner.watched = [self._job_state(external_job_id="1")]
+        assert runner.get_watched_external_job_states() == {}
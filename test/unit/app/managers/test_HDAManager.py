@@ -9,8 +9,13 @@ from galaxy import (
 )
 from galaxy.app_unittest_utils.galaxy_mock import mock_url_builder
 from galaxy.managers import hdas
+from galaxy.managers.collections import DatasetCollectionManager
 from galaxy.managers.datasets import DatasetManager
+from galaxy.managers.hdcas import HDCAManager
 from galaxy.managers.histories import HistoryManager
+from galaxy.model.base import transaction
+from galaxy.schema.schema import HistoryContentItemOperation
+from galaxy.webapps.galaxy.services.history_contents import HistoryItemOperator
 from .base import BaseTestCase
 
 # =============================================================================
@@ -160,6 +165,36 @@ class TestHDAManager(HDATestCase):
         assert item1.deleted
         assert item1.purged
 
+    def test_bulk_purge_adjusts_usage_like_purge(self):
+        owner = self.user_manager.create(**user2_data)
+        history1 = self.history_manager.create(name="history1", user=owner)
+
+        def create_hda(total_size=0, dataset=None):
+            if dataset is None:
+                dataset = self.dataset_manager.create(state=model.Dataset.states.OK)
+                dataset.total_size = total_size
+            return self.hda_manager.create(history=history1, dataset=dataset)
+
+        hda1 = create_hda(10)
+        # two HDAs of the same dataset purged together only free its size once
+        hda2 = create_hda(5)
+        hda2_copy = create_hda(dataset=hda2.dataset)
+        # a dataset the user keeps another HDA of doesn't free anything
+        hda3 = create_hda(7)
+        create_hda(dataset=hda3.dataset)
+        owner.disk_usage = 22
+        with transaction(self.trans.sa_session):
+            self.trans.sa_session.commit()
+
+        operator = HistoryItemOperator(self.hda_manager, self.app[HDCAManager], self.app[DatasetCollectionManager])
+        hda_ids = [hda1.id, hda2.id, hda2_copy.id, hda3.id]
+        assert operator.apply_to_ids(HistoryContentItemOperation.purge, hda_ids, [], None, self.trans) == ([], [])
+        self.trans.sa_session.refresh(owner)
+        assert owner.disk_usage == 7
+        for hda in (hda1, hda2, hda2_copy, hda3):
+            self.trans.sa_session.refresh(hda)
+            assert hda.purged
+
     def test_purge_not_allowed(self):
         self.trans.app.config.allow_user_dataset_purge = False
 
@@ -257,6 +292,29 @@ class TestHDAManager(HDATestCase):
                 current_history=self.trans.history,
             )
 
+    def test_get_accessible_by_ids(self):
+        owner = self.user_manager.create(**user2_data)
+        non_owner = self.user_manager.create(**user3_data)
+        history1 = self.history_manager.create(name="history1", user=owner)
+        items = [self.hda_manager.create(history=history1, dataset=self.dataset_manager.create()) for _ in range(3)]
+        ids = [item.id for item in items]
+
+        self.log("should return all hdas keyed by id")
+        accessible = self.hda_manager.get_accessible_by_ids(ids, non_owner)
+        assert accessible == {item.id: item for item in items}
+
+        self.log("should raise if any of the hdas doesn't exist")
+        with self.assertRaises(exceptions.ObjectNotFound):
+            self.hda_manager.get_accessible_by_ids([*ids, max(ids) + 1], owner)
+
+        self.log("should raise if any of the hdas is not accessible")
+        self.dataset_manager.permissions.set_private_to_one_user(items[1].dataset, owner)
+        assert self.hda_manager.get_accessible_by_ids(ids, owner) == {item.id: item for item in items}
+        with self.assertRaises(exceptions.ItemAccessibilityException):
+            self.hda_manager.get_accessible_by_ids(ids, non_owner)
+        with self.assertRaises(exceptions.ItemAccessibilityException):
+            self.hda_manager.get_accessible_by_ids(ids, None)
+
     def test_anon_ownership(self):
         anon_user = None
         self.trans.set_user(anon_user)
@@ -380,6 +438,37 @@ class TestHDASerializer(HDATestCase):
                 or is_metadata(key)
             ), f"No serializer for: {key} ({instantiated_attribute})"
 
+    def test_serialize_summaries(self):
+        owner = self.user_manager.create(**user2_data)
+        non_owner = self.user_manager.create(**user3_data)
+        history = self.history_manager.create(name="history1", user=owner)
+        hda1 = self.hda_manager.create(history=history, dataset=self.dataset_manager.create(), hid=1)
+        hda2 = self.hda_manager.create(history=history, dataset=self.dataset_manager.create(), hid=2)
+        hda2.dbkey = "hg19"
+        hda2.visible = False
+        self.app.tag_handler.set_tags_from_list(owner, hda2, ["name:out", "group:a", "b"])
+        restricted = self.hda_manager.create(history=history, dataset=self.dataset_manager.create(), hid=3)
+        self.dataset_manager.permissions.set_private_to_one_user(restricted.dataset, owner)
+        self.trans.sa_session.commit()
+        hdas = [hda1, hda2, restricted]
+
+        summaries_by_user = {}
+        for user in (owner, non_owner, None):
+            self.log(f"summaries should match the summary view for {user}")
+            summaries = self.hda_serializer.serialize_summaries([hda.id for hda in hdas], user=user, trans=self.trans)
+            for hda in hdas:
+                expected = self.hda_serializer.serialize_to_view(
+                    hda, view="summary", user=user, trans=self.trans, encode_id=False
+                )
+                summary = summaries[hda.id]
+                assert ("url" in summary) == ("url" in expected)
+                summary.pop("url", None)
+                expected.pop("url", None)
+                assert summary == expected
+            summaries_by_user[user] = summaries
+        assert summaries_by_user[owner][hda2.id]["tags"] == ["name:out", "b", "group:a"]
+        assert summaries_by_user[non_owner][restricted.id]["accessible"] is False
+
     def test_views_and_keys(self):
         hda = self._create_vanilla_hda()
 
@@ -0,0 +1,60 @@
+import asyncio
+from datetime import (
+    datetime,
+    timedelta,
+)
+
+import pytest
+
+from galaxy.managers.history_changes import HistoryChangeFeed
+
+
+class StaticHistoryChangeFeed(HistoryChangeFeed):
+    """Reads the update times of histories from a dict instead of the database."""
+
+    def __init__(self, update_times):
+        super().__init__(engine=None, poll_interval=0.01)  # type: ignore[arg-type]
+        self.update_times = update_times
+        self.checked = []
+
+    def check(self, history_ids):
+        self.checked.append(sorted(history_ids))
+        for history_id in history_ids:
+            if history_id in self.update_times:
+                self.notify(history_id, self.update_times[history_id])
+
+
+@pytest.mark.asyncio
+async def test_wait_for_change_times_out():
+    since = datetime.utcnow()
+    feed = StaticHistoryChangeFeed({1: since})
+    assert await feed.wait_for_change(1, since, timeout=0.05) is None
+    feed.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_change():
+    since = datetime.utcnow()
+    update_times = {1: since, 2: since}
+    feed = StaticHistoryChangeFeed(update_times)
+    waiting = asyncio.gather(
+        feed.wait_for_change(1, since, timeout=1),
+        feed.wait_for_change(2, since, timeout=0.2),
+    )
+    await asyncio.sleep(0.05)
+    changed = since + timedelta(seconds=1)
+    update_times[1] = changed
+    assert await waiting == [changed, None]
+    # both histories are checked with a single query
+    assert [1, 2] in feed.checked
+    feed.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_poll_thread_stops_without_waiters():
+    since = datetime.utcnow()
+    feed = StaticHistoryChangeFeed({1: since + timedelta(seconds=1)})
+    assert await feed.wait_for_change(1, since, timeout=1) == since + timedelta(seconds=1)
+    await asyncio.sleep(0.05)
+    assert feed._thread is None
+    feed.shutdown()
@@ -0,0 +1,77 @@
+from unittest import mock
+
+from galaxy import model
+from galaxy.managers.datasets import DatasetManager
+from galaxy.managers.hdas import HDAManager
+from galaxy.managers.histories import HistoryManager
+from galaxy.managers.jobs import JobSearch
+from .base import BaseTestCase
+
+
+class TestJobSearchFingerprint(BaseTestCase):
+    def set_up_managers(self):
+        super().set_up_managers()
+        self.job_search = self.app[JobSearch]
+        self.hda_manager = self.app[HDAManager]
+        self.history_manager = self.app[HistoryManager]
+        self.dataset_manager = self.app[DatasetManager]
+
+    def _param_dump(self, hda_id, value="1"):
+        return {
+            "input1": {"values": [{"src": "hda", "id": hda_id}]},
+            "input1|__identifier__": "input1",
+            "param": value,
+            "__workflow_invocation_uuid__": "abc",
+        }
+
+    def test_fingerprint(self):
+        history = self.history_manager.create(name="history", user=self.admin_user)
+        hda = self.hda_manager.create(history=history, dataset=self.dataset_manager.create())
+        other_hda = self.hda_manager.create(history=history, dataset=self.dataset_manager.create())
+        copied_hda = self.hda_manager.copy(hda, history=history)
+        fingerprint = self.job_search.fingerprint("cat1", "1.0.0", self._param_dump(hda.id))
+        assert fingerprint
+        self.log("copies of an input have the same fingerprint")
+        assert self.job_search.fingerprint("cat1", "1.0.0", self._param_dump(copied_hda.id)) == fingerprint
+        self.log("internal parameters and identifiers are ignored")
+        param_dump = self._param_dump(hda.id)
+        param_dump["__workflow_invocation_uuid__"] = "def"
+        param_dump["input1|__identifier__"] = "other"
+        assert self.job_search.fingerprint("cat1", "1.0.0", param_dump) == fingerprint
+        self.log("inputs, parameters and tool versions are distinguished")
+        assert self.job_search.fingerprint("cat1", "1.0.0", self._param_dump(other_hda.id)) != fingerprint
+        assert self.job_search.fingerprint("cat1", "1.0.0", self._param_dump(hda.id, "2")) != fingerprint
+        assert self.job_search.fingerprint("cat1", "1.0.1", self._param_dump(hda.id)) != fingerprint
+
+    def test_fingerprint_unknown_input(self):
+        assert self.job_search.fingerprint("cat1", "1.0.0", self._param_dump(1234567)) is None
+
+    def test_by_tool_input_uses_fingerprint(self):
+        self.app.config.job_cache_fingerprints = True
+        history = self.history_manager.create(name="history", user=self.admin_user)
+        hda = self.hda_manager.create(history=history, dataset=self.dataset_manager.create())
+        param_dump = self._param_dump(hda.id)
+        fingerprint = self.job_search.fingerprint("cat1", "1.0.0", param_dump)
+        assert any(index.columns.keys() == ["fingerprint"] for index in model.Job.table.indexes)
+
+        def by_tool_input():
+            with mock.patch.object(self.job_search, "_JobSearch__search", return_value=None) as search:
+                self.job_search.by_tool_input(
+                    self.trans, "cat1", "1.0.0", param={"input1": hda, "param": "1"}, param_dump=param_dump
+                )
+            return search
+
+        self.log("jobs are not searched if no job has the fingerprint")
+        assert not by_tool_input().called
+        self.log("only jobs with the fingerprint are searched")
+        job = model.Job()
+        job.tool_id = "cat1"
+        job.tool_version = "1.0.0"
+        job.user = self.admin_user
+        job.fingerprint = fingerprint
+        session = self.trans.sa_session
+        session.add(job)
+        session.commit()
+        assert by_tool_input().call_args.kwargs["job_ids"] == [job.id]
+        stmt = self.job_search._build_job_subquery("cat1", self.admin_user.id, "1.0.0", "ok", {}, [job.id])
+        assert "job.id IN" in str(stmt)
@@ -89,6 +89,27 @@ class TestTagHandler(BaseTestCase):
         self.tag_handler.remove_tags_from_list(self.user, hda, ["tag1", "tag3"])
         self._check_tag_list(hda.tags, ["tag2"])
 
+    def test_add_tags_to_items(self):
+        hdas = [self._create_vanilla_hda() for _ in range(3)]
+        self.tag_handler.add_tags_from_list(self.user, hdas[0], ["tag1"])
+        self.tag_handler.add_tags_to_items(
+            self.user, type(hdas[0]), [hda.id for hda in hdas[:2]], ["tag1", "group:Group1"]
+        )
+        for hda in hdas:
+            self.trans.sa_session.expire(hda)
+        self._check_tag_list(hdas[0].tags, ["tag1", "group:Group1"])
+        self._check_tag_list(hdas[1].tags, ["tag1", "group:Group1"])
+        assert hdas[2].tags == []
+
+    def test_remove_tags_from_items(self):
+        hdas = [self._create_vanilla_hda() for _ in range(2)]
+        for hda in hdas:
+            self.tag_handler.set_tags_from_list(self.user, hda, ["tag1", "tag2", "name:a:b"])
+        self.tag_handler.remove_tags_from_items(type(hdas[0]), [hda.id for hda in hdas], ["tag1", "name:a:b"])
+        for hda in hdas:
+            self.trans.sa_session.expire(hda)
+            self._check_tag_list(hda.tags, ["tag2"])
+
     def test_delete_item_tags(self):
         hda = self._create_vanilla_hda()
         tags = ["tag1"]
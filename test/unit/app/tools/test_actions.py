@@ -1,12 +1,17 @@
 import string
 from typing import (
     cast,
+    List,
     Optional,
 )
+from unittest import mock
+
+from sqlalchemy import event
 
 from galaxy import model
 from galaxy.app_unittest_utils import tools_support
 from galaxy.exceptions import UserActivationRequiredException
+from galaxy.managers.jobs import JobSearch
 from galaxy.model.base import transaction
 from galaxy.objectstore import BaseObjectStore
 from galaxy.tool_util.parser.output_objects import ToolOutput
@@ -15,6 +20,12 @@ from galaxy.tools.actions import (
     DefaultToolAction,
     determine_output_format,
     on_text_for_names,
+    ToolExecutionCache,
+)
+from galaxy.tools.execute import (
+    execute,
+    input_dataset_ids,
+    MappingParameters,
 )
 from galaxy.util import XML
 from galaxy.util.unittest import TestCase
@@ -123,6 +134,87 @@ class TestDefaultToolAction(TestCase, tools_support.UsesTools):
             return
         raise AssertionError("Tool execution succeeded for inactive user!")
 
+    def test_prefetch_datasets(self):
+        hdas = [self.__add_dataset() for _ in range(3)]
+        dataset_ids = [hda.dataset_id for hda in hdas]
+        self.app.model.context.expunge_all()
+        execution_cache = ToolExecutionCache(self.trans)
+        with self._count_queries() as statements:
+            execution_cache.prefetch_datasets(dataset_ids + dataset_ids)
+        # one query for the datasets, one for their permissions
+        assert len(statements) == 2
+        with self._count_queries() as statements:
+            for dataset_id in dataset_ids:
+                assert execution_cache.datasets[dataset_id].actions == []
+            execution_cache.prefetch_datasets(dataset_ids)
+        assert not statements
+
+    def test_input_dataset_ids(self):
+        hdas = [self.__add_dataset() for _ in range(3)]
+        collection = model.DatasetCollection(collection_type="list")
+        dce = model.DatasetCollectionElement(collection=collection, element=hdas[2], element_identifier="e1")
+        param_combinations = [
+            {"param1": hdas[0], "repeat1": [{"param2": hdas[1]}]},
+            {"param1": dce, "repeat1": [{"param2": hdas[1]}], "text": "moo"},
+        ]
+        assert input_dataset_ids(param_combinations) == {hda.dataset_id for hda in hdas}
+
+    def test_bulk_execute_creates_same_jobs(self):
+        self._init_tool(tools_support.SIMPLE_CAT_TOOL_CONTENTS)
+        hdas = [self.__add_dataset() for _ in range(3)]
+        param_combinations = [{"param1": hda, "repeat1": []} for hda in hdas]
+
+        def execute_jobs(bulk_threshold):
+            self.app.config.bulk_job_creation_threshold = bulk_threshold
+            history = model.History()
+            session = self.app.model.context
+            session.add(history)
+            with transaction(session):
+                session.commit()
+            with mock.patch("galaxy.tools.execute.input_dataset_ids", wraps=input_dataset_ids) as prefetch:
+                execution_tracker = execute(
+                    self.trans,
+                    self.tool,
+                    MappingParameters({}, param_combinations),
+                    history,
+                    completed_jobs={i: None for i in range(len(param_combinations))},
+                )
+            assert prefetch.called == (bulk_threshold > 0)
+            assert not execution_tracker.execution_errors
+            return self._summarize_jobs(execution_tracker.successful_jobs)
+
+        assert execute_jobs(bulk_threshold=0) == execute_jobs(bulk_threshold=2)
+
+    def test_job_fingerprint_stored(self):
+        self.app.config.job_cache_fingerprints = True
+        self.app.job_search = self.app[JobSearch]
+        hda = self.__add_dataset()
+        with mock.patch.object(
+            self.app.job_search, "_input_identities", wraps=self.app.job_search._input_identities
+        ) as input_identities:
+            job, _ = self._simple_execute(tools_support.SIMPLE_CAT_TOOL_CONTENTS, {"param1": hda, "repeat1": []})
+        # the input is identified from the HDA passed in, not looked up in the database
+        assert not any(input_identities.call_args.args[0].values())
+        param_dump = self.tool.params_to_strings({"param1": hda, "repeat1": []}, self.app, nested=True)
+        assert job.fingerprint
+        assert job.fingerprint == self.app.job_search.fingerprint(self.tool.id, self.tool.version, param_dump)
+
+    def _summarize_jobs(self, jobs: List[model.Job]):
+        self.app.model.context.expire_all()
+        return [
+            (
+                job.tool_id,
+                job.state,
+                sorted((p.name, p.value) for p in job.parameters),
+                [(a.name, a.dataset.id) for a in job.input_datasets],
+                [(a.name, a.dataset.hid, a.dataset.name, a.dataset.state) for a in job.output_datasets],
+            )
+            for job in jobs
+        ]
+
+    def _count_queries(self):
+        return _QueryCounter(self.app.model.engine)
+
     def __add_dataset(self, state="ok"):
         hda = model.HistoryDatasetAssociation()
         hda.dataset = model.Dataset()
@@ -149,6 +241,22 @@ class TestDefaultToolAction(TestCase, tools_support.UsesTools):
         return job, out_data
 
 
+class _QueryCounter:
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements: List[str] = []
+
+    def _record(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self.statements
+
+    def __exit__(self, *args):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
 def test_determine_output_format():
     # Test simple case of explicitly defined output with no changes.
     direct_output = quick_output("txt")
@@ -111,6 +111,17 @@ class TestToolExecution(TestCase, tools_support.UsesTools):
         assert len(self.tool_action.execution_call_args) == 1
         assert self.tool_action.execution_call_args[0]["incoming"]["param1"] == hda
 
+    def test_data_param_execute_bulk(self):
+        self._init_tool(tools_support.SIMPLE_CAT_TOOL_CONTENTS)
+        self.app.config.bulk_job_creation_threshold = 1
+        self.tool_action.supports_bulk_execution = True
+        hda = self.__add_dataset(1)
+        vars = self.__handle_with_incoming(param1=1)
+        self.__assert_executed(vars)
+        assert len(self.tool_action.execution_call_args) == 1
+        assert self.tool_action.execution_call_args[0]["incoming"]["param1"] == hda
+        assert self.tool_action.execution_call_args[0]["bulk"] is True
+
     def test_data_param_state_update(self):
         self._init_tool(tools_support.SIMPLE_CAT_TOOL_CONTENTS)
         hda = self.__add_dataset(1)
@@ -1,3 +1,4 @@
+import glob
 import os
 import subprocess
 
@@ -72,6 +73,55 @@ class TestMetadata(TestCase, tools_support.UsesTools):
         assert output_dataset.metadata.data_lines == 2
         assert output_dataset.metadata.sequences == 1
 
+    def test_multiple_outputs_threaded_extended(self):
+        self.app.config.metadata_strategy = "extended"
+        source_file_name = os.path.join(galaxy_directory(), "test/functional/tools/for_workflows/cat.xml")
+        self._init_tool_for_path(source_file_name)
+        output_datasets = {f"out_file{i}": self._create_output_dataset(extension="fasta") for i in range(1, 4)}
+        sa_session = self.app.model.session
+        with transaction(sa_session):
+            sa_session.commit()
+        command = self.metadata_command(output_datasets, metadata_threads=2)
+        for i, output_dataset in enumerate(output_datasets.values(), start=1):
+            self._write_output_dataset_contents(output_dataset, ">seq1\nGCTGCATG\n" * i)
+        self._write_job_files()
+        self.exec_metadata_command(command)
+        assert self.metadata_compute_strategy
+        for i, (name, output_dataset) in enumerate(output_datasets.items(), start=1):
+            metadata_set_successfully = self.metadata_compute_strategy.external_metadata_set_successfully(
+                output_dataset, name, sa_session, working_directory=self.job_working_directory
+            )
+            assert metadata_set_successfully
+            self.metadata_compute_strategy.load_metadata(
+                output_dataset, name, sa_session, working_directory=self.job_working_directory
+            )
+            assert output_dataset.metadata.data_lines == 2 * i
+            assert output_dataset.metadata.sequences == i
+
+    def test_metadata_cache_extended(self):
+        self.app.config.metadata_strategy = "extended"
+        source_file_name = os.path.join(galaxy_directory(), "test/functional/tools/for_workflows/cat.xml")
+        self._init_tool_for_path(source_file_name)
+        output_datasets = {f"out_file{i}": self._create_output_dataset(extension="fasta") for i in range(1, 3)}
+        sa_session = self.app.model.session
+        with transaction(sa_session):
+            sa_session.commit()
+        metadata_cache_dir = os.path.join(self.test_directory, "metadata_cache")
+        command = self.metadata_command(output_datasets, metadata_cache_dir=metadata_cache_dir)
+        for output_dataset in output_datasets.values():
+            self._write_output_dataset_contents(output_dataset, ">seq1\nGCTGCATG\n")
+        self._write_job_files()
+        self.exec_metadata_command(command)
+        assert self.metadata_compute_strategy
+        for name, output_dataset in output_datasets.items():
+            self.metadata_compute_strategy.load_metadata(
+                output_dataset, name, sa_session, working_directory=self.job_working_directory
+            )
+            assert output_dataset.metadata.data_lines == 2
+            assert output_dataset.metadata.sequences == 1
+        # identical content, the second output reused the entry of the first one
+        assert len(glob.glob(os.path.join(metadata_cache_dir, "*", "*", "metadata.json"))) == 1
+
     def test_primary_dataset_output_extension_directory(self):
         self.app.config.metadata_strategy = "directory"
         self._test_primary_dataset_output_extension()
@@ -204,7 +254,7 @@ class TestMetadata(TestCase, tools_support.UsesTools):
         with open(os.path.join(self.job_working_directory, "tool_stderr"), "w") as f:
             f.write(stderr)
 
-    def metadata_command(self, output_datasets, output_collections=None):
+    def metadata_command(self, output_datasets, output_collections=None, metadata_threads=1, metadata_cache_dir=None):
         output_collections = output_collections or {}
         metadata_compute_strategy = get_metadata_compute_strategy(self.app.config, self.job.id)
         self.metadata_compute_strategy = metadata_compute_strategy
@@ -234,6 +284,8 @@ class TestMetadata(TestCase, tools_support.UsesTools):
             job=self.job,
             object_store_conf=self.app.object_store.to_dict(),
             max_metadata_value_size=10000,
+            metadata_threads=metadata_threads,
+            metadata_cache_dir=metadata_cache_dir,
         )
         return command
 
@@ -53,6 +53,23 @@ class TestSelectToolParameter(BaseParameterTestCase):
         assert ("testname2", "testpath2", False) in self.param.get_options(self.trans, {"input_bam": "testpath2"})
         assert len(self.param.get_options(self.trans, {"input_bam": "testpath3"})) == 0
 
+    def test_filtered_options_cached(self):
+        self.options_xml = """<options from_data_table="test_table"><filter type="param_value" ref="input_bam" column="0" /><filter type="sort_by" column="1" /></options>"""
+        table = self.app.tool_data_tables["test_table"]
+        assert self.param.get_options(self.trans, {"input_bam": "testname1"}) == [("testname1", "testpath1", False)]
+        assert self.param.get_options(self.trans, {"input_bam": "testname1"}) == [("testname1", "testpath1", False)]
+        assert table.get_fields_calls == 1
+        assert self.param.get_options(self.trans, {"input_bam": "testname2"}) == [("testname2", "testpath2", False)]
+        assert table.get_fields_calls == 2
+        # changing the table contents invalidates the cached options
+        table.fields.append(["testname1", "testpath3"])
+        table.version += 1
+        assert self.param.get_options(self.trans, {"input_bam": "testname1"}) == [
+            ("testname1", "testpath1", False),
+            ("testname1", "testpath3", False),
+        ]
+        assert table.get_fields_calls == 3
+
     # TODO: Good deal of overlap here with TestDataToolParameter, refactor.
     def setUp(self):
         super().setUp()
@@ -104,5 +121,13 @@ class MockToolDataTable:
         )
         self.missing_index_file = None
 
+        self.fields = [["testname1", "testpath1"], ["testname2", "testpath2"]]
+        self.version = 1
+        self.get_fields_calls = 0
+
     def get_fields(self):
-        return [["testname1", "testpath1"], ["testname2", "testpath2"]]
+        self.get_fields_calls += 1
+        return self.fields.copy()
+
+    def get_content_version(self):
+        return (self.version, len(self.fields))
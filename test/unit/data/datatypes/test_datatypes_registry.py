@@ -1,3 +1,5 @@
+import os
+
 from galaxy.datatypes import sniff
 from galaxy.datatypes.registry import example_datatype_registry_for_sample
 
@@ -114,3 +116,38 @@ def test_sniff_compressed_dynamic_datatypes_default_off():
     assert "fastq" not in sniff.guess_ext(fname, sniff_order)
     fname = sniff.get_test_fname("1.fastqsanger.bz2")
     assert "fastq" not in sniff.guess_ext(fname, sniff_order)
+
+
+def test_sniffer_index_matches_sniff_order():
+    datatypes_registry = example_datatype_registry_for_sample()
+    sniffer_index = datatypes_registry.sniffer_index
+    assert datatypes_registry.sniffer_index is sniffer_index
+    test_data = os.path.dirname(sniff.get_test_fname("1.bed"))
+    for fname in sorted(os.listdir(test_data)):
+        path = os.path.join(test_data, fname)
+        if not os.path.isfile(path):
+            continue
+        file_prefix = sniff.FilePrefix(path)
+        expected_ext = sniff.guess_ext(file_prefix, datatypes_registry.sniff_order)
+        assert sniff.guess_ext(file_prefix, sniffer_index) == expected_ext, fname
+    # index is rebuilt when the sniff order changes
+    datatypes_registry.sniff_order.pop()
+    assert datatypes_registry.sniffer_index is not sniffer_index
+
+
+def test_sniffer_index_skips_sniffers_by_leading_bytes():
+    datatypes_registry = example_datatype_registry_for_sample()
+    sniffer_index = datatypes_registry.sniffer_index
+
+    def candidate_exts(fname):
+        return {
+            datatype.file_ext for datatype in sniffer_index.candidates(sniff.FilePrefix(sniff.get_test_fname(fname)))
+        }
+
+    bed_candidates = candidate_exts("1.bed")
+    assert "bed" in bed_candidates
+    assert not bed_candidates & {"fastq", "fastqsanger", "json", "geojson", "xml", "vcf", "genbank"}
+    fastq_candidates = candidate_exts("1.fastqsanger")
+    assert {"fastq", "fastqsanger"} <= fastq_candidates
+    assert not fastq_candidates & {"json", "xml"}
+    assert {"json", "geojson"} <= candidate_exts("1.json")
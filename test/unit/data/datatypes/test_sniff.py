@@ -1,3 +1,5 @@
+import gzip
+import os
 import tempfile
 
 import pytest
@@ -7,7 +9,10 @@ from galaxy.datatypes.sniff import (
     convert_newlines,
     convert_newlines_sep2tabs,
     convert_sep2tabs,
+    FilePrefix,
     get_test_fname,
+    SNIFF_INITIAL_BYTES,
+    SNIFF_PREFIX_BYTES,
 )
 
 
@@ -109,3 +114,55 @@ def test_infer_from_filename():
     assert datatypes_registry.get_datatype_from_filename("mycool.fq").file_ext == "fastqsanger"
     assert datatypes_registry.get_datatype_from_filename("mycool.fq.gz").file_ext == "fastqsanger.gz"
     assert datatypes_registry.get_datatype_from_filename("mycool.fastq").file_ext == "fastqsanger"
+
+
+def test_file_prefix_reads_lazily(tmp_path):
+    binary_path = tmp_path / "binary.dat"
+    binary_path.write_bytes(b"\x93NUMPY\x00" + b"\x01" * SNIFF_PREFIX_BYTES)
+    file_prefix = FilePrefix(str(binary_path))
+    assert file_prefix.startswith_bytes(b"\x93NUMPY")
+    assert file_prefix.binary
+    # neither check needed more than the initially read bytes
+    assert len(file_prefix._header_bytes) == SNIFF_INITIAL_BYTES
+    assert file_prefix.truncated
+    assert len(file_prefix.contents_header_bytes) == SNIFF_PREFIX_BYTES
+
+    text_path = tmp_path / "text.txt"
+    text_path.write_text("1\t2\n3\t4\n")
+    file_prefix = FilePrefix(str(text_path))
+    assert not file_prefix.binary
+    assert not file_prefix.truncated
+    assert file_prefix.contents_header == "1\t2\n3\t4\n"
+    assert file_prefix.non_utf8_error is None
+    assert file_prefix.compressed_format is None
+
+
+def test_file_prefix_extends_from_open_file(tmp_path):
+    compressed_path = tmp_path / "text.txt.gz"
+    content = b"".join(b"line %d\n" % i for i in range(SNIFF_PREFIX_BYTES // 4))
+    with gzip.open(compressed_path, "wb") as f:
+        f.write(content)
+    file_prefix = FilePrefix(str(compressed_path))
+    assert file_prefix.compressed_format == "gzip"
+    initial_bytes = file_prefix._header_bytes
+    assert initial_bytes == content[:SNIFF_INITIAL_BYTES]
+    # the file is decompressed in place while sniffing, the prefix is still read from the original file
+    uncompressed_path = tmp_path / "text.txt"
+    uncompressed_path.write_bytes(content)
+    os.replace(uncompressed_path, compressed_path)
+    assert file_prefix.contents_header_bytes == content[:SNIFF_PREFIX_BYTES]
+    assert file_prefix.compressed_format == "gzip"
+    assert file_prefix._fileobj is None
+
+
+def test_file_prefix_close(tmp_path):
+    compressed_path = tmp_path / "text.txt.gz"
+    content = b"".join(b"line %d\n" % i for i in range(SNIFF_PREFIX_BYTES // 4))
+    with gzip.open(compressed_path, "wb") as f:
+        f.write(content)
+    with FilePrefix(str(compressed_path)) as file_prefix:
+        assert file_prefix._fileobj is not None
+    assert file_prefix._fileobj is None
+    # reading more of the prefix after closing reopens the file where the prefix ended
+    assert file_prefix.contents_header_bytes == content[:SNIFF_PREFIX_BYTES]
+    assert file_prefix._fileobj is None
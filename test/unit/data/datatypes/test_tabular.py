@@ -1,10 +1,14 @@
 import tempfile
 
+from galaxy.datatypes import tabular
 from galaxy.datatypes.tabular import (
     MAX_DATA_LINES,
     Tabular,
 )
-from .util import MockDataset
+from .util import (
+    MockDataset,
+    MockDatasetDataset,
+)
 
 
 def test_tabular_set_meta_large_file():
@@ -112,3 +116,32 @@ def test_tabular_column_types_override():
         assert dataset.metadata.columns == 6
         assert dataset.metadata.delimiter == "\t"
         assert not hasattr(dataset.metadata, "column_names")
+
+
+def test_tabular_set_meta_read_size(monkeypatch):
+    """
+    check that metadata does not depend on where the file is split into chunks
+    """
+    lines = ["col1\tcol2\tcol3", "# comment", "1\t2.5\ta", "", "2\tna\t1,2", "3\t4\t5\textra"]
+    with tempfile.NamedTemporaryFile(mode="w") as test_file:
+        test_file.write("\r\n".join(lines) + "\n")
+        test_file.flush()
+        for read_size in (1, 3, 16, tabular.SET_META_READ_SIZE):
+            monkeypatch.setattr(tabular, "SET_META_READ_SIZE", read_size)
+            dataset = MockDataset(id=1)
+            dataset.set_file_name(test_file.name)
+            Tabular().set_meta(dataset)  # type: ignore [arg-type]
+            assert dataset.metadata.data_lines == 4
+            assert dataset.metadata.comment_lines == 2
+            assert dataset.metadata.column_types == ["int", "float", "str", "str"]
+            # the whole file has been read when reaching max_data_lines
+            dataset = MockDataset(id=1)
+            dataset.set_file_name(test_file.name)
+            dataset.dataset = MockDatasetDataset(test_file.name)  # type: ignore [assignment]
+            Tabular().set_meta(dataset, max_data_lines=4)  # type: ignore [arg-type]
+            assert dataset.metadata.data_lines == 4
+            assert dataset.metadata.comment_lines == 2
+            Tabular().set_meta(dataset, max_data_lines=3)  # type: ignore [arg-type]
+            assert dataset.metadata.data_lines is None
+            assert dataset.metadata.comment_lines is None
+            assert dataset.metadata.column_types == ["int", "float", "str"]
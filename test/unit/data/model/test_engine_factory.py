@@ -1,4 +1,11 @@
-from galaxy.model.orm.engine_factory import set_sqlite_connect_args
+from sqlalchemy import text
+
+from galaxy.model.orm.engine_factory import (
+    build_engine,
+    fingerprint_statement,
+    QueryFingerprintStats,
+    set_sqlite_connect_args,
+)
 
 SQLITE_URL = "sqlite://foo.db"
 NON_SQLITE_URL = "foo://foo.db"
@@ -32,3 +39,43 @@ class TestSetSqliteConnectArgs:
         assert len(engine_options["connect_args"]) == 2
         assert engine_options["connect_args"]["check_same_thread"] is False  # type:ignore[index]
         assert engine_options["connect_args"]["bar"] == "some bar"  # type:ignore[index]
+
+
+class TestQueryFingerprints:
+    def test_fingerprint_statement(self):
+        assert fingerprint_statement("SELECT job.id FROM job WHERE job.id = %(pk_1)s") == fingerprint_statement(
+            "SELECT job.id FROM job WHERE job.id = %(pk_2)s"
+        )
+        assert fingerprint_statement("SELECT * FROM t WHERE t.id IN (?, ?,\n ?) AND t.name = 'a''b'") == (
+            "SELECT * FROM t WHERE t.id IN (...) AND t.name = ?"
+        )
+        assert fingerprint_statement("SELECT t.x::JSONB FROM t WHERE t.y = :y_1 LIMIT 10") == (
+            "SELECT t.x::JSONB FROM t WHERE t.y = ? LIMIT ?"
+        )
+
+    def test_repeated_queries(self):
+        engine = build_engine("sqlite:///:memory:", record_query_fingerprints=True)
+        stats = QueryFingerprintStats(repeat_threshold=2)
+        for _ in range(2):
+            with stats.scope("test.scope"), engine.connect() as conn:
+                for i in range(3):
+                    conn.execute(text("SELECT :value"), {"value": i})
+                conn.execute(text("SELECT 1, 2"))
+        # not recorded outside of a scope
+        with engine.connect() as conn:
+            conn.execute(text("SELECT :value"), {"value": 1})
+        summary = {stat["fingerprint"]: stat for stat in stats.summary()}
+        repeated = summary["SELECT ?"]
+        assert repeated["scope"] == "test.scope"
+        assert repeated["scopes"] == 2
+        assert repeated["count"] == 6
+        assert repeated["max_count"] == 3
+        assert repeated["repeated"] == 2
+        assert summary["SELECT ?, ?"]["repeated"] == 0
+
+    def test_disabled(self):
+        engine = build_engine("sqlite:///:memory:", record_query_fingerprints=True)
+        stats = QueryFingerprintStats()
+        with stats.scope("test.scope"), engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        assert stats.summary() == []
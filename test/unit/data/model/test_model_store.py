@@ -59,6 +59,32 @@ def test_import_export_history():
     _assert_simple_cat_job_imported(imported_history)
 
 
+def test_import_export_history_stream_files():
+    """Test a simple job import/export with dataset files read into the archive directly."""
+    app = _mock_app()
+
+    u, h, d1, d2, j = _setup_simple_cat_job(app)
+
+    imported_history = _import_export_history(app, h, export_files="stream")
+
+    _assert_simple_cat_job_imported(imported_history)
+
+
+def test_import_export_history_zip():
+    """Test a simple job import/export using a zip archive written with parallel reads."""
+    app = _mock_app()
+
+    u, h, d1, d2, j = _setup_simple_cat_job(app)
+
+    dest_export = os.path.join(mkdtemp(), "moo.zip")
+    with store.ZipModelExportStore(dest_export, app=app, export_files="stream", parallel_reads=4) as export_store:
+        export_store.export_history(h)
+
+    imported_history = import_archive(dest_export, app, u)
+    assert imported_history
+    _assert_simple_cat_job_imported(imported_history)
+
+
 def test_import_export_history_failed_job():
     """Test a simple job import/export, make sure state is maintained correctly."""
     app = _mock_app()
@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    mapped_column,
+    sessionmaker,
+)
+
+from galaxy.model.read_replica import (
+    ReadReplica,
+    track_writes,
+)
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+@pytest.fixture
+def primary():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    track_writes(session_factory)
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def replica():
+    return ReadReplica(create_engine("sqlite://"))
+
+
+def test_reads_from_replica(primary, replica):
+    with replica.session(primary) as session:
+        assert session is not primary
+        assert session.get_bind() is replica.engine
+
+
+def test_reads_own_writes_from_primary(primary, replica):
+    primary.add(Item())
+    with replica.session(primary) as session:
+        assert session is primary
+    primary.commit()
+    # still pinned to the primary after the changes have been flushed
+    with replica.session(primary) as session:
+        assert session is primary
+
+
+def test_falls_back_to_primary_if_replica_lags(primary, replica, monkeypatch):
+    monkeypatch.setattr(replica, "_check_lag", lambda: replica.max_lag + 1)
+    with replica.session(primary) as session:
+        assert session is primary
+    monkeypatch.setattr(replica, "_check_lag", lambda: None)
+    replica._lag_checked_at = 0
+    with replica.session(primary) as session:
+        assert session is primary
@@ -1,4 +1,5 @@
 import uuid
+from unittest import mock
 
 from galaxy import model
 from galaxy.objectstore import (
@@ -340,6 +341,95 @@ class TestCalculateUsage(BaseModelTestCase):
         self._refresh_user_and_assert_disk_usage_is(25, "alt_source")
         self._refresh_user_and_assert_disk_usage_is(0, None)
 
+    def test_reconcile_usage(self):
+        u = self.u
+
+        self._add_dataset(10)
+        self._add_dataset(15, "alt_source_store")
+
+        quota_source_map = QuotaSourceMap()
+        alt_source = QuotaSourceMap()
+        alt_source.default_quota_source = "alt_source"
+        quota_source_map.backends["alt_source_store"] = alt_source
+        object_store = MockObjectStore(quota_source_map)
+
+        u.adjust_total_disk_usage(3, None)
+        u.adjust_total_disk_usage(20, "alt_source")
+        u.adjust_total_disk_usage(5, "unused_source")
+        self.persist(u)
+
+        expected_drift = {None: -7, "alt_source": 5, "unused_source": 5}
+        assert u.reconcile_disk_usage(object_store, dry_run=True) == expected_drift
+        self._refresh_user_and_assert_disk_usage_is(3)
+        self._refresh_user_and_assert_disk_usage_is(20, "alt_source")
+
+        assert u.reconcile_disk_usage(object_store) == expected_drift
+        self._refresh_user_and_assert_disk_usage_is(10)
+        self._refresh_user_and_assert_disk_usage_is(15, "alt_source")
+        assert [usage.quota_source_label for usage in u.dictify_usage()] == [None, "alt_source"]
+        assert u.reconcile_disk_usage(object_store) == {}
+
+    def test_reconcile_usage_keeps_concurrent_adjustments(self):
+        u = self.u
+        self._add_dataset(10)
+        u.adjust_total_disk_usage(5, None)
+        self.persist(u)
+        object_store = MockObjectStore()
+        calculate = model.calculate_disk_usage_per_quota_source
+
+        def calculate_then_finish_job(*args, **kwargs):
+            usage = calculate(*args, **kwargs)
+            # a job finishes while the drift is being determined
+            self._add_dataset(7)
+            u.adjust_total_disk_usage(7, None)
+            self.persist(u)
+            return usage
+
+        with mock.patch.object(model, "calculate_disk_usage_per_quota_source", calculate_then_finish_job):
+            assert u.reconcile_disk_usage(object_store) == {None: 2}
+        self._refresh_user_and_assert_disk_usage_is(17)
+
+    def test_copy_from_other_user_adds_usage(self):
+        model = self.model
+        d = self._add_dataset(10)
+        other_user = model.User(email=f"copy_usage{uuid.uuid1()}@example.com", password="password")
+        other_history = model.History(name="History for copies", user=other_user)
+        self.persist(other_user, other_history)
+
+        other_history.stage_addition(d.copy(flush=False))
+        other_history.add_pending_items()
+        self.persist(other_history)
+        self.model.context.refresh(other_user)
+        assert other_user.disk_usage == 10
+
+        # copying a dataset the user already has doesn't add to their usage
+        other_history.stage_addition(d.copy(flush=False))
+        other_history.add_pending_items()
+        self.persist(other_history)
+        self.model.context.refresh(other_user)
+        assert other_user.disk_usage == 10
+
+        # neither do copies of the user's own datasets
+        self.h.stage_addition(d.copy(flush=False))
+        self.h.add_pending_items()
+        self.persist(self.h)
+        self.model.context.refresh(self.u)
+        assert not self.u.disk_usage
+
+    def test_copies_of_same_dataset_in_one_batch_add_usage_once(self):
+        model = self.model
+        d = self._add_dataset(10)
+        other_user = model.User(email=f"copy_usage{uuid.uuid1()}@example.com", password="password")
+        other_history = model.History(name="History for copies", user=other_user)
+        self.persist(other_user, other_history)
+
+        other_history.stage_addition(d.copy(flush=False))
+        other_history.stage_addition(d.copy(flush=False))
+        other_history.add_pending_items()
+        self.persist(other_history)
+        self.model.context.refresh(other_user)
+        assert other_user.disk_usage == 10
+
     def _refresh_user_and_assert_disk_usage_is(self, usage, label=None):
         u = self.u
         self.model.context.refresh(u)
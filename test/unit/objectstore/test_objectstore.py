@@ -1,12 +1,19 @@
 import os
 import shutil
+import socket
+import subprocess
+import threading
 import time
 from functools import wraps
+from io import BytesIO
 from tempfile import (
     mkdtemp,
     mkstemp,
 )
-from unittest.mock import patch
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
 from uuid import uuid4
 
 import pytest
@@ -16,6 +23,7 @@ from galaxy.exceptions import ObjectInvalid
 from galaxy.objectstore import persist_extra_files_for_dataset
 from galaxy.objectstore.azure_blob import AzureBlobObjectStore
 from galaxy.objectstore.caching import (
+    CacheIndex,
     CacheTarget,
     check_cache,
     InProcessCacheMonitor,
@@ -35,6 +43,7 @@ from galaxy.util import (
     directory_hash_id,
     unlink,
 )
+from galaxy.util.filelock import FileLock
 from galaxy.util.unittest_utils import skip_unless_environ
 
 
@@ -691,6 +700,151 @@ def test_config_parse_boto3():
             assert len(extra_dirs) == 2
 
 
+@patch_object_stores_to_skip_initialize
+def test_boto3_ranged_read():
+    with TestConfig(get_example("boto3_simple.yml")) as (directory, object_store):
+        object_store.staging_path = directory.temp_directory
+        object_store.ranged_read_max_size = 1024
+        client = MagicMock()
+        client.get_object.return_value = {"Body": BytesIO(b"ello W")}
+        object_store._client = client
+        hello_world_dataset = MockDataset(3)
+        assert object_store.get_data(hello_world_dataset, start=1, count=6) == "ello W"
+        assert client.get_object.call_args.kwargs["Range"] == "bytes=1-6"
+        # read is served without pulling the object into the cache
+        assert not client.download_file.called
+        assert not object_store._in_cache(object_store._construct_path(hello_world_dataset))
+
+
+@patch_object_stores_to_skip_initialize
+def test_boto3_concurrent_downloads_coalesced():
+    with TestConfig(get_example("boto3_simple.yml")) as (directory, object_store):
+        object_store.staging_path = directory.temp_directory
+        downloads = []
+
+        def download_file(bucket, key, destination, Config=None):
+            downloads.append(key)
+            time.sleep(0.5)
+            with open(destination, "w") as f:
+                f.write("Hello World!")
+
+        client = MagicMock()
+        client.head_object.return_value = {"ContentLength": 12}
+        client.download_file.side_effect = download_file
+        object_store._client = client
+        hello_world_dataset = MockDataset(3)
+        object_store.prefetch(hello_world_dataset)
+        paths = []
+        threads = [
+            threading.Thread(target=lambda: paths.append(object_store.get_filename(hello_world_dataset)))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(downloads) == 1
+        assert len(paths) == 3
+        for path in paths:
+            assert open(path).read() == "Hello World!"
+        assert not os.path.exists(f"{paths[0]}.galaxy_download.lock")
+
+
+@patch_object_stores_to_skip_initialize
+def test_boto3_interrupted_download_not_cached():
+    with TestConfig(get_example("boto3_simple.yml")) as (directory, object_store):
+        object_store.staging_path = directory.temp_directory
+
+        def interrupted_download(bucket, key, destination, Config=None):
+            with open(destination, "w") as f:
+                f.write("Hello")
+            raise Exception("Connection reset")
+
+        client = MagicMock()
+        client.head_object.return_value = {"ContentLength": 12}
+        client.download_file.side_effect = interrupted_download
+        object_store._client = client
+        hello_world_dataset = MockDataset(3)
+        with pytest.raises(Exception, match="Connection reset"):
+            object_store.get_filename(hello_world_dataset)
+        cache_path = object_store._construct_path(hello_world_dataset, in_cache=True)
+        # neither the partial download nor the lock are left behind
+        assert os.listdir(os.path.dirname(cache_path)) == []
+
+
+@patch_object_stores_to_skip_initialize
+def test_boto3_stale_download_lock_broken():
+    with TestConfig(get_example("boto3_simple.yml")) as (directory, object_store):
+        object_store.staging_path = directory.temp_directory
+        object_store.download_lock_timeout = 3600
+
+        def download_file(bucket, key, destination, Config=None):
+            with open(destination, "w") as f:
+                f.write("Hello World!")
+
+        client = MagicMock()
+        client.head_object.return_value = {"ContentLength": 12}
+        client.download_file.side_effect = download_file
+        object_store._client = client
+        hello_world_dataset = MockDataset(3)
+        cache_path = object_store._construct_path(hello_world_dataset, in_cache=True)
+        os.makedirs(os.path.dirname(cache_path))
+        # lock left behind by a process that has been killed
+        dead_process = subprocess.Popen(["true"])
+        dead_process.wait()
+        lock_path = f"{cache_path}.galaxy_download.lock"
+        with open(lock_path, "w") as f:
+            f.write(f"{socket.gethostname()} {dead_process.pid}")
+        start = time.time()
+        assert open(object_store.get_filename(hello_world_dataset)).read() == "Hello World!"
+        assert time.time() - start < 30
+        assert not os.path.exists(lock_path)
+        # a lock held by a live process on another host is only broken once it has timed out
+        with open(lock_path, "w") as f:
+            f.write(f"other-host {os.getpid()}")
+        lock_mtime = os.path.getmtime(lock_path)
+        assert not object_store._download_lock_is_stale(lock_mtime, f"other-host {os.getpid()}")
+        assert not object_store._download_lock_is_stale(lock_mtime, f"{socket.gethostname()} {os.getpid()}")
+        assert object_store._download_lock_is_stale(lock_mtime - 3601, f"other-host {os.getpid()}")
+        assert object_store._download_lock_is_stale(lock_mtime - 3601, "")
+        # a live process on this host keeps its lock for downloads taking longer than the timeout
+        assert not object_store._download_lock_is_stale(lock_mtime - 3601, f"{socket.gethostname()} {os.getpid()}")
+
+
+def test_file_lock_release_keeps_recreated_lockfile(tmp_path):
+    lock = FileLock(str(tmp_path / "object"))
+    lock.acquire()
+    # broken and taken over by another process in the meantime
+    os.unlink(lock.lockfile)
+    with open(lock.lockfile, "w") as f:
+        f.write("other-host 1")
+    lock.release()
+    assert open(lock.lockfile).read() == "other-host 1"
+
+
+@patch_object_stores_to_skip_initialize
+def test_boto3_cache_cleaning_skips_downloads_in_progress():
+    with TestConfig(get_example("boto3_simple.yml")) as (directory, object_store):
+        object_store.staging_path = directory.temp_directory
+        tiny_cache_target = CacheTarget(object_store.staging_path, 1, 1 / (1024 * 1024 * 1024))
+
+        def download_file(bucket, key, destination, Config=None):
+            with open(destination, "w") as f:
+                f.write("Hello World!")
+            check_cache(tiny_cache_target)
+            assert os.path.exists(destination)
+            index = CacheIndex(object_store.staging_path)
+            index.add_directory(object_store.staging_path)
+            assert index.total_size == 0
+
+        client = MagicMock()
+        client.head_object.return_value = {"ContentLength": 12}
+        client.download_file.side_effect = download_file
+        object_store._client = client
+        hello_world_dataset = MockDataset(3)
+        assert open(object_store.get_filename(hello_world_dataset)).read() == "Hello World!"
+
+
 @patch_object_stores_to_skip_initialize
 def test_config_parse_boto3_custom_connection():
     for config_str in [get_example("boto3_custom_connection.xml"), get_example("boto3_custom_connection.yml")]:
@@ -966,6 +1120,68 @@ def test_check_cache_sanity(tmp_path):
     assert not path.exists()
 
 
+def test_check_cache_with_index(tmp_path):
+    cache_dir = tmp_path
+    (cache_dir / "000").mkdir()
+    old_path = cache_dir / "000" / "dataset_1.dat"
+    old_path.write_text("this is an old example file")
+    new_path = cache_dir / "000" / "dataset_2.dat"
+    new_path.write_text("this is a new example file")
+    index = CacheIndex(str(cache_dir))
+    # index starts out empty, first monitor step reconciles it with the cache contents
+    assert index.total_size == 0
+    big_cache_target = CacheTarget(str(cache_dir), 1, 0.2, use_index=True)
+    check_cache(big_cache_target)
+    assert index.total_size == old_path.stat().st_size + new_path.stat().st_size
+    index.touch(str(old_path))
+    # evicts the least recently used file only, the monitor writes out buffered accesses first
+    small_cache_target = CacheTarget(str(cache_dir), 1, 40 / (1024 * 1024 * 1024), use_index=True)
+    check_cache(small_cache_target, index)
+    assert old_path.exists()
+    assert not new_path.exists()
+    assert index.total_size == old_path.stat().st_size
+    index.remove_directory(str(cache_dir / "000"))
+    assert index.total_size == 0
+    index.add_directory(str(cache_dir))
+    assert index.total_size == old_path.stat().st_size
+    reset_cache(small_cache_target)
+    assert not old_path.exists()
+    assert index.total_size == 0
+
+
+def test_cache_index_buffers_touches(tmp_path):
+    cache_dir = tmp_path
+    path = cache_dir / "dataset_1.dat"
+    path.write_text("this is an example file")
+    index = CacheIndex(str(cache_dir))
+    index.add(str(path))
+    [(_, added_access)] = _index_entries(index)
+    index.touch(str(path))
+    # not written until flushed
+    assert _index_entries(index) == [(str(path), added_access)]
+    index.flush_touches()
+    [(_, touched_access)] = _index_entries(index)
+    assert touched_access > added_access
+    # untracked files are added on flush, files evicted in the meantime are skipped
+    other_path = cache_dir / "dataset_2.dat"
+    other_path.write_text("this is another example file")
+    evicted_path = cache_dir / "dataset_3.dat"
+    index.touch(str(other_path))
+    index.touch(str(evicted_path))
+    index.flush_touches()
+    assert index.total_size == path.stat().st_size + other_path.stat().st_size
+    # touches older than the flush interval are written out by the next touch
+    index = CacheIndex(str(cache_dir), touch_flush_interval=0)
+    index.touch(str(path))
+    assert _index_entries(index)[-1][0] == str(path)
+
+
+def _index_entries(index):
+    with index._transaction(write=False) as conn:
+        rows = conn.execute("SELECT path, last_access FROM cache_entry ORDER BY last_access").fetchall()
+    return [(os.path.join(index.cache_path, path), last_access) for path, last_access in rows]
+
+
 def test_fits_in_cache_check(tmp_path):
     cache_dir = tmp_path
     big_cache_target = CacheTarget(cache_dir, 1, 0.2)
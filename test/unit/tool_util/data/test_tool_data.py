@@ -51,6 +51,29 @@ def test_reload_by_name(tdt_manager, tmp_path):
     assert len(tdt_manager["testalpha"].data) == 3
 
 
+def test_get_entries(tdt_manager, tmp_path):
+    table = tdt_manager["testalpha"]
+    assert table.get_entry("value", "data1", "name") == "data1name"
+    assert table.get_entry("value", "data3", "name") is None
+    assert table.get_entries("name", "data2name", None) == [
+        {"value": "data2", "name": "data2name", "path": f"{tmp_path}/data2/entry.txt"}
+    ]
+    assert table.get_field("data2").get_base_path() == f"{tmp_path}/data2/entry.txt"
+
+
+def test_get_entries_after_update(tdt_manager, tmp_path):
+    table = tdt_manager["testalpha"]
+    assert table.get_entries("value", "data3", "name") == []
+    table.add_entry(["data3", "data3name", "data3path"])
+    table.add_entry(["data3", "data3name_2", "data3path"])
+    assert table.get_entries("value", "data3", "name") == ["data3name", "data3name_2"]
+    assert table.get_entries("value", "data3", "name", limit=1) == ["data3name"]
+    loc1 = tmp_path / "testalpha.loc"
+    loc1.write_text(LOC_ALPHA_CONTENTS_V2)
+    tdt_manager.reload_tables("testalpha")
+    assert table.get_entries("value", "data3", "name") == ["data3name"]
+
+
 def test_merging_tables(merged_tdt_manager):
     assert len(merged_tdt_manager["testbeta"].data) == 2
 
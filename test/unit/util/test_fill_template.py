@@ -3,7 +3,10 @@ import sys
 import pytest
 from Cheetah.NameMapper import NotFound
 
-from galaxy.util.template import fill_template
+from galaxy.util.template import (
+    compile_template,
+    fill_template,
+)
 
 # In Python 3.12 calling `locals()`` inside a comprehension now includes
 # variables from outside the comprehension, see
@@ -99,3 +102,20 @@ def test_fix_template_two_to_three():
 def test_fix_template_invalid_cheetah():
     template_str = fill_template(INVALID_CHEETAH_SYNTAX, python_template_version="2", retry=1)
     assert template_str == "1 is 1\n"
+
+
+def test_compiled_template_cache():
+    template = "echo $cache_test_value"
+    hits = compile_template.cache_info().hits
+    assert fill_template(template, context={"cache_test_value": 1}) == "echo 1"
+    assert fill_template(template, context={"cache_test_value": 2}) == "echo 2"
+    assert compile_template.cache_info().hits == hits + 1
+
+
+def test_fix_template_two_to_three_cached():
+    fill_template(TWO_TO_THREE_TEMPLATE, python_template_version="2", retry=1)
+    hits = compile_template.cache_info().hits
+    template_str = fill_template(TWO_TO_THREE_TEMPLATE, python_template_version="2", retry=1)
+    assert template_str == "a a 1"
+    # the original and the futurized template are both compiled from cache
+    assert compile_template.cache_info().hits == hits + 2
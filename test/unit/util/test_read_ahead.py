@@ -0,0 +1,45 @@
+"""Unit module for galaxy.util.read_ahead."""
+
+import os
+
+import pytest
+
+from galaxy.util.read_ahead import read_ahead
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for i in range(10):
+        path = os.path.join(tmp_path, f"file_{i}")
+        with open(path, "wb") as fh:
+            fh.write(os.urandom(i * 1000))
+        paths.append(path)
+    return paths
+
+
+def _contents(path):
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+@pytest.mark.parametrize("parallel_reads", [1, 3])
+def test_read_ahead(files, parallel_reads):
+    read = [(path, b"".join(chunks)) for path, chunks in read_ahead(files, parallel_reads, chunk_size=256)]
+    assert read == [(path, _contents(path)) for path in files]
+
+
+def test_read_ahead_skip_chunks(files):
+    # not consuming the chunks of a file doesn't block reading the next files
+    read = [path for path, _ in read_ahead(files, parallel_reads=2, chunk_size=256, buffered_chunks=1)]
+    assert read == files
+
+
+def test_read_ahead_missing_file(files):
+    contents = read_ahead([*files[:2], "/does/not/exist"], parallel_reads=2)
+    for _ in range(2):
+        next(contents)
+    path, chunks = next(contents)
+    with pytest.raises(FileNotFoundError):
+        b"".join(chunks)
+    contents.close()
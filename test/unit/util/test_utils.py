@@ -139,3 +139,15 @@ def test_enum_values():
         B = "b"
 
     assert util.enum_values(Stuff) == ["a", "c", "b"]
+
+
+def test_structured_execution_timer_phases():
+    timer = util.StructuredExecutionTimer("internals.test", "job ${job_id} finished")
+    timer.mark("first")
+    timer.mark("second")
+    timer.mark("first")
+    assert list(timer.phases) == ["first", "second"]
+    assert sum(timer.phases.values()) <= timer.elapsed
+    message = timer.to_str(job_id=1)
+    assert message.startswith("job 1 finished (")
+    assert "[first: " in message and ", second: " in message
@@ -0,0 +1,81 @@
+from galaxy.workflow.modules import DelayedWorkflowEvaluation
+from galaxy.workflow.run import InvocationBlockers
+from galaxy.workflow.scheduling_manager import (
+    InvocationDependencyTracker,
+    round_robin_histories,
+)
+
+
+def test_invocation_woken_by_any_dependency():
+    tracker = InvocationDependencyTracker()
+    assert tracker.track(1, job_ids=[10, 11])
+    assert tracker.track(2, job_ids=[11], dataset_ids=[20])
+    assert 1 in tracker and 2 in tracker
+    assert tracker.dependencies_finished(job_ids=[11]) == [1, 2]
+    assert len(tracker) == 0
+    assert not tracker.waiting_on_job
+    assert not tracker.waiting_on_dataset
+    # unknown jobs and datasets are ignored
+    assert tracker.dependencies_finished(job_ids=[10], dataset_ids=[20]) == []
+
+
+def test_dependency_finished_during_evaluation():
+    tracker = InvocationDependencyTracker()
+    tracker.dependencies_finished(dataset_ids=[21])
+    since = tracker.begin_evaluation()
+    other_since = tracker.begin_evaluation()
+    tracker.dependencies_finished(dataset_ids=[20])
+    tracker.end_evaluation(other_since)
+    tracker.retain([])
+    assert not tracker.track(1, dataset_ids=[20], since=since)
+    assert tracker.track(2, dataset_ids=[21], since=since)
+    tracker.end_evaluation(since)
+    tracker.retain([2])
+    assert not tracker._finished_dataset_ids
+    assert tracker.track(1, dataset_ids=[20], since=tracker.begin_evaluation())
+
+
+def test_track_without_dependencies_and_retain():
+    tracker = InvocationDependencyTracker()
+    assert not tracker.track(1)
+    tracker.track(2, job_ids=[10])
+    tracker.track(3, job_ids=[10])
+    tracker.retain([3])
+    assert 2 not in tracker
+    assert tracker.waiting_on_job == {10: {3}}
+    tracker.discard(3)
+    assert not tracker.waiting_on_job
+
+
+def test_invocation_blockers():
+    blockers = InvocationBlockers()
+    assert not blockers.known
+    blockers.record(DelayedWorkflowEvaluation(job_ids=[1]))
+    blockers.record(DelayedWorkflowEvaluation(dataset_ids=[2]))
+    blockers.record(DelayedWorkflowEvaluation(transitive=True))
+    assert blockers.known
+    assert blockers.job_ids == {1}
+    assert blockers.dataset_ids == {2}
+    blockers.record(DelayedWorkflowEvaluation(why="Step is paused"))
+    assert not blockers.known
+
+
+def test_round_robin_histories():
+    invocations = [
+        # (invocation id, history id, user id)
+        (1, 10, 100),
+        (2, 10, 100),
+        (3, 11, 100),
+        (4, 12, 101),
+        (5, 13, None),
+        (6, 14, 101),
+        (7, 15, 100),
+    ]
+    assert round_robin_histories(invocations) == [
+        (10, [1, 2]),
+        (12, [4]),
+        (13, [5]),
+        (11, [3]),
+        (14, [6]),
+        (15, [7]),
+    ]